@@ -6,6 +6,13 @@ export const adminApi = {
         return response.data;
     },
 
+    // Revenue or signup trend: metric 'revenue' | 'signups', granularity 'hour' | 'day'
+    getDashboardTimeseries: async (metric = 'revenue', granularity = 'day') => {
+        const params = new URLSearchParams({ metric, granularity });
+        const response = await apiClient.get(`/admin/dashboard/timeseries?${params}`);
+        return response.data;
+    },
+
     getUsers: async () => {
         const response = await apiClient.get('/admin/users');
         return response.data;
@@ -13,12 +13,36 @@ export const adminCustomersApi = {
         return response.data;
     },
 
+    // Keyset-paginated customers; pass the previous page's nextCursor (null for the first page)
+    getCustomersPage: async ({ cursor = null, limit = 100, search = '' } = {}) => {
+        const params = new URLSearchParams();
+        params.append('limit', limit);
+        if (cursor) params.append('cursor', cursor);
+        if (search) params.append('search', search);
+        const response = await apiClient.get(`/admin/customers?${params.toString()}`);
+        return {
+            items: response.data,
+            total: Number(response.headers['x-total-count'] ?? response.data.length),
+            totalExact: response.headers['x-total-exact'] !== 'false',
+            nextCursor: response.headers['x-next-cursor'] || null,
+        };
+    },
+
     // Get customer detail with company and subscription info
     getCustomer: async (customerId) => {
         const response = await apiClient.get(`/admin/customers/${customerId}`);
         return response.data;
     },
 
+    // Company and subscription detail for many customers in one request
+    getCustomerDetails: async (customerIds) => {
+        if (!customerIds.length) return [];
+        const params = new URLSearchParams();
+        customerIds.forEach((id) => params.append('ids', id));
+        const response = await apiClient.get(`/admin/customers/details?${params.toString()}`);
+        return response.data;
+    },
+
     // Update customer
     updateCustomer: async (customerId, customerData) => {
         const response = await apiClient.put(`/admin/customers/${customerId}`, customerData);
@@ -2,8 +2,9 @@ import apiClient from '../client';
 
 export const adminProductsApi = {
   // Get all products (admin view - all customers)
-  getAllProducts: async (skip = 0, limit = 100) => {
-    const response = await apiClient.get(`/admin/company/products/?skip=${skip}&limit=${limit}`);
+  // Extra params: tenant_id, filters, sort, search, cursor
+  getAllProducts: async (skip = 0, limit = 100, params = {}) => {
+    const response = await apiClient.get('/admin/company/products/', { params: { skip, limit, ...params } });
     return response.data;
   },
 
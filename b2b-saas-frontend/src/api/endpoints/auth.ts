@@ -44,6 +44,14 @@ export const authApi = {
     return response.data;
   },
 
+  // Revokes the given access token on the server
+  logout: async (token: string): Promise<{ message: string }> => {
+    const response = await apiClient.post<{ message: string }>('/auth/logout', null, {
+      headers: { Authorization: `Bearer ${token}` },
+    });
+    return response.data;
+  },
+
   register: async (data: RegisterRequest): Promise<{ message: string }> => {
     const response = await apiClient.post<{ message: string }>('/auth/register', data);
     return response.data;
@@ -1,9 +1,11 @@
 import apiClient from '../../client';
 
 export const customerProductsApi = {
-    // Get my products
-    getMyProducts: async () => {
-        const response = await apiClient.get('/customer/company/products/');
+    // Get my products. Optional params: filters (category, stock_status,
+    // price__gte, ...), sort ('-price'), search, cursor, limit.
+    // The next page's cursor is in the X-Next-Cursor response header.
+    getMyProducts: async (params = {}) => {
+        const response = await apiClient.get('/customer/company/products/', { params });
         return response.data;
     },
 
@@ -30,4 +32,38 @@ export const customerProductsApi = {
         const response = await apiClient.delete(`/customer/company/products/${id}`);
         return response.data;
     },
+
+    // Create many products in one request; returns { items, errors }
+    bulkCreateProducts: async (items, atomic = false) => {
+        const response = await apiClient.post(`/customer/company/products/bulk?atomic=${atomic}`, { items });
+        return response.data;
+    },
+
+    // Partially update many products; each item carries its id
+    bulkUpdateProducts: async (items, atomic = false) => {
+        const response = await apiClient.patch(`/customer/company/products/bulk?atomic=${atomic}`, { items });
+        return response.data;
+    },
+
+    // Delete many products; returns { deleted_ids, errors }
+    bulkDeleteProducts: async (ids, atomic = false) => {
+        const response = await apiClient.post(`/customer/company/products/bulk/delete?atomic=${atomic}`, { ids });
+        return response.data;
+    },
+
+    // Upload a CSV/JSONL catalog file; returns the import job to poll
+    importProducts: async (file) => {
+        const formData = new FormData();
+        formData.append('file', file);
+        const response = await apiClient.post('/customer/company/imports/products', formData, {
+            headers: { 'Content-Type': 'multipart/form-data' },
+        });
+        return response.data;
+    },
+
+    // Import job progress: status, processed_rows, created_count, errors
+    getImportJob: async (jobId) => {
+        const response = await apiClient.get(`/customer/company/imports/${jobId}`);
+        return response.data;
+    },
 };
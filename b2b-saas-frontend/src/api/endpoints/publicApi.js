@@ -43,6 +43,12 @@ export const publicApi = {
         return response.data;
     },
 
+    // Get every landing page section in one request
+    getHome: async () => {
+        const response = await apiClient.get('/public/home');
+        return response.data;
+    },
+
     // ============ SEARCH & FILTER APIs ============
 
     // Advanced search
@@ -57,6 +63,7 @@ export const publicApi = {
         if (params.maxPrice) searchParams.append('max_price', params.maxPrice);
         if (params.skip) searchParams.append('skip', params.skip);
         if (params.limit) searchParams.append('limit', params.limit);
+        if (params.facets) searchParams.append('facets', true);
         const response = await apiClient.get(`/public/search?${searchParams}`);
         return response.data;
     },
@@ -42,8 +42,15 @@ export const subscriptionsApi = {
   // ============ CUSTOMER SUBSCRIPTIONS ============
   
   // Get all customer subscriptions
-  getCustomerSubscriptions: async (skip = 0, limit = 100) => {
-    const response = await apiClient.get(`/admin/subscriptions/customers?skip=${skip}&limit=${limit}`);
+  // filters: { status, planId, expiresAfter, expiresBefore, cursor }
+  getCustomerSubscriptions: async (skip = 0, limit = 100, filters = {}) => {
+    const params = new URLSearchParams({ skip, limit });
+    if (filters.status) params.append('status', filters.status);
+    if (filters.planId) params.append('plan_id', filters.planId);
+    if (filters.expiresAfter) params.append('expires_after', filters.expiresAfter);
+    if (filters.expiresBefore) params.append('expires_before', filters.expiresBefore);
+    if (filters.cursor) params.append('cursor', filters.cursor);
+    const response = await apiClient.get(`/admin/subscriptions/customers?${params}`);
     return response.data;
   },
 
@@ -89,6 +89,11 @@ export const AuthProvider = ({ children }: { children: ReactNode }) => {
   };
 
   const logout = () => {
+    // Best effort: the local session is cleared even if the server is unreachable
+    const token = localStorage.getItem('access_token');
+    if (token) {
+      authApi.logout(token).catch(() => {});
+    }
     localStorage.removeItem('access_token');
     localStorage.removeItem('user');
     setUser(null);
@@ -27,6 +27,13 @@ const CustomersManagement = () => {
     const [searchQuery, setSearchQuery] = useState('');
     const [currentPage, setCurrentPage] = useState(1);
     const [itemsPerPage] = useState(10);
+    // pageCursors[i] is the cursor that loads page i + 1
+    const [pageCursors, setPageCursors] = useState([null]);
+    const [nextCursor, setNextCursor] = useState(null);
+    const [totalCount, setTotalCount] = useState(null);
+    const [totalExact, setTotalExact] = useState(true);
+    // Customer id -> detail (company, subscription with plan) for the visible page
+    const [detailsById, setDetailsById] = useState({});
 
     useEffect(() => {
         fetchCustomers();
@@ -35,8 +42,17 @@ const CustomersManagement = () => {
     const fetchCustomers = async () => {
         try {
             setIsLoading(true);
-            const data = await adminCustomersApi.getCustomers(currentPage, itemsPerPage, searchQuery);
-            setCustomers(data);
+            const page = await adminCustomersApi.getCustomersPage({
+                cursor: pageCursors[currentPage - 1],
+                limit: itemsPerPage,
+                search: searchQuery,
+            });
+            setCustomers(page.items);
+            const details = await adminCustomersApi.getCustomerDetails(page.items.map((c) => c.id));
+            setDetailsById(Object.fromEntries(details.map((d) => [d.id, d])));
+            setNextCursor(page.nextCursor);
+            setTotalCount(page.total);
+            setTotalExact(page.totalExact);
         } catch (error) {
             toast.error('Failed to fetch customers');
             console.error('Error fetching customers:', error);
@@ -70,6 +86,7 @@ const CustomersManagement = () => {
 
     const handleSearch = (e) => {
         setSearchQuery(e.target.value);
+        setPageCursors([null]);
         setCurrentPage(1);
     };
 
@@ -126,6 +143,9 @@ const CustomersManagement = () => {
                                             <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">
                                                 Contact
                                             </th>
+                                            <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">
+                                                Company / Subscription
+                                            </th>
                                             <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">
                                                 Tenant ID
                                             </th>
@@ -165,6 +185,20 @@ const CustomersManagement = () => {
                                                         </div>
                                                     </div>
                                                 </td>
+                                                <td className="px-6 py-4">
+                                                    <div className="flex flex-col space-y-1">
+                                                        <div className="flex items-center text-sm text-gray-900">
+                                                            <Building2 className="w-4 h-4 mr-2 text-gray-400" />
+                                                            {customer.company_name || 'No company'}
+                                                        </div>
+                                                        <div className="flex items-center text-sm text-gray-500">
+                                                            <CreditCard className="w-4 h-4 mr-2 text-gray-400" />
+                                                            {detailsById[customer.id]?.subscription?.plan?.name
+                                                                ? `${detailsById[customer.id].subscription.plan.name} (${customer.subscription_status})`
+                                                                : customer.subscription_status || 'No subscription'}
+                                                        </div>
+                                                    </div>
+                                                </td>
                                                 <td className="px-6 py-4 whitespace-nowrap">
                                                     <span className="px-3 py-1 inline-flex text-xs leading-5 font-semibold rounded-full bg-blue-100 text-blue-800">
                                                         {customer.tenant_id || 'N/A'}
@@ -212,7 +246,7 @@ const CustomersManagement = () => {
                         {customers.length > 0 && (
                             <div className="px-6 py-4 border-t border-gray-200 flex items-center justify-between">
                                 <div className="text-sm text-gray-500">
-                                    Showing {customers.length} customers
+                                    Showing {customers.length} of {totalExact ? '' : '~'}{totalCount ?? customers.length} customers
                                 </div>
                                 <div className="flex items-center space-x-2">
                                     <button
@@ -226,8 +260,11 @@ const CustomersManagement = () => {
                                         Page {currentPage}
                                     </span>
                                     <button
-                                        onClick={() => setCurrentPage((prev) => prev + 1)}
-                                        disabled={customers.length < itemsPerPage}
+                                        onClick={() => {
+                                            setPageCursors((prev) => [...prev.slice(0, currentPage), nextCursor]);
+                                            setCurrentPage((prev) => prev + 1);
+                                        }}
+                                        disabled={!nextCursor}
                                         className="p-2 rounded-lg border border-gray-300 hover:bg-gray-50 disabled:opacity-50 disabled:cursor-not-allowed transition-colors"
                                     >
                                         <ChevronRight className="w-5 h-5" />
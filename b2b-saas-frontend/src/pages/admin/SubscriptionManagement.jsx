@@ -345,7 +345,7 @@ const SubscriptionManagement = () => {
                       {filteredSubscriptions.map((sub) => (
                         <tr key={sub.id} className="hover:bg-gray-50">
                           <td className="px-6 py-4 whitespace-nowrap">
-                            <div className="text-sm font-medium text-gray-900">#{sub.tenant_id}</div>
+                            <div className="text-sm font-medium text-gray-900">{sub.customer_name || sub.customer_email || `#${sub.tenant_id}`}</div>
                             <div className="text-xs text-gray-500">Sub ID: {sub.id}</div>
                           </td>
                           <td className="px-6 py-4">
@@ -8,6 +8,7 @@ from app.schemas.auth_schema import UserResponse
 from app.customer.models.customer_user_model import CustomerUser # Ensure mapper is registered
 
 from app.admin.models.admin_user_model import AdminUser # Ensure mapper is registered
+from app.auth.user_queries import query_users
 
 router = APIRouter(
     prefix="/admin/approvals",
@@ -33,32 +34,24 @@ def get_approvals(
     """
     List users by approval status.
     """
-    users = db.query(User).filter(
+    # Subclass columns load in the same statement, not once per user
+    users = query_users(db).filter(
         User.approval_status == status
-    ).offset(skip).limit(limit).all()
+    ).order_by(User.id).offset(skip).limit(limit).all()
     
-    response_users = []
-    for user in users:
-        # Safe access to properties that might cause polymorphic loading issues
-        c_type_id = None
-        if user.user_type == 'customer':
-            try:
-                c_type_id = getattr(user, 'customer_type_id', None)
-            except Exception:
-                pass
-
-        response_users.append(UserResponse(
+    return [
+        UserResponse(
             id=user.id,
             email=user.email,
             full_name=user.full_name,
             phone_number=user.phone_number,
             is_active=user.is_active,
             is_superuser=user.is_superuser,
-            customer_type_id=c_type_id,
-            tenant_id=getattr(user, 'tenant_id', None)
-        ))
-    
-    return response_users
+            customer_type_id=getattr(user, 'customer_type_id', None),
+            tenant_id=user.tenant_id
+        )
+        for user in users
+    ]
 
 @router.get("/pending", response_model=List[UserResponse])
 def get_pending_approvals_legacy(
@@ -81,7 +74,7 @@ def approve_user(
     """
     Approve a user.
     """
-    user = db.query(User).filter(User.id == user_id).first()
+    user = query_users(db).filter(User.id == user_id).first()
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
@@ -104,7 +97,7 @@ def reject_user(
     """
     Reject a user (Set status to rejected, disable account).
     """
-    user = db.query(User).filter(User.id == user_id).first()
+    user = query_users(db).filter(User.id == user_id).first()
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
@@ -124,7 +117,7 @@ def reset_user(
     """
     Reset user to pending status.
     """
-    user = db.query(User).filter(User.id == user_id).first()
+    user = query_users(db).filter(User.id == user_id).first()
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from typing import List, Optional
 from sqlalchemy.orm import Session
 from app.database.connection import get_db
@@ -6,6 +6,7 @@ from app.auth.dependencies import has_permission
 from app.models.user_model import User
 from app.admin.schemas.admin_customer_schema import CustomerOut, CustomerDetailOut, CustomerUpdate, CompanyInfoOut, CustomerSubscriptionOut, SubscriptionPlanOut
 from app.admin.services.admin_customer_service import AdminCustomerService
+from app.utils.pagination import set_total_headers, set_cursor_header
 
 router = APIRouter(
     prefix="/admin/customers",
@@ -16,79 +17,86 @@ service = AdminCustomerService()
 
 @router.get("", response_model=List[CustomerOut])
 def get_customers(
+    response: Response,
     skip: int = 0, 
-    limit: int = 100, 
+    limit: int = Query(100, ge=1, le=500), 
     search: Optional[str] = None,
-    page: int = 1, # Frontend sends page, we convert to skip
+    cursor: Optional[int] = None,
+    page: int = 1, # Legacy offset paging; prefer cursor
     db: Session = Depends(get_db), 
     user: User = Depends(has_permission("MANAGE_USERS"))
 ):
-    if page > 1:
+    """
+    Customers, newest first, with company name and subscription status.
+    Keyset paging: pass the X-Next-Cursor header of one page as `cursor`
+    for the next. Total matches are reported in the X-Total-Count header.
+    """
+    if cursor is None and page > 1:
         skip = (page - 1) * limit
-    return service.get_customers(db, skip, limit, search)
-
-@router.get("/{customer_id}", response_model=CustomerDetailOut)
-def get_customer(
-    customer_id: int, 
-    db: Session = Depends(get_db), 
-    user: User = Depends(has_permission("MANAGE_USERS"))
-):
-    result = service.get_customer_detail(db, customer_id)
-    if not result:
-        raise HTTPException(status_code=404, detail="Customer not found")
-    
-    customer, company, subscription = result
+    rows, total, exact, next_cursor = service.get_customers(db, skip, limit, search, cursor)
+    set_total_headers(response, total, exact)
+    set_cursor_header(response, next_cursor)
     
-    # Construct response matching CustomerDetailOut
-    response = CustomerDetailOut(
+    return [
+        CustomerOut(
+            id=customer.id,
+            email=customer.email,
+            full_name=customer.full_name,
+            phone_number=customer.phone_number,
+            is_active=customer.is_active,
+            tenant_id=customer.tenant_id,
+            company_name=company_name,
+            subscription_status=subscription_status
+        )
+        for customer, company_name, subscription_status in rows
+    ]
+
+def _detail_out(customer, company, subscription) -> CustomerDetailOut:
+    # Relationships are already loaded; nothing here touches the database
+    return CustomerDetailOut(
         id=customer.id,
         email=customer.email,
         full_name=customer.full_name,
         phone_number=customer.phone_number,
         is_active=customer.is_active,
         tenant_id=customer.tenant_id,
-        company=None,
-        subscription=None
-    )
-    
-    if company:
-        response.company = CompanyInfoOut(
-            id=company.id,
-            company_name=company.company_name,
-            address=company.address,
-            city=company.city,
-            state=company.state,
-            country=company.country,
-            postal_code=company.postal_code,
-            website_url=company.website_url,
-            tagline=company.tagline,
-            about=company.about,
-            industry=company.industry,
-            company_size=company.company_size,
-            linkedin_url=company.linkedin_url,
-            instagram_url=company.instagram_url,
-            facebook_url=company.facebook_url,
-            created_at=company.created_at
-        )
-        
-    if subscription:
-        response.subscription = CustomerSubscriptionOut(
+        company=CompanyInfoOut.model_validate(company) if company else None,
+        subscription=CustomerSubscriptionOut(
             id=subscription.id,
             status=subscription.status,
             start_date=subscription.start_date,
             end_date=subscription.end_date,
             auto_renew=subscription.auto_renew,
-            plan=SubscriptionPlanOut(
-                id=subscription.plan.id,
-                name=subscription.plan.name,
-                price=subscription.plan.price,
-                currency=subscription.plan.currency,
-                description=subscription.plan.description,
-                features=subscription.plan.features
-            )
-        )
-        
-    return response
+            plan=SubscriptionPlanOut.model_validate(subscription.plan)
+        ) if subscription else None
+    )
+
+@router.get("/details", response_model=List[CustomerDetailOut])
+def get_customer_details(
+    ids: List[int] = Query(..., max_length=100),
+    db: Session = Depends(get_db), 
+    user: User = Depends(has_permission("MANAGE_USERS"))
+):
+    """
+    Detail (company, active subscription and plan) for many customers in
+    one request, e.g. ?ids=1&ids=2. Unknown ids are omitted.
+    """
+    return [
+        _detail_out(customer, getattr(customer, "company_info", None), getattr(customer, "active_subscription", None))
+        for customer in service.get_customer_details(db, ids)
+    ]
+
+@router.get("/{customer_id}", response_model=CustomerDetailOut)
+def get_customer(
+    customer_id: int, 
+    db: Session = Depends(get_db), 
+    user: User = Depends(has_permission("MANAGE_USERS"))
+):
+    result = service.get_customer_detail(db, customer_id)
+    if not result:
+        raise HTTPException(status_code=404, detail="Customer not found")
+    
+    return _detail_out(*result)
 
 @router.put("/{customer_id}", response_model=CustomerOut)
 def update_customer(
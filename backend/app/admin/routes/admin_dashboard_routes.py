@@ -1,44 +1,48 @@
-from fastapi import APIRouter, Depends
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
+from sqlalchemy import desc
 from app.database.connection import get_db
 from app.auth.dependencies import has_permission, has_role
 from app.models.user_model import User
 from app.subscriptions.models import CustomerSubscription, SubscriptionPlan
-from app.payments.models import PaymentHistory
 from app.company.models.company_info_model import CompanyInfo
+from app.admin.services.dashboard_rollup_service import get_dashboard_totals, get_time_series
+from app.services.platform_stats_service import get_platform_counts
 
 router = APIRouter(
     prefix="/admin/dashboard",
     tags=["Admin - Dashboard"]
 )
 
-@router.get("/stats")
 @router.get("/stats")
 def get_dashboard_stats(
     db: Session = Depends(get_db),
     user: User = Depends(has_role("admin"))
 ):
+    # Cards and distribution come from the rollup table, not live aggregates
+    totals = get_dashboard_totals(db)
+
     # 1. Total Customers
-    total_customers = db.query(func.count(User.id)).filter(User.user_type == "customer").scalar()
+    total_customers = totals["customers"]
 
     # 2. Active Subscriptions
-    active_subscriptions = db.query(func.count(CustomerSubscription.id)).filter(CustomerSubscription.status == "ACTIVE").scalar()
+    active_subscriptions = sum(totals["active_subscriptions_by_plan"].values())
 
     # 3. Total Revenue
     # Sum successful payments
-    total_revenue = db.query(func.sum(PaymentHistory.amount)).filter(PaymentHistory.payment_status == "SUCCESS").scalar() or 0.0
+    revenue_by_gateway = totals["revenue"]
+    total_revenue = round(sum(item["amount"] for item in revenue_by_gateway), 2)
 
     # 4. Active Companies
-    active_companies = db.query(func.count(CompanyInfo.id)).scalar()
+    active_companies = get_platform_counts(db)["businesses"]
 
     # 5. Subscription Distribution
-    plans = db.query(SubscriptionPlan.name, func.count(CustomerSubscription.id))\
-        .join(CustomerSubscription, SubscriptionPlan.id == CustomerSubscription.plan_id)\
-        .group_by(SubscriptionPlan.name).all()
-    
+    plan_names = dict(db.query(SubscriptionPlan.id, SubscriptionPlan.name).all())
     subscription_distribution = [
-        {"name": name, "count": count} for name, count in plans
+        {"name": plan_names.get(plan_id, f"Plan {plan_id}"), "count": count}
+        for plan_id, count in totals["subscriptions_by_plan"].items()
     ]
     
     # Calculate percentages
@@ -75,7 +79,47 @@ def get_dashboard_stats(
         "total_customers": total_customers,
         "active_subscriptions": active_subscriptions,
         "total_revenue": total_revenue,
+        "revenue_by_gateway": revenue_by_gateway,
         "active_companies": active_companies,
         "subscription_distribution": subscription_distribution,
         "recent_customers": recent_customers
     }
+
+
+# Default look-back window per granularity
+TIMESERIES_DEFAULT_WINDOW = {
+    "hour": timedelta(hours=48),
+    "day": timedelta(days=30),
+}
+
+
+@router.get("/timeseries")
+def get_dashboard_timeseries(
+    metric: str = "revenue",
+    granularity: str = "day",
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    db: Session = Depends(get_db),
+    user: User = Depends(has_role("admin"))
+):
+    """
+    Revenue or signup trend from the hourly/daily rollups.
+    metric: revenue | signups, granularity: hour | day.
+    """
+    if metric not in ("revenue", "signups"):
+        raise HTTPException(status_code=400, detail="metric must be 'revenue' or 'signups'")
+    if granularity not in TIMESERIES_DEFAULT_WINDOW:
+        raise HTTPException(status_code=400, detail="granularity must be 'hour' or 'day'")
+
+    end = end or datetime.now(timezone.utc)
+    start = start or end - TIMESERIES_DEFAULT_WINDOW[granularity]
+    if start > end:
+        raise HTTPException(status_code=400, detail="start must be before end")
+
+    return {
+        "metric": metric,
+        "granularity": granularity,
+        "start": start.isoformat(),
+        "end": end.isoformat(),
+        "points": get_time_series(db, metric, granularity, start, end)
+    }
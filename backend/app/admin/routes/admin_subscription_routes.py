@@ -1,6 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from typing import List
+from datetime import datetime
+from typing import List, Literal, Optional
 
 from app.database.connection import get_db
 from app.auth.dependencies import has_role
@@ -14,6 +16,9 @@ from app.subscriptions.schemas import (
     SubscriptionAssignRequest
 )
 from app.subscriptions.service import SubscriptionService
+from app.utils.pagination import set_total_headers, set_cursor_header
+from app.utils.export import export_response
+from app.payments.models import PaymentHistory
 
 router = APIRouter(
     prefix="/admin/subscriptions",
@@ -157,26 +162,67 @@ def set_default_plan(
 
 @router.get("/customers", response_model=List[CustomerSubscriptionResponse])
 def get_all_customer_subscriptions(
+    response: Response,
     skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[int] = None,
+    status: Optional[str] = Query(None, description="ACTIVE, TRIAL, EXPIRED or CANCELLED"),
+    plan_id: Optional[int] = None,
+    expires_after: Optional[datetime] = None,
+    expires_before: Optional[datetime] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(has_role("admin"))
 ):
-    """Get all customer subscriptions (admin view)"""
+    """
+    Get all customer subscriptions (admin view), newest first.
+    - Filters: status, plan_id, expiry window (expires_after <= end_date < expires_before)
+    - Keyset paging: pass the X-Next-Cursor header of one page as `cursor` for the next
+    - Total matches are reported in the X-Total-Count header
+    """
     service = SubscriptionService(db)
-    subscriptions = service.get_all_subscriptions(skip, limit)
+    subscriptions, total, exact, next_cursor = service.list_subscriptions(
+        limit=limit,
+        cursor=cursor,
+        skip=skip,
+        status=status,
+        plan_id=plan_id,
+        expires_after=expires_after,
+        expires_before=expires_before
+    )
+    set_total_headers(response, total, exact)
+    set_cursor_header(response, next_cursor)
     
-    # Calculate days remaining for each
-    from datetime import datetime, timezone
     for sub in subscriptions:
-        if sub.status in ["ACTIVE", "TRIAL"]:
-            days_left = (sub.end_date.replace(tzinfo=timezone.utc) - datetime.now(timezone.utc)).days
-            sub.days_remaining = max(0, days_left)
-        else:
-            sub.days_remaining = 0
+        if sub.customer is not None:
+            sub.customer_email = sub.customer.email
+            sub.customer_name = sub.customer.full_name
     
     return subscriptions
 
+# ============ Payment History Export ============
+
+@router.get("/payments/export")
+def export_payment_history(
+    file_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+    compress: Optional[Literal["gzip"]] = None,
+    tenant_id: Optional[int] = None,
+    payment_status: Optional[str] = Query(None, description="PENDING, SUCCESS, FAILED or REFUNDED"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(has_role("admin"))
+):
+    """
+    Stream every payment as NDJSON or CSV (optionally gzipped), with the
+    paying tenant's id. Filters: tenant_id, payment_status.
+    """
+    stmt = select(*PaymentHistory.__table__.columns, CustomerSubscription.tenant_id).join(
+        CustomerSubscription, CustomerSubscription.id == PaymentHistory.subscription_id
+    ).order_by(PaymentHistory.id)
+    if tenant_id is not None:
+        stmt = stmt.where(CustomerSubscription.tenant_id == tenant_id)
+    if payment_status:
+        stmt = stmt.where(PaymentHistory.payment_status == payment_status)
+    return export_response(db, stmt, "payment-history", file_format, compress)
+
 @router.post("/assign", response_model=CustomerSubscriptionResponse, status_code=status.HTTP_201_CREATED)
 def assign_subscription_to_customer(
     request: SubscriptionAssignRequest,
@@ -53,6 +53,9 @@ class CustomerOut(BaseModel):
     phone_number: Optional[str] = None
     is_active: bool
     tenant_id: Optional[int] = None
+    # Filled by the customer list
+    company_name: Optional[str] = None
+    subscription_status: Optional[str] = None
     
     class Config:
         from_attributes = True
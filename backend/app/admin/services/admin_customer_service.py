@@ -1,27 +1,77 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import or_
-from typing import List, Optional
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import or_, select
+from typing import Any, List, Optional, Tuple
 from app.models.user_model import User
+from app.auth.user_queries import polymorphic_user, query_users
 from app.company.models.company_info_model import CompanyInfo
 from app.subscriptions.models import CustomerSubscription
 from app.admin.schemas.admin_customer_schema import CustomerUpdate
+from app.utils.pagination import count_total
+
+
+def _customer_filters(search: Optional[str]) -> list:
+    filters = [User.is_superuser == False]
+    if search:
+        # Substring matches; served by the pg_trgm GIN indexes on PostgreSQL
+        filters.append(or_(
+            User.email.ilike(f"%{search}%"),
+            User.full_name.ilike(f"%{search}%"),
+            User.phone_number.ilike(f"%{search}%")
+        ))
+    return filters
+
+
+def _current_subscription_status():
+    # Latest subscription, the same one SubscriptionService treats as current
+    return (
+        select(CustomerSubscription.status)
+        .where(CustomerSubscription.tenant_id == User.id)
+        .order_by(CustomerSubscription.created_at.desc(), CustomerSubscription.id.desc())
+        .limit(1)
+        .correlate(User)
+        .scalar_subquery()
+    )
+
 
 class AdminCustomerService:
-    def get_customers(self, db: Session, skip: int = 0, limit: int = 100, search: Optional[str] = None) -> List[User]:
-        query = db.query(User).filter(User.is_superuser == False)
+    def get_customers(
+        self,
+        db: Session,
+        skip: int = 0,
+        limit: int = 100,
+        search: Optional[str] = None,
+        cursor: Optional[int] = None
+    ) -> Tuple[List[Tuple[Any, Optional[str], Optional[str]]], int, bool, Optional[int]]:
+        """
+        One page of customers, newest first (by id, so the order is stable).
+        Pass the previous page's next_cursor to page by keyset; without a
+        cursor, skip is used as an offset.
+        Company name and current subscription status come back in the same
+        statement. Returns (rows, total, exact, next_cursor), where each row is
+        (user, company_name, subscription_status).
+        """
+        filters = _customer_filters(search)
         
-        if search:
-            search_filter = or_(
-                User.email.ilike(f"%{search}%"),
-                User.full_name.ilike(f"%{search}%"),
-                User.phone_number.ilike(f"%{search}%")
-            )
-            query = query.filter(search_filter)
-            
-        return query.offset(skip).limit(limit).all()
+        query = query_users(db).filter(*filters)\
+            .outerjoin(CompanyInfo, CompanyInfo.tenant_id == User.id)\
+            .add_columns(CompanyInfo.company_name, _current_subscription_status().label("subscription_status"))\
+            .order_by(User.id.desc())
+        
+        if cursor is not None:
+            query = query.filter(User.id < cursor)
+        else:
+            query = query.offset(skip)
+        
+        rows = query.limit(limit).all()
+        total, exact = count_total(
+            db, db.query(User.id).filter(*filters),
+            offset=None if cursor is not None else skip, page_rows=len(rows), limit=limit
+        )
+        next_cursor = rows[-1][0].id if len(rows) == limit else None
+        return rows, total, exact, next_cursor
 
     def get_customer(self, db: Session, customer_id: int) -> Optional[User]:
-        return db.query(User).filter(User.id == customer_id, User.is_superuser == False).first()
+        return query_users(db).filter(User.id == customer_id, User.is_superuser == False).first()
 
     def update_customer(self, db: Session, customer_id: int, customer_in: CustomerUpdate) -> Optional[User]:
         customer = self.get_customer(db, customer_id)
@@ -37,22 +87,30 @@ class AdminCustomerService:
         db.refresh(customer)
         return customer
 
+    def get_customer_details(self, db: Session, customer_ids: List[int]) -> List[User]:
+        """
+        Customers with company info and active subscription + plan, all
+        eager-loaded in one statement. Unknown ids are skipped; order follows
+        customer_ids.
+        """
+        if not customer_ids:
+            return []
+        PolymorphicUser = polymorphic_user()
+        customers = query_users(db).options(
+            joinedload(PolymorphicUser.CustomerUser.company_info),
+            joinedload(PolymorphicUser.CustomerUser.active_subscription).joinedload(CustomerSubscription.plan)
+        ).filter(User.id.in_(customer_ids), User.is_superuser == False).all()
+        
+        by_id = {customer.id: customer for customer in customers}
+        return [by_id[customer_id] for customer_id in dict.fromkeys(customer_ids) if customer_id in by_id]
+
     def get_customer_detail(self, db: Session, customer_id: int):
-        customer = self.get_customer(db, customer_id)
-        if not customer:
+        customers = self.get_customer_details(db, [customer_id])
+        if not customers:
             return None
-            
-        # Fetch company info
-        company = db.query(CompanyInfo).filter(CompanyInfo.tenant_id == customer.tenant_id).first()
-        
-        # Fetch active subscription
-        subscription = db.query(CustomerSubscription).filter(
-            CustomerSubscription.tenant_id == customer.tenant_id,
-            CustomerSubscription.status == "ACTIVE"
-        ).first()
-        
-        # Attach to customer object (or return a dict/object that matches schema)
-        # Since User model doesn't have these fields, we might need to construct the response manually
-        # or rely on relationships if they exist. For now, let's assume we construct it.
+        customer = customers[0]
         
+        # Admins listed as customers have neither relationship
+        company = getattr(customer, "company_info", None)
+        subscription = getattr(customer, "active_subscription", None)
         return customer, company, subscription
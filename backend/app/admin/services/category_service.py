@@ -1,10 +1,8 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func
 from typing import List, Optional
 from app.admin.models.category_model import Category
 from app.admin.schemas.category_schema import CategoryCreate, CategoryUpdate
-from app.company.models.company_products_model import CompanyProduct
-from app.company.models.company_services_model import CompanyService
+from app.services.category_stats_service import get_category_counts
 
 class CategoryService:
     
@@ -15,14 +13,12 @@ class CategoryService:
             query = query.filter(Category.is_active == True)
         categories = query.order_by(Category.display_order, Category.name).offset(skip).limit(limit).all()
         
-        # Add counts for each category
+        # Add counts for each category (precomputed in category_stats)
+        counts = get_category_counts(db)
         for cat in categories:
-            cat.product_count = db.query(func.count(CompanyProduct.id)).filter(
-                CompanyProduct.category == cat.name
-            ).scalar() or 0
-            cat.service_count = db.query(func.count(CompanyService.id)).filter(
-                CompanyService.category == cat.name
-            ).scalar() or 0
+            stats = counts.get(cat.name, {})
+            cat.product_count = stats.get("product_count", 0)
+            cat.service_count = stats.get("service_count", 0)
         
         return categories
     
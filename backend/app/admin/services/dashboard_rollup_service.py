@@ -0,0 +1,295 @@
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import event, func, inspect, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from app.models.dashboard_rollup_model import DashboardRollup
+from app.customer.models.customer_user_model import CustomerUser
+from app.subscriptions.models import CustomerSubscription
+from app.payments.models import PaymentHistory
+from app.services.derived_tables_service import is_built, mark_built
+
+GRANULARITIES = ("hour", "day")
+TOTAL = "total"
+TOTAL_BUCKET = datetime(1970, 1, 1)
+
+# Metrics that also get hour/day buckets; the rest only keep a total
+SERIES_METRICS = ("signups", "revenue")
+
+
+def bucket_start(moment: Optional[datetime], granularity: str) -> datetime:
+    """Truncates a timestamp to the start of its UTC hour/day (naive UTC)."""
+    if moment is None:
+        moment = datetime.now(timezone.utc)
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+    moment = moment.replace(minute=0, second=0, microsecond=0)
+    if granularity == "day":
+        moment = moment.replace(hour=0)
+    return moment
+
+
+def _upsert(connection, granularity: str, bucket: datetime, metric: str,
+            dimension: str, currency: str, value: float, count: int):
+    table = DashboardRollup.__table__
+    key = dict(granularity=granularity, bucket_start=bucket, metric=metric,
+               dimension=dimension, currency=currency)
+    dialect = connection.dialect.name
+
+    if dialect in ("postgresql", "sqlite"):
+        insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        stmt = insert(table).values(**key, value=value, count=count)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c[name] for name in key],
+            set_={
+                "value": table.c.value + value,
+                "count": table.c.count + count,
+                "updated_at": func.now()
+            }
+        )
+        connection.execute(stmt)
+        return
+
+    condition = [table.c[name] == v for name, v in key.items()]
+    result = connection.execute(
+        table.update().where(*condition)
+        .values(value=table.c.value + value, count=table.c.count + count)
+    )
+    if result.rowcount == 0:
+        connection.execute(table.insert().values(**key, value=value, count=count))
+
+
+def apply_rollup(connection, metric: str, when: Optional[datetime] = None, value: float = 0.0,
+                 count: int = 0, dimension: str = "", currency: str = ""):
+    """
+    Adds one event to the running total and, for series metrics, to its
+    hour and day buckets. Runs on the caller's connection so it commits
+    or rolls back with the write it describes.
+    """
+    if not value and not count:
+        return
+    _upsert(connection, TOTAL, TOTAL_BUCKET, metric, dimension, currency, value, count)
+    if metric in SERIES_METRICS:
+        for granularity in GRANULARITIES:
+            _upsert(connection, granularity, bucket_start(when, granularity),
+                    metric, dimension, currency, value, count)
+
+
+def record_payment(connection, amount: float, gateway: str, currency: Optional[str],
+                   when: Optional[datetime] = None, sign: int = 1):
+    """Adds (or with sign=-1 removes) a successful payment from the revenue rollups."""
+    apply_rollup(connection, "revenue", when, value=sign * (amount or 0.0), count=sign,
+                 dimension=gateway or "", currency=currency or "")
+
+
+# ============ Backfill ============
+
+def rebuild_dashboard_rollups(db: Session) -> int:
+    """
+    Recomputes every rollup row from customers, subscriptions and
+    payment history and replaces the stored rows. Returns the row count.
+    History is streamed and bucketed in Python so the same code runs
+    on every database.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        # Listener upserts (and another rebuild) wait for this transaction
+        # instead of landing between the history reads and the delete
+        db.execute(text(f"LOCK TABLE {DashboardRollup.__tablename__} IN EXCLUSIVE MODE"))
+
+    rows: Dict[Tuple, List[float]] = defaultdict(lambda: [0.0, 0])
+
+    def add(metric, when, value=0.0, count=0, dimension="", currency=""):
+        targets = [(TOTAL, TOTAL_BUCKET)]
+        if metric in SERIES_METRICS:
+            targets += [(g, bucket_start(when, g)) for g in GRANULARITIES]
+        for granularity, bucket in targets:
+            row = rows[(granularity, bucket, metric, dimension, currency)]
+            row[0] += value
+            row[1] += count
+
+    for (created_at,) in db.query(CustomerUser.created_at).yield_per(1000):
+        add("signups", created_at, count=1)
+        add("customers", None, count=1)
+
+    plan_counts = db.query(
+        CustomerSubscription.plan_id, CustomerSubscription.status, func.count(CustomerSubscription.id)
+    ).group_by(CustomerSubscription.plan_id, CustomerSubscription.status).all()
+    for plan_id, status, total in plan_counts:
+        add("subscriptions", None, count=total, dimension=str(plan_id))
+        if status == "ACTIVE":
+            add("active_subscriptions", None, count=total, dimension=str(plan_id))
+
+    payments = db.query(
+        PaymentHistory.payment_date, PaymentHistory.payment_gateway,
+        PaymentHistory.currency, PaymentHistory.amount
+    ).filter(PaymentHistory.payment_status == "SUCCESS").yield_per(1000)
+    for payment_date, gateway, currency, amount in payments:
+        add("revenue", payment_date, value=amount or 0.0, count=1,
+            dimension=gateway or "", currency=currency or "")
+
+    db.query(DashboardRollup).delete()
+    db.add_all([
+        DashboardRollup(granularity=g, bucket_start=b, metric=m, dimension=d,
+                        currency=c, value=value, count=count)
+        for (g, b, m, d, c), (value, count) in rows.items()
+    ])
+    mark_built(db, DashboardRollup.__tablename__)
+    db.commit()
+    return len(rows)
+
+
+def ensure_dashboard_rollups(db: Session) -> bool:
+    """
+    Builds the rollup table if it has never been built; returns whether it
+    did. Run by `python manage.py backfill`, never by a request: reads only
+    see what the listeners have written until then.
+    """
+    if is_built(db, DashboardRollup.__tablename__):
+        return False
+    rebuild_dashboard_rollups(db)
+    return True
+
+
+# ============ Reads ============
+
+def get_dashboard_totals(db: Session) -> dict:
+    """Running totals for the dashboard cards, read from the rollup table."""
+    rows = db.query(DashboardRollup).filter(DashboardRollup.granularity == TOTAL).all()
+
+    totals = {
+        "customers": 0,
+        "signups": 0,
+        "subscriptions_by_plan": {},
+        "active_subscriptions_by_plan": {},
+        "revenue": [],
+    }
+    for row in rows:
+        if row.metric in ("customers", "signups"):
+            totals[row.metric] += row.count
+        elif row.metric == "subscriptions" and row.count > 0:
+            totals["subscriptions_by_plan"][int(row.dimension)] = row.count
+        elif row.metric == "active_subscriptions" and row.count > 0:
+            totals["active_subscriptions_by_plan"][int(row.dimension)] = row.count
+        elif row.metric == "revenue":
+            totals["revenue"].append({
+                "gateway": row.dimension,
+                "currency": row.currency,
+                "amount": round(row.value, 2),
+                "count": row.count
+            })
+    return totals
+
+
+def get_time_series(db: Session, metric: str, granularity: str,
+                    start: datetime, end: datetime) -> List[dict]:
+    """
+    Buckets of one series metric between start and end, oldest first.
+    Revenue points carry their gateway and currency.
+    """
+    rows = db.query(DashboardRollup).filter(
+        DashboardRollup.metric == metric,
+        DashboardRollup.granularity == granularity,
+        DashboardRollup.bucket_start >= bucket_start(start, granularity),
+        DashboardRollup.bucket_start <= bucket_start(end, granularity)
+    ).order_by(DashboardRollup.bucket_start, DashboardRollup.dimension, DashboardRollup.currency).all()
+
+    points = []
+    for row in rows:
+        point = {"bucket": row.bucket_start.isoformat(), "value": round(row.value, 2), "count": row.count}
+        if metric == "revenue":
+            point["gateway"] = row.dimension
+            point["currency"] = row.currency
+        points.append(point)
+    return points
+
+
+# ============ Incremental maintenance ============
+
+def _track_previous_value(target, value, oldvalue, initiator):
+    # No-op; registered with active_history so updates can see old values
+    pass
+
+
+def _previous(target, attribute: str):
+    history = inspect(target).attrs[attribute].history
+    return history.deleted[0] if history.deleted else getattr(target, attribute)
+
+
+# Registrations and signups
+
+@event.listens_for(CustomerUser, "after_insert")
+def _customer_inserted(mapper, connection, target):
+    apply_rollup(connection, "signups", target.created_at, count=1)
+    apply_rollup(connection, "customers", count=1)
+
+
+@event.listens_for(CustomerUser, "after_delete")
+def _customer_deleted(mapper, connection, target):
+    apply_rollup(connection, "customers", count=-1)
+
+
+# Subscriptions per plan
+
+def _apply_subscription(connection, plan_id, status, sign: int):
+    if plan_id is None:
+        return
+    apply_rollup(connection, "subscriptions", count=sign, dimension=str(plan_id))
+    if status == "ACTIVE":
+        apply_rollup(connection, "active_subscriptions", count=sign, dimension=str(plan_id))
+
+
+event.listen(CustomerSubscription.status, "set", _track_previous_value, active_history=True)
+event.listen(CustomerSubscription.plan_id, "set", _track_previous_value, active_history=True)
+
+
+@event.listens_for(CustomerSubscription, "after_insert")
+def _subscription_inserted(mapper, connection, target):
+    _apply_subscription(connection, target.plan_id, target.status, 1)
+
+
+@event.listens_for(CustomerSubscription, "after_delete")
+def _subscription_deleted(mapper, connection, target):
+    _apply_subscription(connection, _previous(target, "plan_id"), _previous(target, "status"), -1)
+
+
+@event.listens_for(CustomerSubscription, "after_update")
+def _subscription_updated(mapper, connection, target):
+    old = (_previous(target, "plan_id"), _previous(target, "status"))
+    new = (target.plan_id, target.status)
+    if old == new:
+        return
+    _apply_subscription(connection, *old, -1)
+    _apply_subscription(connection, *new, 1)
+
+
+# Successful payments
+
+event.listen(PaymentHistory.payment_status, "set", _track_previous_value, active_history=True)
+event.listen(PaymentHistory.amount, "set", _track_previous_value, active_history=True)
+
+
+@event.listens_for(PaymentHistory, "after_insert")
+def _payment_inserted(mapper, connection, target):
+    if target.payment_status == "SUCCESS":
+        record_payment(connection, target.amount, target.payment_gateway, target.currency, target.payment_date)
+
+
+@event.listens_for(PaymentHistory, "after_delete")
+def _payment_deleted(mapper, connection, target):
+    if _previous(target, "payment_status") == "SUCCESS":
+        record_payment(connection, _previous(target, "amount"), target.payment_gateway,
+                       target.currency, target.payment_date, sign=-1)
+
+
+@event.listens_for(PaymentHistory, "after_update")
+def _payment_updated(mapper, connection, target):
+    old_status, old_amount = _previous(target, "payment_status"), _previous(target, "amount")
+    if (old_status, old_amount) == (target.payment_status, target.amount):
+        return
+    if old_status == "SUCCESS":
+        record_payment(connection, old_amount, target.payment_gateway, target.currency,
+                       target.payment_date, sign=-1)
+    if target.payment_status == "SUCCESS":
+        record_payment(connection, target.amount, target.payment_gateway, target.currency,
+                       target.payment_date)
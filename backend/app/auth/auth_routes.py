@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.orm import Session
 from fastapi.security import OAuth2PasswordRequestForm
 from app.database.connection import get_db
@@ -7,8 +7,13 @@ from app.models.user_model import User
 from app.customer.models.customer_user_model import CustomerUser
 from app.admin.models.admin_user_model import AdminUser
 from app.admin.models.customer_type_model import CustomerType
-from app.core.security import verify_password, get_password_hash
-from app.auth.jwt_handler import create_access_token, create_reset_token, decode_reset_token
+from app.core.security import verify_and_update_password, get_password_hash
+from app.auth.login_throttle import login_throttle
+from app.auth.dependencies import oauth2_scheme
+from app.auth.user_queries import query_users
+from app.auth.token_revocation import revoke_token
+from app.auth.token_version import remember_token_version
+from app.auth.jwt_handler import create_user_access_token, decode_access_token, create_reset_token, decode_reset_token
 from app.models.role_model import Role
 from app.utils.validators import validate_phone_number
 from app.utils.email_service import email_service
@@ -18,39 +23,66 @@ router = APIRouter(
     tags=["Authentication"]
 )
 
+def _login_failed(username: str, client_ip: str, detail: str) -> HTTPException:
+    login_throttle.record_failure(username, client_ip)
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
 @router.post("/login", response_model=Token)
-def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
+def login(request: Request, form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
     """
     Login with email or phone number
     - username field accepts either email (contains @) or phone number
     - Examples: 
       - username: admin@example.com
       - username: 9876543210
+    - Repeated failures are throttled (429 with Retry-After)
     """
     username = form_data.username
+    # Behind a proxy, run uvicorn with --proxy-headers so this is the real client
+    client_ip = request.client.host if request.client else "unknown"
+    
+    # Reject throttled attempts before any database or bcrypt work
+    retry_after = login_throttle.retry_after(username, client_ip)
+    if retry_after:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many failed login attempts. Please try again later.",
+            headers={"Retry-After": str(retry_after)},
+        )
     
     # Determine if username is email or phone number
     if "@" in username:
         # Login with email
-        user = db.query(User).filter(User.email == username).first()
+        user = query_users(db).filter(User.email == username).first()
     else:
         # Login with phone number - normalize it first
         try:
             normalized_phone = validate_phone_number(username)
-            user = db.query(User).filter(User.phone_number == normalized_phone).first()
+            user = query_users(db).filter(User.phone_number == normalized_phone).first()
         except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid phone number format",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+            raise _login_failed(username, client_ip, "Invalid phone number format")
     
-    if not user or not verify_password(form_data.password, user.hashed_password):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Incorrect username or password",
-            headers={"WWW-Authenticate": "Bearer"},
+    if not user:
+        raise _login_failed(username, client_ip, "Incorrect username or password")
+    
+    password_ok, new_hash = verify_and_update_password(form_data.password, user.hashed_password)
+    if not password_ok:
+        raise _login_failed(username, client_ip, "Incorrect username or password")
+    
+    login_throttle.record_success(username, client_ip)
+    
+    if new_hash:
+        # Upgrade an outdated hash in place. A bulk update skips the ORM
+        # listeners, so this does not bump token_version / revoke sessions.
+        db.query(User).filter(User.id == user.id).update(
+            {"hashed_password": new_hash}, synchronize_session=False
         )
+        db.commit()
     
     # Check modification: Block unapproved users
     if not user.is_approved and not user.is_superuser:
@@ -60,17 +92,13 @@ def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depend
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    # Create token with email or phone as subject
-    token_subject = user.email if user.email else user.phone_number
-    access_token = create_access_token(data={"sub": token_subject})
+    # Create token with email or phone as subject, plus principal claims
+    access_token = create_user_access_token(user)
+    # The middleware checks the version on every request; start with it cached
+    remember_token_version(user.id, user.token_version)
     
-    # Return token with user information
-    # Safely access polymorphic attributes by checking __dict__ to avoid SQLAlchemy deferred loader issues
+    # Return token with user information; subclass columns were loaded with the user
     from app.schemas.auth_schema import UserResponse
-    from sqlalchemy import inspect
-    
-    # Get the actual instance state to check loaded attributes
-    user_dict = inspect(user).dict
     
     return {
         "access_token": access_token, 
@@ -78,15 +106,33 @@ def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depend
         "user": UserResponse(
             id=user.id,
             email=user.email,
-            full_name=user_dict.get('full_name'),
+            full_name=user.full_name,
             phone_number=user.phone_number,
             is_active=user.is_active,
             is_superuser=user.is_superuser,
-            customer_type_id=user_dict.get('customer_type_id'),
-            tenant_id=user_dict.get('tenant_id') if 'tenant_id' in user_dict else user.id if user.user_type == 'customer' else None
+            customer_type_id=getattr(user, 'customer_type_id', None),
+            tenant_id=user.tenant_id
         )
     }
 
+@router.post("/logout", response_model=MessageResponse)
+def logout(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
+    """
+    Revoke the current access token immediately
+    - Other tokens (other devices) stay valid
+    """
+    payload = decode_access_token(token)
+    if not payload:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
+    # Tokens issued before jti existed cannot be revoked singly; they expire on their own
+    revoke_token(db, payload)
+    return {"message": "Logged out successfully"}
+
 @router.post("/register", status_code=status.HTTP_201_CREATED)
 def register(user_data: RegisterRequest, db: Session = Depends(get_db)):
     """
@@ -196,7 +242,7 @@ def forgot_password(request: ForgotPasswordRequest, db: Session = Depends(get_db
     email = request.email
     
     # Find user by email
-    user = db.query(User).filter(User.email == email).first()
+    user = query_users(db).filter(User.email == email).first()
     
     # Always return success message to prevent user enumeration
     # But only send email if user exists and is active
@@ -245,7 +291,7 @@ def reset_password(request: ResetPasswordRequest, db: Session = Depends(get_db))
         )
     
     # Find user
-    user = db.query(User).filter(User.id == user_id, User.email == email).first()
+    user = query_users(db).filter(User.id == user_id, User.email == email).first()
     
     if not user:
         raise HTTPException(
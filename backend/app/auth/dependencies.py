@@ -3,7 +3,10 @@ from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
 from app.database.connection import get_db
 from app.auth.jwt_handler import decode_access_token
+from app.auth.token_version import is_token_current, remember_token_version
+from app.auth.token_revocation import is_token_revoked
 from app.models.user_model import User
+from app.auth.user_queries import polymorphic_user, query_users
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
@@ -18,6 +21,14 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
+    # Logged out; the in-memory filter answers for almost every live token
+    if is_token_revoked(db, payload):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
     # Subject can be either email or phone number
     subject: str = payload.get("sub")
     # print(f"DEBUG: Token subject: {subject}")
@@ -25,16 +36,29 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
         print("DEBUG: Subject is None")
         raise HTTPException(status_code=401, detail="Invalid token")
     
-    # Try to find user by email or phone number
+    # Tokens with a uid claim resolve by primary key; older tokens by email or phone number
+    # Subclass columns and roles come back with the user in one statement
     from sqlalchemy.orm import joinedload
-    if "@" in subject:
-        user = db.query(User).options(joinedload(User.roles)).filter(User.email == subject).first()
+    query = query_users(db).options(joinedload(polymorphic_user().roles))
+    if payload.get("uid") is not None:
+        user = query.filter(User.id == payload["uid"]).first()
+    elif "@" in subject:
+        user = query.filter(User.email == subject).first()
     else:
-        user = db.query(User).options(joinedload(User.roles)).filter(User.phone_number == subject).first()
+        user = query.filter(User.phone_number == subject).first()
     
     if user is None:
         print(f"DEBUG: User not found for subject {subject}")
         raise HTTPException(status_code=401, detail="User not found")
+    
+    # Revoked by a password, role or activation change since the token was issued
+    remember_token_version(user.id, user.token_version)
+    if not is_token_current(payload, user.token_version):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
     return user
 
 def has_role(role_name: str):
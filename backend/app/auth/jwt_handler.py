@@ -1,3 +1,4 @@
+import uuid
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import jwt, JWTError
@@ -14,6 +15,29 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
+def create_user_access_token(user, expires_delta: Optional[timedelta] = None):
+    """
+    Access token carrying the principal, so requests can be attributed
+    without a user lookup:
+    - sub: email or phone (login identifier)
+    - uid: user id
+    - typ: user_type ("admin" / "customer")
+    - tid: tenant id (customer's own id; None for admins)
+    - ver: user's token_version at issue time (revocation)
+    - jti: unique token id (single-token revocation, e.g. logout)
+    """
+    return create_access_token(
+        data={
+            "sub": user.email if user.email else user.phone_number,
+            "uid": user.id,
+            "typ": user.user_type,
+            "tid": user.id if user.user_type == "customer" else None,
+            "ver": user.token_version or 0,
+            "jti": uuid.uuid4().hex,
+        },
+        expires_delta=expires_delta
+    )
+
 def create_reset_token(user_id: int, email: str):
     """
     Create JWT token for password reset
@@ -0,0 +1,190 @@
+"""
+Brute-force throttling for the login endpoint.
+
+Failed logins are counted in a sliding window per key:
+- user+ip: one client hammering one account (tight limit)
+- ip:      one client spraying many accounts
+- user:    a distributed attack on one account (loose, so the owner
+           logging in from elsewhere is not locked out by an attacker)
+
+Once a key reaches its limit it is blocked for an exponentially growing
+delay after its latest failure. Blocked attempts are rejected before any
+database lookup or bcrypt work and are not counted themselves.
+
+Counters live in process by default; set LOGIN_THROTTLE_REDIS_URL to share
+them between workers (requires the optional `redis` package).
+"""
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class MemoryThrottleBackend:
+    """
+    Per-process failure log: key -> timestamps inside the window, ordered
+    by latest failure so the stalest key is always first.
+    """
+
+    def __init__(self, window_seconds: float, maxkeys: int = 100_000):
+        self.window_seconds = window_seconds
+        self.maxkeys = maxkeys
+        self._failures: "OrderedDict[str, Deque[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _trim(self, key: str, now: float) -> Optional[Deque[float]]:
+        entries = self._failures.get(key)
+        if entries is None:
+            return None
+        while entries and entries[0] <= now - self.window_seconds:
+            entries.popleft()
+        if not entries:
+            del self._failures[key]
+            return None
+        return entries
+
+    def failures(self, key: str) -> Tuple[int, Optional[float]]:
+        """(failures in window, time of the latest one)"""
+        with self._lock:
+            entries = self._trim(key, time.time())
+            if entries is None:
+                return 0, None
+            return len(entries), entries[-1]
+
+    def add_failure(self, key: str):
+        now = time.time()
+        with self._lock:
+            entries = self._trim(key, now)
+            if entries is None:
+                # Spoofed usernames can create unbounded keys; drop the stalest
+                while len(self._failures) >= self.maxkeys:
+                    self._failures.popitem(last=False)
+                entries = self._failures[key] = deque()
+            else:
+                self._failures.move_to_end(key)
+            entries.append(now)
+
+    def reset(self, key: str):
+        with self._lock:
+            self._failures.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._failures.clear()
+
+
+class RedisThrottleBackend:
+    """Shared failure log in Redis sorted sets (score = timestamp)."""
+
+    def __init__(self, url: str, window_seconds: float, prefix: str = "login-throttle:"):
+        import redis
+
+        self.window_seconds = window_seconds
+        self.prefix = prefix
+        self._redis = redis.Redis.from_url(url, socket_timeout=0.5, socket_connect_timeout=0.5)
+
+    def failures(self, key: str) -> Tuple[int, Optional[float]]:
+        now = time.time()
+        name = self.prefix + key
+        pipe = self._redis.pipeline()
+        pipe.zremrangebyscore(name, 0, now - self.window_seconds)
+        pipe.zcard(name)
+        pipe.zrange(name, -1, -1, withscores=True)
+        _, count, latest = pipe.execute()
+        return count, (latest[0][1] if latest else None)
+
+    def add_failure(self, key: str):
+        now = time.time()
+        name = self.prefix + key
+        pipe = self._redis.pipeline()
+        pipe.zadd(name, {repr(now): now})
+        pipe.expire(name, int(self.window_seconds) + 1)
+        pipe.execute()
+
+    def reset(self, key: str):
+        self._redis.delete(self.prefix + key)
+
+    def clear(self):
+        for name in self._redis.scan_iter(self.prefix + "*"):
+            self._redis.delete(name)
+
+
+class LoginThrottle:
+    """Sliding-window failure limits with exponential backoff."""
+
+    def __init__(self, backend, limits: Dict[str, int], backoff_base: float, backoff_max: float):
+        self.backend = backend
+        self.limits = limits
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+    @staticmethod
+    def keys(username: str, client_ip: str) -> Dict[str, str]:
+        username = (username or "").strip().lower()
+        return {
+            "user_ip": f"user_ip:{username}|{client_ip}",
+            "ip": f"ip:{client_ip}",
+            "user": f"user:{username}",
+        }
+
+    def _backoff(self, failures: int, limit: int) -> float:
+        return min(self.backoff_max, self.backoff_base * 2 ** (failures - limit))
+
+    def retry_after(self, username: str, client_ip: str) -> int:
+        """Seconds until this attempt may proceed; 0 if it is allowed now."""
+        now = time.time()
+        wait = 0.0
+        try:
+            for scope, key in self.keys(username, client_ip).items():
+                limit = self.limits[scope]
+                count, latest = self.backend.failures(key)
+                if count >= limit and latest is not None:
+                    wait = max(wait, latest + self._backoff(count, limit) - now)
+        except Exception as e:
+            # A throttle outage must not lock everybody out
+            logger.warning(f"Login throttle check failed, allowing attempt: {e}")
+            return 0
+        return int(wait) + 1 if wait > 0 else 0
+
+    def record_failure(self, username: str, client_ip: str):
+        try:
+            for key in self.keys(username, client_ip).values():
+                self.backend.add_failure(key)
+        except Exception as e:
+            logger.warning(f"Login throttle update failed: {e}")
+
+    def record_success(self, username: str, client_ip: str):
+        """Clears the account's counters; the IP's stay (it may be shared NAT or an attacker)."""
+        keys = self.keys(username, client_ip)
+        try:
+            self.backend.reset(keys["user_ip"])
+            self.backend.reset(keys["user"])
+        except Exception as e:
+            logger.warning(f"Login throttle reset failed: {e}")
+
+
+def _make_backend():
+    window = settings.LOGIN_THROTTLE_WINDOW_SECONDS
+    if settings.LOGIN_THROTTLE_REDIS_URL:
+        try:
+            return RedisThrottleBackend(settings.LOGIN_THROTTLE_REDIS_URL, window)
+        except ImportError:
+            logger.warning("LOGIN_THROTTLE_REDIS_URL is set but redis is not installed; using in-process counters")
+    return MemoryThrottleBackend(window)
+
+
+login_throttle = LoginThrottle(
+    _make_backend(),
+    limits={
+        "user_ip": settings.LOGIN_MAX_FAILURES_PER_USER_IP,
+        "ip": settings.LOGIN_MAX_FAILURES_PER_IP,
+        "user": settings.LOGIN_MAX_FAILURES_PER_USER,
+    },
+    backoff_base=settings.LOGIN_BACKOFF_BASE_SECONDS,
+    backoff_max=settings.LOGIN_BACKOFF_MAX_SECONDS,
+)
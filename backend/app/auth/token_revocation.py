@@ -0,0 +1,161 @@
+"""
+Per-token revocation (logout) by jti.
+
+The revoked_tokens table is authoritative. Each process mirrors the live
+jtis into a Bloom filter, so the common "not revoked" answer needs no I/O;
+only filter hits are confirmed against the table.
+
+The filter is topped up incrementally from revoked_at and rebuilt
+periodically to drop expired tokens. Revocations made in this process
+are visible immediately; those made in another process within
+REVOKED_TOKEN_SYNC_SECONDS.
+"""
+import asyncio
+import logging
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.models.revoked_token_model import RevokedToken
+from app.utils.bloom import BloomFilter
+from app.utils.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Revocations are looked up again this far behind the watermark, so rows whose
+# transaction committed after a sync that already passed their revoked_at are not missed
+SYNC_OVERLAP = timedelta(seconds=60)
+
+# Confirmed revocations (they never un-revoke); saves the lookup on replayed tokens
+_confirmed = TTLCache(ttl_seconds=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60, maxsize=10000)
+
+
+class _RevocationFilter:
+    def __init__(self):
+        self.bloom = BloomFilter(settings.REVOKED_TOKEN_FILTER_CAPACITY)
+        self.watermark: Optional[datetime] = None
+        self.rebuilt_at: Optional[float] = None
+        self.lock = threading.Lock()
+
+    @property
+    def ready(self) -> bool:
+        return self.rebuilt_at is not None
+
+    def add(self, jti: str):
+        with self.lock:
+            if jti not in self.bloom:
+                self.bloom.add(jti)
+
+
+_filter = _RevocationFilter()
+
+
+def rebuild_revocation_filter(db: Session) -> int:
+    """Purges expired rows and rebuilds the filter from the live ones."""
+    now = datetime.now(timezone.utc)
+    db.query(RevokedToken).filter(RevokedToken.expires_at <= now).delete(synchronize_session=False)
+    db.commit()
+
+    watermark = db.query(func.max(RevokedToken.revoked_at)).scalar()
+    live = db.query(func.count(RevokedToken.jti)).scalar() or 0
+    bloom = BloomFilter(max(settings.REVOKED_TOKEN_FILTER_CAPACITY, live * 2))
+    for (jti,) in db.query(RevokedToken.jti).yield_per(5000):
+        bloom.add(jti)
+
+    # A local revocation landing mid-rebuild is still caught by _confirmed,
+    # and re-added to the filter by the next sync's overlap window
+    with _filter.lock:
+        _filter.bloom = bloom
+        _filter.watermark = watermark
+        _filter.rebuilt_at = time.monotonic()
+    return live
+
+
+def sync_revocation_filter(db: Session) -> int:
+    """Adds revocations recorded since the last sync (by any process)."""
+    if not _filter.ready or _filter.bloom.is_full or \
+            time.monotonic() - _filter.rebuilt_at >= settings.REVOKED_TOKEN_REBUILD_SECONDS:
+        return rebuild_revocation_filter(db)
+
+    query = db.query(RevokedToken.jti, RevokedToken.revoked_at)
+    if _filter.watermark is not None:
+        query = query.filter(RevokedToken.revoked_at >= _filter.watermark - SYNC_OVERLAP)
+    added = 0
+    watermark = _filter.watermark
+    for jti, revoked_at in query:
+        _filter.add(jti)
+        added += 1
+        if watermark is None or revoked_at > watermark:
+            watermark = revoked_at
+    with _filter.lock:
+        _filter.watermark = watermark
+    return added
+
+
+def revoke_token(db: Session, payload: dict) -> bool:
+    """Revokes one access token until its expiry. False if it has no jti."""
+    jti = payload.get("jti")
+    if not jti:
+        return False
+    expires_at = datetime.fromtimestamp(payload["exp"], tz=timezone.utc) if payload.get("exp") \
+        else datetime.now(timezone.utc) + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+
+    db.add(RevokedToken(jti=jti, user_id=payload.get("uid"), expires_at=expires_at))
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()  # already revoked
+    _filter.add(jti)
+    _confirmed.set(jti, True)
+    return True
+
+
+def might_be_revoked(payload: dict) -> bool:
+    """
+    In-memory pre-check: False means definitely not revoked.
+    Before the first sync the filter is empty, so every jti must be checked.
+    """
+    jti = payload.get("jti")
+    if not jti:
+        return False
+    if not _filter.ready or _confirmed.get(jti):
+        return True
+    with _filter.lock:
+        return jti in _filter.bloom
+
+
+def is_token_revoked(db: Session, payload: dict) -> bool:
+    """Filter first; only possible hits are confirmed against the table."""
+    if not might_be_revoked(payload):
+        return False
+    jti = payload["jti"]
+    if _confirmed.get(jti):
+        return True
+    row = db.get(RevokedToken, jti)
+    if row is None:
+        return False
+    _confirmed.set(jti, True)
+    return True
+
+
+async def run_revocation_sync(session_factory):
+    """Background loop started at application startup."""
+    from starlette.concurrency import run_in_threadpool
+
+    def _sync():
+        db = session_factory()
+        try:
+            return sync_revocation_filter(db)
+        finally:
+            db.close()
+
+    while True:
+        try:
+            await run_in_threadpool(_sync)
+        except Exception as e:
+            logger.warning(f"Revoked token sync failed: {e}")
+        await asyncio.sleep(settings.REVOKED_TOKEN_SYNC_SECONDS)
@@ -0,0 +1,67 @@
+from typing import Optional
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.models.user_model import User
+from app.utils.cache import TTLCache
+
+# user id -> current token_version. Local bumps invalidate immediately;
+# other processes see a bump within TOKEN_VERSION_CACHE_SECONDS.
+_versions = TTLCache(ttl_seconds=settings.TOKEN_VERSION_CACHE_SECONDS, maxsize=10000)
+
+
+def remember_token_version(user_id: int, version: int):
+    _versions.set(user_id, version or 0)
+
+
+def cached_token_version(user_id: int) -> Optional[int]:
+    """Current token version if cached, else None (no database access)."""
+    return _versions.get(user_id)
+
+
+def get_token_version(db: Session, user_id: int) -> Optional[int]:
+    """Current token version for a user (cached), or None if the user is gone."""
+    version = _versions.get(user_id)
+    if version is None:
+        version = db.query(User.token_version).filter(User.id == user_id).scalar()
+        if version is None:
+            return None
+        remember_token_version(user_id, version)
+    return version
+
+
+def is_token_current(payload: dict, current_version: Optional[int]) -> bool:
+    """Tokens issued before the last bump are revoked. Tokens without "ver" count as 0."""
+    return current_version is not None and payload.get("ver", 0) >= current_version
+
+
+def revoke_user_tokens(user: User):
+    """Invalidates every token issued to the user so far."""
+    user.token_version = (user.token_version or 0) + 1
+
+
+# ============ Automatic revocation ============
+# Password, activation and role changes made through the ORM revoke tokens.
+
+@event.listens_for(User.hashed_password, "set", propagate=True)
+def _password_changed(target, value, oldvalue, initiator):
+    if target.id is not None and value != oldvalue:
+        revoke_user_tokens(target)
+
+
+@event.listens_for(User.is_active, "set", propagate=True)
+def _deactivated(target, value, oldvalue, initiator):
+    if target.id is not None and oldvalue is True and value is False:
+        revoke_user_tokens(target)
+
+
+@event.listens_for(User.roles, "append", propagate=True)
+@event.listens_for(User.roles, "remove", propagate=True)
+def _roles_changed(target, value, initiator):
+    if target.id is not None:
+        revoke_user_tokens(target)
+
+
+@event.listens_for(User, "after_update", propagate=True)
+def _forget_cached_version(mapper, connection, target):
+    _versions.invalidate(target.id)
@@ -0,0 +1,25 @@
+from functools import lru_cache
+from sqlalchemy.orm import Query, Session, with_polymorphic
+from app.models.user_model import User
+from app.customer.models.customer_user_model import CustomerUser
+from app.admin.models.admin_user_model import AdminUser
+
+@lru_cache(maxsize=None)
+def polymorphic_user():
+    """
+    User plus every subclass table, LEFT OUTER JOINed in the same statement.
+    Loading through this entity means subclass columns (created_at,
+    customer_type_id, last_login, ...) never trigger a per-row lazy load.
+
+    Built on first use: with_polymorphic configures every mapper, so it
+    must not run at import, before all models are registered.
+    """
+    return with_polymorphic(User, [CustomerUser, AdminUser])
+
+
+def query_users(db: Session) -> Query:
+    """
+    Query for users with subclass columns loaded up front.
+    Filter with User.<column> (or polymorphic_user().<column>) as usual.
+    """
+    return db.query(polymorphic_user())
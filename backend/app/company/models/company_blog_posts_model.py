@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database.base import Base
@@ -33,6 +33,19 @@ class CompanyBlogPost(Base):
     # Relationship
     customer = relationship("CustomerUser", backref="company_blog_posts")
 
+    __table_args__ = (
+        # List queries: tenant filter + keyset order on (sort key, id)
+        Index("ix_company_blog_posts_tenant_sort_id", "tenant_id", "id"),
+        Index("ix_company_blog_posts_tenant_sort_created_at", "tenant_id", "created_at", "id"),
+        Index("ix_company_blog_posts_tenant_sort_published_at", "tenant_id", "published_at", "id"),
+        Index("ix_company_blog_posts_tenant_sort_title", "tenant_id", "title", "id"),
+        # Public blog listing: published posts, newest first, optionally by category
+        Index("ix_company_blog_posts_published_at", published_at.desc(),
+              postgresql_where=text("status = 'published'"), sqlite_where=text("status = 'published'")),
+        Index("ix_company_blog_posts_published_category", "category", published_at.desc(),
+              postgresql_where=text("status = 'published'"), sqlite_where=text("status = 'published'")),
+    )
+
     @property
     def is_published(self):
         return self.status == 'published'
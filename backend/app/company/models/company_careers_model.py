@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, Date, ARRAY, Boolean, JSON
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, Date, ARRAY, Boolean, JSON, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database.base import Base
@@ -35,6 +35,14 @@ class CompanyCareer(Base):
     # Relationship
     customer = relationship("CustomerUser", backref="company_careers")
 
+    __table_args__ = (
+        # List queries: tenant filter + keyset order on (sort key, id)
+        Index("ix_company_careers_tenant_sort_id", "tenant_id", "id"),
+        Index("ix_company_careers_tenant_sort_created_at", "tenant_id", "created_at", "id"),
+        Index("ix_company_careers_tenant_sort_job_title", "tenant_id", "job_title", "id"),
+        Index("ix_company_careers_tenant_sort_posted_date", "tenant_id", "posted_date", "id"),
+    )
+
     @property
     def title(self):
         return self.job_title
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database.base import Base
@@ -60,3 +60,9 @@ class CompanyInfo(Base):
 
     # Relationships
     customer = relationship("CustomerUser", back_populates="company_info")
+
+    __table_args__ = (
+        # Admin list queries: keyset order on (sort key, id)
+        Index("ix_company_info_sort_created_at", "created_at", "id"),
+        Index("ix_company_info_sort_company_name", "company_name", "id"),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database.base import Base
@@ -25,3 +25,9 @@ class CompanyInquiry(Base):
 
     # Relationship
     customer = relationship("CustomerUser", backref="company_inquiries")
+
+    __table_args__ = (
+        # List queries: tenant filter + keyset order on (sort key, id)
+        Index("ix_company_inquiries_tenant_sort_id", "tenant_id", "id"),
+        Index("ix_company_inquiries_tenant_sort_created_at", "tenant_id", "created_at", "id"),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, JSON, Float, Boolean
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, JSON, Float, Boolean, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database.base import Base
@@ -37,3 +37,14 @@ class CompanyProduct(Base):
     # Relationship
     customer = relationship("CustomerUser", backref="company_products")
 
+    __table_args__ = (
+        # List queries: tenant filter + keyset order on (sort key, id)
+        Index("ix_company_products_tenant_sort_id", "tenant_id", "id"),
+        Index("ix_company_products_tenant_sort_created_at", "tenant_id", "created_at", "id"),
+        Index("ix_company_products_tenant_sort_name", "tenant_id", "name", "id"),
+        Index("ix_company_products_tenant_sort_price", "tenant_id", "price", "id"),
+        # Public "latest products", optionally by category
+        Index("ix_company_products_created_at", created_at.desc()),
+        Index("ix_company_products_category_created_at", "category", created_at.desc()),
+    )
+
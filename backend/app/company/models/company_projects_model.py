@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, JSON, Boolean
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, JSON, Boolean, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database.base import Base
@@ -40,3 +40,11 @@ class CompanyProject(Base):
     # Relationship
     customer = relationship("CustomerUser", backref="company_projects")
 
+    __table_args__ = (
+        # List queries: tenant filter + keyset order on (sort key, id)
+        Index("ix_company_projects_tenant_sort_id", "tenant_id", "id"),
+        Index("ix_company_projects_tenant_sort_created_at", "tenant_id", "created_at", "id"),
+        Index("ix_company_projects_tenant_sort_title", "tenant_id", "title", "id"),
+        Index("ix_company_projects_tenant_sort_start_date", "tenant_id", "start_date", "id"),
+    )
+
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, JSON, Boolean
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, JSON, Boolean, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database.base import Base
@@ -41,3 +41,17 @@ class CompanyService(Base):
     # Relationship
     customer = relationship("CustomerUser", backref="company_services")
 
+    __table_args__ = (
+        # List queries: tenant filter + keyset order on (sort key, id)
+        Index("ix_company_services_tenant_sort_id", "tenant_id", "id"),
+        Index("ix_company_services_tenant_sort_created_at", "tenant_id", "created_at", "id"),
+        Index("ix_company_services_tenant_sort_title", "tenant_id", "title", "id"),
+        # Public "latest services" and business portfolios only show active services
+        Index("ix_company_services_active_created_at", created_at.desc(),
+              postgresql_where=text("status = 'active'"), sqlite_where=text("status = 'active'")),
+        Index("ix_company_services_active_category_created_at", "category", created_at.desc(),
+              postgresql_where=text("status = 'active'"), sqlite_where=text("status = 'active'")),
+        Index("ix_company_services_tenant_active_created_at", "tenant_id", created_at.desc(),
+              postgresql_where=text("status = 'active'"), sqlite_where=text("status = 'active'")),
+    )
+
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, Boolean, ARRAY
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, Boolean, ARRAY, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database.base import Base
@@ -39,3 +39,14 @@ class CompanyTeamMember(Base):
 
     # Relationship
     customer = relationship("CustomerUser", backref="company_team_members")
+
+    __table_args__ = (
+        # List queries: tenant filter + keyset order on (sort key, id)
+        Index("ix_company_team_members_tenant_sort_id", "tenant_id", "id"),
+        Index("ix_company_team_members_tenant_sort_created_at", "tenant_id", "created_at", "id"),
+        Index("ix_company_team_members_tenant_sort_name", "tenant_id", "name", "id"),
+        Index("ix_company_team_members_tenant_sort_display_order", "tenant_id", "display_order", "id"),
+        # Business portfolio: active members in display order
+        Index("ix_company_team_members_tenant_active_order", "tenant_id", "display_order",
+              postgresql_where=text("is_active"), sqlite_where=text("is_active = 1")),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, Boolean, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database.base import Base
@@ -28,3 +28,10 @@ class CompanyTestimonial(Base):
 
     # Relationship
     customer = relationship("CustomerUser", backref="company_testimonials")
+
+    __table_args__ = (
+        # List queries: tenant filter + keyset order on (sort key, id)
+        Index("ix_company_testimonials_tenant_sort_id", "tenant_id", "id"),
+        Index("ix_company_testimonials_tenant_sort_created_at", "tenant_id", "created_at", "id"),
+        Index("ix_company_testimonials_tenant_sort_rating", "tenant_id", "rating", "id"),
+    )
@@ -1,10 +1,26 @@
-from sqlalchemy.orm import Session
-from typing import Generic, TypeVar, Type, Optional, List, Any
+from sqlalchemy import delete, insert, or_
+from sqlalchemy.orm import Query, Session
+from typing import Generic, TypeVar, Type, Optional, List, Any, Dict, Iterable, Set, Tuple
 from app.database.base import Base
+from app.company.repositories.list_query import (
+    ListQuery, ListQueryError, split_filter_key, coerce_value, escape_like,
+    encode_cursor, decode_cursor, order_by_key, after_cursor
+)
+from app.services.category_stats_service import apply_category_deltas
+from app.services.platform_stats_service import apply_model_delta
+from app.services.search_facets_service import FACET_MODELS, mark_facets_stale
+from app.utils.pagination import count_total
 
 ModelType = TypeVar("ModelType", bound=Base)
 
 class BaseRepository(Generic[ModelType]):
+    # List query whitelists (see list_query.py). Each sort key other than id
+    # is backed by a (tenant_id, key, id) index on the model.
+    filter_fields: Tuple[str, ...] = ()
+    sort_fields: Tuple[str, ...] = ("id", "created_at")
+    search_fields: Tuple[str, ...] = ()
+    default_sort: str = "id"
+
     def __init__(self, model: Type[ModelType], db: Session):
         self.model = model
         self.db = db
@@ -13,7 +29,7 @@ class BaseRepository(Generic[ModelType]):
         return self.db.query(self.model).filter(self.model.id == id).first()
 
     def get_all(self, skip: int = 0, limit: int = 100) -> List[ModelType]:
-        return self.db.query(self.model).offset(skip).limit(limit).all()
+        return self.db.query(self.model).order_by(self.model.id).offset(skip).limit(limit).all()
 
     def create(self, obj_in: Any, tenant_id: int) -> ModelType:
         if isinstance(obj_in, dict):
@@ -46,7 +62,163 @@ class BaseRepository(Generic[ModelType]):
         return obj
     
     def get_by_tenant(self, tenant_id: int, skip: int = 0, limit: int = 100) -> List[ModelType]:
-        return self.db.query(self.model).filter(self.model.tenant_id == tenant_id).offset(skip).limit(limit).all()
+        query = self.db.query(self.model).filter(self.model.tenant_id == tenant_id)
+        return query.order_by(self.model.id).offset(skip).limit(limit).all()
 
     def get_by_id_and_tenant(self, id: int, tenant_id: int) -> Optional[ModelType]:
         return self.db.query(self.model).filter(self.model.id == id, self.model.tenant_id == tenant_id).first()
+
+    # ============ Bulk ============
+    # These do not commit: a service runs a whole batch in one transaction.
+
+    def get_many_by_tenant(self, ids: Iterable[int], tenant_id: int) -> List[ModelType]:
+        return self.db.query(self.model).filter(self.model.id.in_(list(ids)), self.model.tenant_id == tenant_id).all()
+
+    def owned_ids(self, ids: Iterable[int], tenant_id: int) -> Set[int]:
+        query = self.db.query(self.model.id).filter(self.model.id.in_(list(ids)), self.model.tenant_id == tenant_id)
+        return {id for (id,) in query.all()}
+
+    def get_many(self, ids: List[int]) -> List[ModelType]:
+        """Loads rows in one statement, in the order of `ids`."""
+        by_id = {obj.id: obj for obj in self.db.query(self.model).filter(self.model.id.in_(ids)).all()}
+        return [by_id[id] for id in ids if id in by_id]
+
+    def bulk_create(self, rows: List[Dict[str, Any]], tenant_id: int) -> List[ModelType]:
+        """
+        Multi-row INSERT ... RETURNING (batches of up to 1000 rows per statement).
+        Autoincrement ids follow the VALUES order, so sorting by id restores the
+        order of `rows` without a sentinel column, which SQLite cannot provide.
+        """
+        if not rows:
+            return []
+        stmt = insert(self.model).returning(self.model)
+        created = sorted(self.db.scalars(stmt, [{**row, "tenant_id": tenant_id} for row in rows]), key=lambda obj: obj.id)
+        self.apply_stats_deltas([getattr(obj, "category", None) for obj in created], 1)
+        return created
+
+    def bulk_update(self, changes: List[Tuple[ModelType, Dict[str, Any]]]) -> List[ModelType]:
+        """Applies field changes to loaded objects; one flush sends them as executemany."""
+        for db_obj, obj_data in changes:
+            for field, value in obj_data.items():
+                setattr(db_obj, field, value)
+        self.db.flush()
+        return [db_obj for db_obj, _ in changes]
+
+    def bulk_delete(self, ids: List[int]) -> int:
+        if not ids:
+            return 0
+        has_category = hasattr(self.model, "category")
+        stmt = delete(self.model).where(self.model.id.in_(ids))
+        deleted = self.db.execute(stmt.returning(self.model.category if has_category else self.model.id)).all()
+        self.apply_stats_deltas([row[0] if has_category else None for row in deleted], -1)
+        return len(deleted)
+
+    def apply_stats_deltas(self, categories: List[Optional[str]], sign: int):
+        """
+        Category and platform counter deltas for rows written by a bulk
+        statement, which skips the after_insert/after_delete listeners
+        (and the flush that invalidates cached search facets).
+        One entry per row (None if the model has no category); runs in the
+        batch's transaction.
+        """
+        connection = self.db.connection()
+        apply_model_delta(connection, self.model, sign * len(categories))
+        apply_category_deltas(connection, self.model, categories, sign)
+        if issubclass(self.model, FACET_MODELS):
+            mark_facets_stale(self.db)
+
+    def missing_required(self, obj_data: Dict[str, Any], partial: bool = False) -> List[str]:
+        """
+        NOT NULL columns without a default that `obj_data` leaves empty.
+        With `partial`, only fields present in `obj_data` are checked.
+        """
+        missing = []
+        for column in self.model.__table__.columns:
+            if column.nullable or column.primary_key or column.default is not None or column.server_default is not None:
+                continue
+            if column.key == "tenant_id" or (partial and column.key not in obj_data):
+                continue
+            if obj_data.get(column.key) is None:
+                missing.append(column.key)
+        return missing
+
+    def existing_values(self, field: str, values: List[Any], exclude_ids: Iterable[int] = ()) -> Set[Any]:
+        """Which of `values` are already stored in `field` (for unique columns)."""
+        if not values:
+            return set()
+        column = getattr(self.model, field)
+        query = self.db.query(column).filter(column.in_(values))
+        exclude_ids = list(exclude_ids)
+        if exclude_ids:
+            query = query.filter(self.model.id.notin_(exclude_ids))
+        return {value for (value,) in query.all()}
+
+    # ============ List queries ============
+
+    def list_query(self, spec: ListQuery, tenant_id: Optional[int] = None) -> Query:
+        """The filtered (unordered, unpaged) query for a list request."""
+        query = self.db.query(self.model)
+        if tenant_id is not None:
+            query = query.filter(self.model.tenant_id == tenant_id)
+
+        for key, values in spec.filters.items():
+            field, op = split_filter_key(key)
+            if field not in self.filter_fields or not values:
+                raise ListQueryError(f"Cannot filter by {key}")
+            column = getattr(self.model, field)
+            if op == "gte":
+                query = query.filter(column >= coerce_value(column, values[-1]))
+            elif op == "lte":
+                query = query.filter(column <= coerce_value(column, values[-1]))
+            elif len(values) == 1:
+                query = query.filter(column == coerce_value(column, values[0]))
+            else:
+                query = query.filter(column.in_([coerce_value(column, v) for v in values]))
+
+        if spec.search and spec.search.strip():
+            if not self.search_fields:
+                raise ListQueryError("Search is not supported here")
+            pattern = f"%{escape_like(spec.search.strip())}%"
+            query = query.filter(or_(*(
+                getattr(self.model, field).ilike(pattern, escape="\\") for field in self.search_fields
+            )))
+        return query
+
+    def list_page(self, spec: ListQuery, tenant_id: Optional[int] = None) -> Tuple[List[ModelType], int, bool, Optional[str]]:
+        """
+        One page of a list request, keyset-paginated on (sort key, id).
+        Returns (items, total, exact, next_cursor); next_cursor is None on the last page.
+        """
+        sort = spec.sort or self.default_sort
+        descending = sort.startswith("-")
+        field = sort.lstrip("-")
+        if field not in self.sort_fields:
+            raise ListQueryError(f"Cannot sort by {field}")
+        column = getattr(self.model, field)
+
+        filtered = self.list_query(spec, tenant_id)
+
+        if field == "id":
+            query = filtered.order_by(self.model.id.desc() if descending else self.model.id.asc())
+        else:
+            query = filtered.order_by(*order_by_key(column, self.model.id, descending))
+
+        if spec.cursor:
+            value, last_id = decode_cursor(spec.cursor, column)
+            if field == "id":
+                query = query.filter(self.model.id < last_id if descending else self.model.id > last_id)
+            else:
+                query = query.filter(after_cursor(column, self.model.id, value, last_id, descending))
+        elif spec.skip:
+            query = query.offset(spec.skip)
+
+        # One extra row tells whether there is a next page
+        rows = query.limit(spec.limit + 1).all()
+        items = rows[:spec.limit]
+        offset = None if spec.cursor else spec.skip or 0
+        total, exact = count_total(self.db, filtered, offset=offset, page_rows=len(rows), limit=spec.limit + 1)
+        next_cursor = None
+        if len(rows) > spec.limit:
+            last = items[-1]
+            next_cursor = encode_cursor(getattr(last, field), last.id)
+        return items, total, exact, next_cursor
@@ -3,5 +3,9 @@ from app.company.models.company_blog_posts_model import CompanyBlogPost
 from app.company.repositories.base_repository import BaseRepository
 
 class CompanyBlogPostRepository(BaseRepository[CompanyBlogPost]):
+    filter_fields = ("category", "status", "author", "published_at")
+    sort_fields = ("id", "created_at", "published_at", "title")
+    search_fields = ("title", "excerpt", "tags")
+
     def __init__(self, db: Session):
         super().__init__(CompanyBlogPost, db)
@@ -3,5 +3,9 @@ from app.company.models.company_careers_model import CompanyCareer
 from app.company.repositories.base_repository import BaseRepository
 
 class CompanyCareerRepository(BaseRepository[CompanyCareer]):
+    filter_fields = ("department", "job_type", "experience_level", "is_active", "closing_date")
+    sort_fields = ("id", "created_at", "job_title", "posted_date")
+    search_fields = ("job_title", "location")
+
     def __init__(self, db: Session):
         super().__init__(CompanyCareer, db)
@@ -3,5 +3,9 @@ from app.company.models.company_gallery_images_model import CompanyGalleryImage
 from app.company.repositories.base_repository import BaseRepository
 
 class CompanyGalleryImageRepository(BaseRepository[CompanyGalleryImage]):
+    filter_fields = ("category", "is_active")
+    sort_fields = ("id", "created_at", "display_order")
+    search_fields = ("title", "alt_text")
+
     def __init__(self, db: Session):
         super().__init__(CompanyGalleryImage, db)
@@ -3,6 +3,10 @@ from app.company.models.company_info_model import CompanyInfo
 from app.company.repositories.base_repository import BaseRepository
 
 class CompanyInfoRepository(BaseRepository[CompanyInfo]):
+    filter_fields = ("country", "industry", "company_size")
+    sort_fields = ("id", "created_at", "company_name")
+    search_fields = ("company_name", "subdomain", "email")
+
     def __init__(self, db: Session):
         super().__init__(CompanyInfo, db)
     
@@ -3,5 +3,9 @@ from app.company.models.company_inquiries_model import CompanyInquiry
 from app.company.repositories.base_repository import BaseRepository
 
 class CompanyInquiryRepository(BaseRepository[CompanyInquiry]):
+    filter_fields = ("status", "created_at")
+    sort_fields = ("id", "created_at")
+    search_fields = ("name", "email", "subject")
+
     def __init__(self, db: Session):
         super().__init__(CompanyInquiry, db)
@@ -3,5 +3,9 @@ from app.company.models.company_products_model import CompanyProduct
 from app.company.repositories.base_repository import BaseRepository
 
 class CompanyProductRepository(BaseRepository[CompanyProduct]):
+    filter_fields = ("category", "stock_status", "publish_to_portfolio", "price")
+    sort_fields = ("id", "created_at", "name", "price")
+    search_fields = ("name", "sku", "short_description")
+
     def __init__(self, db: Session):
         super().__init__(CompanyProduct, db)
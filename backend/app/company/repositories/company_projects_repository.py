@@ -3,5 +3,9 @@ from app.company.models.company_projects_model import CompanyProject
 from app.company.repositories.base_repository import BaseRepository
 
 class CompanyProjectRepository(BaseRepository[CompanyProject]):
+    filter_fields = ("category", "status", "is_featured", "publish_to_portfolio")
+    sort_fields = ("id", "created_at", "title", "start_date")
+    search_fields = ("title", "client_name", "short_description")
+
     def __init__(self, db: Session):
         super().__init__(CompanyProject, db)
@@ -3,5 +3,9 @@ from app.company.models.company_services_model import CompanyService
 from app.company.repositories.base_repository import BaseRepository
 
 class CompanyServiceRepository(BaseRepository[CompanyService]):
+    filter_fields = ("category", "status", "publish_to_portfolio")
+    sort_fields = ("id", "created_at", "title")
+    search_fields = ("title", "short_description")
+
     def __init__(self, db: Session):
         super().__init__(CompanyService, db)
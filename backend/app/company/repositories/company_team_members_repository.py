@@ -3,5 +3,9 @@ from app.company.models.company_team_members_model import CompanyTeamMember
 from app.company.repositories.base_repository import BaseRepository
 
 class CompanyTeamMemberRepository(BaseRepository[CompanyTeamMember]):
+    filter_fields = ("department", "is_active", "publish_to_portfolio")
+    sort_fields = ("id", "created_at", "name", "display_order")
+    search_fields = ("name", "position", "email")
+
     def __init__(self, db: Session):
         super().__init__(CompanyTeamMember, db)
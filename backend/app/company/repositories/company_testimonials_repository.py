@@ -3,5 +3,9 @@ from app.company.models.company_testimonials_model import CompanyTestimonial
 from app.company.repositories.base_repository import BaseRepository
 
 class CompanyTestimonialRepository(BaseRepository[CompanyTestimonial]):
+    filter_fields = ("rating", "is_featured", "publish_to_portfolio")
+    sort_fields = ("id", "created_at", "rating")
+    search_fields = ("client_name", "client_company", "content")
+
     def __init__(self, db: Session):
         super().__init__(CompanyTestimonial, db)
@@ -0,0 +1,115 @@
+"""
+Declarative list queries for company module repositories.
+
+Each repository whitelists what a list request may touch:
+- filter_fields: equality (repeat the parameter for IN) and `<field>__gte` /
+  `<field>__lte` ranges
+- sort_fields:   `sort=<field>` ascending, `sort=-<field>` descending
+- search_fields: `search=` matches any of them, case-insensitively
+
+Pages are keyset-paginated on (sort key, id) with an opaque cursor; `skip`
+is still honoured when no cursor is given.
+"""
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel, Field
+from sqlalchemy import Boolean, Date, DateTime, Float, Integer, Numeric, and_, or_
+
+
+class ListQueryError(ValueError):
+    """A list request used a field, sort or cursor the repository does not allow."""
+    pass
+
+
+class ListQuery(BaseModel):
+    # field -> [values]; keys may carry a __gte / __lte suffix
+    filters: Dict[str, List[str]] = Field(default_factory=dict)
+    sort: Optional[str] = None
+    search: Optional[str] = None
+    cursor: Optional[str] = None
+    skip: int = 0
+    limit: int = 100
+
+
+RANGE_SUFFIXES = {"__gte": "gte", "__lte": "lte"}
+
+
+def split_filter_key(key: str) -> Tuple[str, Optional[str]]:
+    for suffix, op in RANGE_SUFFIXES.items():
+        if key.endswith(suffix):
+            return key[: -len(suffix)], op
+    return key, None
+
+
+def coerce_value(column, raw: Any) -> Any:
+    """Parses a query-string value as the column's type."""
+    if raw is None:
+        return None
+    column_type = column.type
+    try:
+        if isinstance(column_type, Boolean):
+            if isinstance(raw, bool):
+                return raw
+            value = str(raw).strip().lower()
+            if value in ("true", "1", "yes"):
+                return True
+            if value in ("false", "0", "no"):
+                return False
+            raise ValueError(raw)
+        if isinstance(column_type, Integer):
+            return int(raw)
+        if isinstance(column_type, (Float, Numeric)):
+            return float(raw)
+        if isinstance(column_type, DateTime):
+            return raw if isinstance(raw, datetime) else datetime.fromisoformat(str(raw))
+        if isinstance(column_type, Date):
+            return raw if isinstance(raw, date) else date.fromisoformat(str(raw))
+    except (TypeError, ValueError):
+        raise ListQueryError(f"Invalid value for {column.key}: {raw!r}")
+    return str(raw)
+
+
+def escape_like(term: str) -> str:
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+# ============ Cursor ============
+
+def encode_cursor(value: Any, id: int) -> str:
+    if isinstance(value, (datetime, date)):
+        value = value.isoformat()
+    raw = json.dumps([value, id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, column) -> Tuple[Any, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        value, id = json.loads(raw)
+        return coerce_value(column, value), int(id)
+    except (ValueError, TypeError):
+        raise ListQueryError("Invalid cursor")
+
+
+def order_by_key(column, id_column, descending: bool):
+    """
+    `column, id` in one direction. NULLs sort as the largest value (PostgreSQL's
+    default), so one (tenant_id, column, id) index serves both directions.
+    """
+    if descending:
+        return [column.desc().nulls_first(), id_column.desc()]
+    return [column.asc().nulls_last(), id_column.asc()]
+
+
+def after_cursor(column, id_column, value: Any, last_id: int, descending: bool):
+    """Rows after (value, last_id) in `order_by_key` order."""
+    if descending:
+        if value is None:
+            return or_(and_(column.is_(None), id_column < last_id), column.isnot(None))
+        return or_(column < value, and_(column == value, id_column < last_id))
+    if value is None:
+        return and_(column.is_(None), id_column > last_id)
+    return or_(column > value, and_(column == value, id_column > last_id), column.is_(None))
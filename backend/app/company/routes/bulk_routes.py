@@ -0,0 +1,74 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+from typing import Type
+
+from pydantic import BaseModel
+from app.database.connection import get_db
+from app.auth.dependencies import has_role
+from app.models.user_model import User
+from app.company.schemas.bulk_schema import (
+    BulkCreateRequest, BulkUpdateRequest, BulkDeleteRequest, BulkWriteResponse, BulkDeleteResponse
+)
+
+
+def _rejected(errors):
+    return HTTPException(status_code=422, detail=errors)
+
+
+def add_bulk_routes(
+    router: APIRouter,
+    service_class,
+    create_schema: Type[BaseModel],
+    update_schema: Type[BaseModel],
+    response_schema: Type[BaseModel]
+):
+    """
+    Adds tenant-scoped batch endpoints to a module's customer router:
+
+    - POST  /bulk         create items
+    - PATCH /bulk         partially update items (each carries its id)
+    - POST  /bulk/delete  delete items by id
+
+    A batch is written in one transaction. Invalid items are returned in
+    `errors` by their index and the rest are written; with `?atomic=true`
+    any invalid item rejects the whole batch with 422.
+    """
+
+    @router.post("/bulk", response_model=BulkWriteResponse[response_schema])
+    def bulk_create(
+        payload: BulkCreateRequest,
+        atomic: bool = False,
+        db: Session = Depends(get_db),
+        current_user: User = Depends(has_role("customer"))
+    ):
+        service = service_class(db)
+        items, errors = service.bulk_create(payload.items, create_schema, current_user.id, atomic)
+        if atomic and errors:
+            raise _rejected(errors)
+        return {"items": items, "errors": errors}
+
+    @router.patch("/bulk", response_model=BulkWriteResponse[response_schema])
+    def bulk_update(
+        payload: BulkUpdateRequest,
+        atomic: bool = False,
+        db: Session = Depends(get_db),
+        current_user: User = Depends(has_role("customer"))
+    ):
+        service = service_class(db)
+        items, errors = service.bulk_update(payload.items, update_schema, current_user.id, atomic)
+        if atomic and errors:
+            raise _rejected(errors)
+        return {"items": items, "errors": errors}
+
+    @router.post("/bulk/delete", response_model=BulkDeleteResponse)
+    def bulk_delete(
+        payload: BulkDeleteRequest,
+        atomic: bool = False,
+        db: Session = Depends(get_db),
+        current_user: User = Depends(has_role("customer"))
+    ):
+        service = service_class(db)
+        deleted_ids, errors = service.bulk_delete(payload.ids, current_user.id, atomic)
+        if atomic and errors:
+            raise _rejected(errors)
+        return {"deleted_ids": deleted_ids, "errors": errors}
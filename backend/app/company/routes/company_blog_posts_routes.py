@@ -1,12 +1,19 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
 from app.database.connection import get_db
 from app.auth.dependencies import get_current_user, has_role
 from app.models.user_model import User
 from app.company.schemas.company_blog_posts_schema import CompanyBlogPostCreate, CompanyBlogPostUpdate, CompanyBlogPostResponse
 from app.company.services.company_blog_posts_service import CompanyBlogPostService
+from app.company.repositories.company_blog_posts_repository import CompanyBlogPostRepository
+from app.company.repositories.list_query import ListQuery
+from app.company.routes.list_params import list_query_params
+from app.utils.pagination import set_total_headers, set_cursor_header
+from app.company.models.company_blog_posts_model import CompanyBlogPost
+from app.company.routes.export_routes import add_export_route
+from app.company.routes.bulk_routes import add_bulk_routes
 
 # Customer Router
 customer_router = APIRouter(
@@ -14,6 +21,8 @@ customer_router = APIRouter(
     tags=["Customer - Company Blog Posts"]
 )
 
+add_export_route(customer_router, CompanyBlogPost, "blog-posts")
+
 @customer_router.post("/", response_model=CompanyBlogPostResponse)
 def create_blog_post(
     blog_post_in: CompanyBlogPostCreate,
@@ -25,13 +34,16 @@ def create_blog_post(
 
 @customer_router.get("/", response_model=List[CompanyBlogPostResponse])
 def get_my_blog_posts(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    spec: ListQuery = Depends(list_query_params(CompanyBlogPostRepository)),
     db: Session = Depends(get_db),
     current_user: User = Depends(has_role("customer"))
 ):
     service = CompanyBlogPostService(db)
-    return service.get_by_tenant(current_user.id, skip, limit)
+    items, total, exact, next_cursor = service.list_page(spec, current_user.id)
+    set_total_headers(response, total, exact)
+    set_cursor_header(response, next_cursor)
+    return items
 
 @customer_router.get("/{id}", response_model=CompanyBlogPostResponse)
 def get_my_blog_post(
@@ -70,21 +82,29 @@ def delete_my_blog_post(
         raise HTTPException(status_code=404, detail="Blog post not found")
     return item
 
+add_bulk_routes(customer_router, CompanyBlogPostService, CompanyBlogPostCreate, CompanyBlogPostUpdate, CompanyBlogPostResponse)
+
 # Admin Router
 admin_router = APIRouter(
     prefix="/admin/company/blog-posts",
     tags=["Admin - Company Blog Posts"]
 )
 
+add_export_route(admin_router, CompanyBlogPost, "blog-posts", admin=True)
+
 @admin_router.get("/", response_model=List[CompanyBlogPostResponse])
 def get_all_blog_posts(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    spec: ListQuery = Depends(list_query_params(CompanyBlogPostRepository)),
+    tenant_id: Optional[int] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(has_role("admin"))
 ):
     service = CompanyBlogPostService(db)
-    return service.get_all(skip, limit)
+    items, total, exact, next_cursor = service.list_page(spec, tenant_id)
+    set_total_headers(response, total, exact)
+    set_cursor_header(response, next_cursor)
+    return items
 
 @admin_router.get("/{id}", response_model=CompanyBlogPostResponse)
 def get_blog_post_by_id(
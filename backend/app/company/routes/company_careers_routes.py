@@ -1,12 +1,19 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
 from app.database.connection import get_db
 from app.auth.dependencies import get_current_user, has_role
 from app.models.user_model import User
 from app.company.schemas.company_careers_schema import CompanyCareerCreate, CompanyCareerUpdate, CompanyCareerResponse
 from app.company.services.company_careers_service import CompanyCareerService
+from app.company.repositories.company_careers_repository import CompanyCareerRepository
+from app.company.repositories.list_query import ListQuery
+from app.company.routes.list_params import list_query_params
+from app.utils.pagination import set_total_headers, set_cursor_header
+from app.company.models.company_careers_model import CompanyCareer
+from app.company.routes.export_routes import add_export_route
+from app.company.routes.bulk_routes import add_bulk_routes
 
 # Customer Router
 customer_router = APIRouter(
@@ -14,6 +21,8 @@ customer_router = APIRouter(
     tags=["Customer - Company Careers"]
 )
 
+add_export_route(customer_router, CompanyCareer, "careers")
+
 @customer_router.post("/", response_model=CompanyCareerResponse)
 def create_career(
     career_in: CompanyCareerCreate,
@@ -25,13 +34,16 @@ def create_career(
 
 @customer_router.get("/", response_model=List[CompanyCareerResponse])
 def get_my_careers(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    spec: ListQuery = Depends(list_query_params(CompanyCareerRepository)),
     db: Session = Depends(get_db),
     current_user: User = Depends(has_role("customer"))
 ):
     service = CompanyCareerService(db)
-    return service.get_by_tenant(current_user.id, skip, limit)
+    items, total, exact, next_cursor = service.list_page(spec, current_user.id)
+    set_total_headers(response, total, exact)
+    set_cursor_header(response, next_cursor)
+    return items
 
 @customer_router.get("/{id}", response_model=CompanyCareerResponse)
 def get_my_career(
@@ -70,21 +82,29 @@ def delete_my_career(
         raise HTTPException(status_code=404, detail="Career not found")
     return item
 
+add_bulk_routes(customer_router, CompanyCareerService, CompanyCareerCreate, CompanyCareerUpdate, CompanyCareerResponse)
+
 # Admin Router
 admin_router = APIRouter(
     prefix="/admin/company/careers",
     tags=["Admin - Company Careers"]
 )
 
+add_export_route(admin_router, CompanyCareer, "careers", admin=True)
+
 @admin_router.get("/", response_model=List[CompanyCareerResponse])
 def get_all_careers(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    spec: ListQuery = Depends(list_query_params(CompanyCareerRepository)),
+    tenant_id: Optional[int] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(has_role("admin"))
 ):
     service = CompanyCareerService(db)
-    return service.get_all(skip, limit)
+    items, total, exact, next_cursor = service.list_page(spec, tenant_id)
+    set_total_headers(response, total, exact)
+    set_cursor_header(response, next_cursor)
+    return items
 
 @admin_router.get("/{id}", response_model=CompanyCareerResponse)
 def get_career_by_id(
@@ -0,0 +1,114 @@
+import os
+import tempfile
+
+from fastapi import APIRouter, BackgroundTasks, Depends, File, HTTPException, UploadFile, status
+from sqlalchemy.orm import Session, sessionmaker
+from typing import List, Literal, Optional
+
+from app.core.config import settings
+from app.database.connection import get_db
+from app.auth.dependencies import has_role
+from app.models.user_model import User
+from app.models.import_job_model import ImportJob
+from app.company.schemas.import_job_schema import ImportJobResponse
+from app.company.services.catalog_import_service import (
+    IMPORT_FORMATS, detect_format, run_import_job_in_background
+)
+
+# Customer Router
+customer_router = APIRouter(
+    prefix="/customer/company/imports",
+    tags=["Customer - Catalog Imports"]
+)
+
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+
+
+async def _save_upload(file: UploadFile) -> str:
+    """Streams the upload to a temp file (the request's copy is gone once the response is sent)."""
+    limit = settings.IMPORT_MAX_UPLOAD_MB * 1024 * 1024
+    fd, path = tempfile.mkstemp(prefix="catalog-import-")
+    written = 0
+    try:
+        with os.fdopen(fd, "wb") as out:
+            while True:
+                block = await file.read(UPLOAD_CHUNK_BYTES)
+                if not block:
+                    break
+                written += len(block)
+                if written > limit:
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=f"Import files are limited to {settings.IMPORT_MAX_UPLOAD_MB} MB"
+                    )
+                out.write(block)
+    except BaseException:
+        os.remove(path)
+        raise
+    return path
+
+
+@customer_router.post("/{resource}", response_model=ImportJobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def start_import(
+    resource: Literal["products", "services"],
+    background_tasks: BackgroundTasks,
+    file: UploadFile = File(...),
+    file_format: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(has_role("customer"))
+):
+    """
+    Uploads a CSV or JSONL (optionally gzipped) catalog file and starts
+    importing it. Returns the job at once; poll GET /{job_id} for progress.
+    The format comes from `file_format` or the file name.
+    """
+    file_format = file_format or detect_format(file.filename)
+    if file_format not in IMPORT_FORMATS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Upload a .csv or .jsonl file, or pass file_format=csv|jsonl"
+        )
+
+    path = await _save_upload(file)
+    job = ImportJob(
+        tenant_id=current_user.id,
+        resource=resource,
+        file_name=file.filename,
+        file_format=file_format,
+        size_bytes=os.path.getsize(path),
+        status="PENDING",
+        processed_rows=0,
+        created_count=0,
+        error_count=0
+    )
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+
+    # The import must not reuse the request session, which closes with the request
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=db.get_bind())
+    background_tasks.add_task(run_import_job_in_background, session_factory, job.id, path)
+    return job
+
+
+@customer_router.get("/", response_model=List[ImportJobResponse])
+def get_my_imports(
+    limit: int = 20,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(has_role("customer"))
+):
+    return db.query(ImportJob).filter(
+        ImportJob.tenant_id == current_user.id
+    ).order_by(ImportJob.id.desc()).limit(limit).all()
+
+
+@customer_router.get("/{job_id}", response_model=ImportJobResponse)
+def get_my_import(
+    job_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(has_role("customer"))
+):
+    job = db.query(ImportJob).filter(ImportJob.id == job_id, ImportJob.tenant_id == current_user.id).first()
+    if not job:
+        raise HTTPException(status_code=404, detail="Import job not found")
+    return job
@@ -1,12 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
 from app.database.connection import get_db
 from app.auth.dependencies import get_current_user, has_role
 from app.models.user_model import User
 from app.company.schemas.company_info_schema import CompanyInfoCreate, CompanyInfoUpdate, CompanyInfoResponse
 from app.company.services.company_info_service import CompanyInfoService
+from app.company.repositories.company_info_repository import CompanyInfoRepository
+from app.company.repositories.list_query import ListQuery
+from app.company.routes.list_params import list_query_params
+from app.utils.pagination import set_total_headers, set_cursor_header
 
 # Customer Router
 customer_router = APIRouter(
@@ -66,13 +70,17 @@ admin_router = APIRouter(
 
 @admin_router.get("/", response_model=List[CompanyInfoResponse])
 def get_all_company_infos(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    spec: ListQuery = Depends(list_query_params(CompanyInfoRepository)),
+    tenant_id: Optional[int] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(has_role("admin"))
 ):
     service = CompanyInfoService(db)
-    return service.get_all(skip, limit)
+    items, total, exact, next_cursor = service.list_page(spec, tenant_id)
+    set_total_headers(response, total, exact)
+    set_cursor_header(response, next_cursor)
+    return items
 
 @admin_router.get("/{id}", response_model=CompanyInfoResponse)
 def get_company_info_by_id(
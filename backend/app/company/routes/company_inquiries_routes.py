@@ -1,12 +1,18 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
 from app.database.connection import get_db
 from app.auth.dependencies import get_current_user, has_role
 from app.models.user_model import User
 from app.company.schemas.company_inquiries_schema import CompanyInquiryCreate, CompanyInquiryUpdate, CompanyInquiryResponse
 from app.company.services.company_inquiries_service import CompanyInquiryService
+from app.company.repositories.company_inquiries_repository import CompanyInquiryRepository
+from app.company.repositories.list_query import ListQuery
+from app.company.routes.list_params import list_query_params
+from app.utils.pagination import set_total_headers, set_cursor_header
+from app.company.models.company_inquiries_model import CompanyInquiry
+from app.company.routes.export_routes import add_export_route
 
 # Customer Router
 customer_router = APIRouter(
@@ -14,6 +20,8 @@ customer_router = APIRouter(
     tags=["Customer - Company Inquiries"]
 )
 
+add_export_route(customer_router, CompanyInquiry, "inquiries")
+
 @customer_router.post("/", response_model=CompanyInquiryResponse)
 def create_inquiry(
     inquiry_in: CompanyInquiryCreate,
@@ -25,13 +33,16 @@ def create_inquiry(
 
 @customer_router.get("/", response_model=List[CompanyInquiryResponse])
 def get_my_inquiries(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    spec: ListQuery = Depends(list_query_params(CompanyInquiryRepository)),
     db: Session = Depends(get_db),
     current_user: User = Depends(has_role("customer"))
 ):
     service = CompanyInquiryService(db)
-    return service.get_by_tenant(current_user.id, skip, limit)
+    items, total, exact, next_cursor = service.list_page(spec, current_user.id)
+    set_total_headers(response, total, exact)
+    set_cursor_header(response, next_cursor)
+    return items
 
 @customer_router.get("/{id}", response_model=CompanyInquiryResponse)
 def get_my_inquiry(
@@ -76,15 +87,21 @@ admin_router = APIRouter(
     tags=["Admin - Company Inquiries"]
 )
 
+add_export_route(admin_router, CompanyInquiry, "inquiries", admin=True)
+
 @admin_router.get("/", response_model=List[CompanyInquiryResponse])
 def get_all_inquiries(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    spec: ListQuery = Depends(list_query_params(CompanyInquiryRepository)),
+    tenant_id: Optional[int] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(has_role("admin"))
 ):
     service = CompanyInquiryService(db)
-    return service.get_all(skip, limit)
+    items, total, exact, next_cursor = service.list_page(spec, tenant_id)
+    set_total_headers(response, total, exact)
+    set_cursor_header(response, next_cursor)
+    return items
 
 @admin_router.get("/{id}", response_model=CompanyInquiryResponse)
 def get_inquiry_by_id(
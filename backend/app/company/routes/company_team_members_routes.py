@@ -1,12 +1,19 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
 from app.database.connection import get_db
 from app.auth.dependencies import get_current_user, has_role
 from app.models.user_model import User
 from app.company.schemas.company_team_members_schema import CompanyTeamMemberCreate, CompanyTeamMemberUpdate, CompanyTeamMemberResponse
 from app.company.services.company_team_members_service import CompanyTeamMemberService
+from app.company.repositories.company_team_members_repository import CompanyTeamMemberRepository
+from app.company.repositories.list_query import ListQuery
+from app.company.routes.list_params import list_query_params
+from app.utils.pagination import set_total_headers, set_cursor_header
+from app.company.models.company_team_members_model import CompanyTeamMember
+from app.company.routes.export_routes import add_export_route
+from app.company.routes.bulk_routes import add_bulk_routes
 
 # Customer Router
 customer_router = APIRouter(
@@ -14,6 +21,8 @@ customer_router = APIRouter(
     tags=["Customer - Company Team Members"]
 )
 
+add_export_route(customer_router, CompanyTeamMember, "team-members")
+
 @customer_router.post("/", response_model=CompanyTeamMemberResponse)
 def create_team_member(
     team_member_in: CompanyTeamMemberCreate,
@@ -25,13 +34,16 @@ def create_team_member(
 
 @customer_router.get("/", response_model=List[CompanyTeamMemberResponse])
 def get_my_team_members(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    spec: ListQuery = Depends(list_query_params(CompanyTeamMemberRepository)),
     db: Session = Depends(get_db),
     current_user: User = Depends(has_role("customer"))
 ):
     service = CompanyTeamMemberService(db)
-    return service.get_by_tenant(current_user.id, skip, limit)
+    items, total, exact, next_cursor = service.list_page(spec, current_user.id)
+    set_total_headers(response, total, exact)
+    set_cursor_header(response, next_cursor)
+    return items
 
 @customer_router.get("/{id}", response_model=CompanyTeamMemberResponse)
 def get_my_team_member(
@@ -70,21 +82,29 @@ def delete_my_team_member(
         raise HTTPException(status_code=404, detail="Team member not found")
     return item
 
+add_bulk_routes(customer_router, CompanyTeamMemberService, CompanyTeamMemberCreate, CompanyTeamMemberUpdate, CompanyTeamMemberResponse)
+
 # Admin Router
 admin_router = APIRouter(
     prefix="/admin/company/team-members",
     tags=["Admin - Company Team Members"]
 )
 
+add_export_route(admin_router, CompanyTeamMember, "team-members", admin=True)
+
 @admin_router.get("/", response_model=List[CompanyTeamMemberResponse])
 def get_all_team_members(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    spec: ListQuery = Depends(list_query_params(CompanyTeamMemberRepository)),
+    tenant_id: Optional[int] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(has_role("admin"))
 ):
     service = CompanyTeamMemberService(db)
-    return service.get_all(skip, limit)
+    items, total, exact, next_cursor = service.list_page(spec, tenant_id)
+    set_total_headers(response, total, exact)
+    set_cursor_header(response, next_cursor)
+    return items
 
 @admin_router.get("/{id}", response_model=CompanyTeamMemberResponse)
 def get_team_member_by_id(
@@ -1,12 +1,19 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
 from app.database.connection import get_db
 from app.auth.dependencies import get_current_user, has_role
 from app.models.user_model import User
 from app.company.schemas.company_testimonials_schema import CompanyTestimonialCreate, CompanyTestimonialUpdate, CompanyTestimonialResponse
 from app.company.services.company_testimonials_service import CompanyTestimonialService
+from app.company.repositories.company_testimonials_repository import CompanyTestimonialRepository
+from app.company.repositories.list_query import ListQuery
+from app.company.routes.list_params import list_query_params
+from app.utils.pagination import set_total_headers, set_cursor_header
+from app.company.models.company_testimonials_model import CompanyTestimonial
+from app.company.routes.export_routes import add_export_route
+from app.company.routes.bulk_routes import add_bulk_routes
 
 # Customer Router
 customer_router = APIRouter(
@@ -14,6 +21,8 @@ customer_router = APIRouter(
     tags=["Customer - Company Testimonials"]
 )
 
+add_export_route(customer_router, CompanyTestimonial, "testimonials")
+
 @customer_router.post("/", response_model=CompanyTestimonialResponse)
 def create_testimonial(
     testimonial_in: CompanyTestimonialCreate,
@@ -25,13 +34,16 @@ def create_testimonial(
 
 @customer_router.get("/", response_model=List[CompanyTestimonialResponse])
 def get_my_testimonials(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    spec: ListQuery = Depends(list_query_params(CompanyTestimonialRepository)),
     db: Session = Depends(get_db),
     current_user: User = Depends(has_role("customer"))
 ):
     service = CompanyTestimonialService(db)
-    return service.get_by_tenant(current_user.id, skip, limit)
+    items, total, exact, next_cursor = service.list_page(spec, current_user.id)
+    set_total_headers(response, total, exact)
+    set_cursor_header(response, next_cursor)
+    return items
 
 @customer_router.get("/{id}", response_model=CompanyTestimonialResponse)
 def get_my_testimonial(
@@ -70,21 +82,29 @@ def delete_my_testimonial(
         raise HTTPException(status_code=404, detail="Testimonial not found")
     return item
 
+add_bulk_routes(customer_router, CompanyTestimonialService, CompanyTestimonialCreate, CompanyTestimonialUpdate, CompanyTestimonialResponse)
+
 # Admin Router
 admin_router = APIRouter(
     prefix="/admin/company/testimonials",
     tags=["Admin - Company Testimonials"]
 )
 
+add_export_route(admin_router, CompanyTestimonial, "testimonials", admin=True)
+
 @admin_router.get("/", response_model=List[CompanyTestimonialResponse])
 def get_all_testimonials(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    spec: ListQuery = Depends(list_query_params(CompanyTestimonialRepository)),
+    tenant_id: Optional[int] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(has_role("admin"))
 ):
     service = CompanyTestimonialService(db)
-    return service.get_all(skip, limit)
+    items, total, exact, next_cursor = service.list_page(spec, tenant_id)
+    set_total_headers(response, total, exact)
+    set_cursor_header(response, next_cursor)
+    return items
 
 @admin_router.get("/{id}", response_model=CompanyTestimonialResponse)
 def get_testimonial_by_id(
@@ -0,0 +1,45 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from typing import Literal, Optional
+
+from app.database.connection import get_db
+from app.auth.dependencies import has_role
+from app.models.user_model import User
+from app.utils.export import export_response
+
+
+def add_export_route(router: APIRouter, model, file_name: str, admin: bool = False):
+    """
+    Adds GET /export, streaming the module's rows as NDJSON or CSV
+    (`?format=csv`), optionally gzipped (`?compress=gzip`).
+    Customers get their own rows; admins get every tenant's, or one
+    tenant's with `?tenant_id=`.
+
+    Call it before the router's /{id} routes, which would otherwise match.
+    """
+    columns = list(model.__table__.columns)
+
+    if admin:
+        @router.get("/export")
+        def export_all(
+            file_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+            compress: Optional[Literal["gzip"]] = None,
+            tenant_id: Optional[int] = None,
+            db: Session = Depends(get_db),
+            current_user: User = Depends(has_role("admin"))
+        ):
+            stmt = select(*columns).order_by(model.id)
+            if tenant_id is not None:
+                stmt = stmt.where(model.tenant_id == tenant_id)
+            return export_response(db, stmt, file_name, file_format, compress)
+    else:
+        @router.get("/export")
+        def export_mine(
+            file_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+            compress: Optional[Literal["gzip"]] = None,
+            db: Session = Depends(get_db),
+            current_user: User = Depends(has_role("customer"))
+        ):
+            stmt = select(*columns).where(model.tenant_id == current_user.id).order_by(model.id)
+            return export_response(db, stmt, file_name, file_format, compress)
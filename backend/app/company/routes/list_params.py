@@ -0,0 +1,36 @@
+from fastapi import Query, Request
+from typing import Optional
+
+from app.company.repositories.list_query import ListQuery, split_filter_key
+
+# Query parameters with their own meaning; everything else may be a filter
+RESERVED_PARAMS = {"sort", "search", "cursor", "skip", "limit", "tenant_id"}
+
+
+def list_query_params(repository_class):
+    """
+    Dependency building a ListQuery for one module's list route.
+
+    Filters are read from the query string as `<field>=<value>` (repeat for
+    IN), `<field>__gte=` and `<field>__lte=`, for the repository's
+    filter_fields only; other parameters are ignored like any unknown
+    query parameter.
+    """
+    def dependency(
+        request: Request,
+        sort: Optional[str] = None,
+        search: Optional[str] = None,
+        cursor: Optional[str] = None,
+        skip: int = Query(0, ge=0),
+        limit: int = Query(100, ge=1, le=500)
+    ) -> ListQuery:
+        filters = {}
+        for key in request.query_params.keys():
+            if key in RESERVED_PARAMS or key in filters:
+                continue
+            field, _ = split_filter_key(key)
+            if field in repository_class.filter_fields:
+                filters[key] = request.query_params.getlist(key)
+        return ListQuery(filters=filters, sort=sort, search=search, cursor=cursor, skip=skip, limit=limit)
+
+    return dependency
@@ -0,0 +1,29 @@
+from pydantic import BaseModel, Field
+from typing import Optional, List, Dict, Any, Generic, TypeVar
+from app.core.config import settings
+
+T = TypeVar("T")
+
+class BulkCreateRequest(BaseModel):
+    # Items are validated one by one so a bad item does not reject the request
+    items: List[Dict[str, Any]] = Field(..., min_length=1, max_length=settings.BULK_MAX_ITEMS)
+
+class BulkUpdateRequest(BaseModel):
+    # Each item is a partial update that also carries the item's id
+    items: List[Dict[str, Any]] = Field(..., min_length=1, max_length=settings.BULK_MAX_ITEMS)
+
+class BulkDeleteRequest(BaseModel):
+    ids: List[int] = Field(..., min_length=1, max_length=settings.BULK_MAX_ITEMS)
+
+class BulkItemError(BaseModel):
+    index: int
+    id: Optional[int] = None
+    errors: List[Dict[str, Any]]
+
+class BulkWriteResponse(BaseModel, Generic[T]):
+    items: List[T]
+    errors: List[BulkItemError] = []
+
+class BulkDeleteResponse(BaseModel):
+    deleted_ids: List[int]
+    errors: List[BulkItemError] = []
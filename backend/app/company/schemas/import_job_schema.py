@@ -0,0 +1,23 @@
+from pydantic import BaseModel
+from typing import Optional, List, Dict, Any
+from datetime import datetime
+
+class ImportJobResponse(BaseModel):
+    id: int
+    tenant_id: int
+    resource: str
+    file_name: Optional[str] = None
+    file_format: str
+    size_bytes: Optional[int] = None
+    status: str
+    processed_rows: int
+    created_count: int
+    error_count: int
+    errors: Optional[List[Dict[str, Any]]] = None
+    last_error: Optional[str] = None
+    created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
@@ -1,14 +1,36 @@
-from typing import Generic, TypeVar, Type, Optional, List, Any
+from typing import Generic, TypeVar, Type, Optional, List, Any, Dict, Iterable, Tuple
+from pydantic import BaseModel, ValidationError
 from app.company.repositories.base_repository import BaseRepository
+from app.company.repositories.list_query import ListQuery
 from app.database.base import Base
+from app.services.portfolio_sync_service import sync_items_to_portfolio, delete_portfolio_items
 
 ModelType = TypeVar("ModelType", bound=Base)
 RepositoryType = TypeVar("RepositoryType", bound=BaseRepository)
 
+def _item_error(index: int, errors: List[Dict[str, Any]], id: Optional[int] = None) -> Dict[str, Any]:
+    return {"index": index, "id": id, "errors": errors}
+
+def _field_error(field: str, msg: str, type: str) -> Dict[str, Any]:
+    return {"loc": [field], "msg": msg, "type": type}
+
 class BaseService(Generic[ModelType, RepositoryType]):
+    # PortfolioItemType for modules projected to the public feed
+    portfolio_item_type: Optional[str] = None
+    # Unique columns checked per item before a bulk write
+    unique_fields: Tuple[str, ...] = ()
+
     def __init__(self, repository: RepositoryType):
         self.repository = repository
 
+    def _prepare_create(self, obj_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Maps validated create data onto model columns."""
+        return obj_data
+
+    def _prepare_update(self, obj_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Maps validated (partial) update data onto model columns."""
+        return obj_data
+
     def get_by_id(self, id: int) -> Optional[ModelType]:
         return self.repository.get_by_id(id)
 
@@ -32,6 +54,9 @@ class BaseService(Generic[ModelType, RepositoryType]):
 
     def get_by_id_and_tenant(self, id: int, tenant_id: int) -> Optional[ModelType]:
         return self.repository.get_by_id_and_tenant(id, tenant_id)
+
+    def list_page(self, spec: ListQuery, tenant_id: Optional[int] = None) -> Tuple[List[ModelType], int, bool, Optional[str]]:
+        return self.repository.list_page(spec, tenant_id)
     
     def update_by_tenant(self, id: int, tenant_id: int, obj_in: Any) -> Optional[ModelType]:
         db_obj = self.repository.get_by_id_and_tenant(id, tenant_id)
@@ -44,3 +69,128 @@ class BaseService(Generic[ModelType, RepositoryType]):
         if not db_obj:
             return None
         return self.repository.delete(id)
+
+    # ============ Bulk ============
+    # Each batch is validated item by item, then written in one transaction.
+    # Invalid items are reported by their index and skipped; with `atomic`
+    # any invalid item rejects the whole batch and nothing is written.
+
+    def _validate(self, index: int, raw: Any, schema: Type[BaseModel], partial: bool) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        try:
+            obj_in = schema.model_validate(raw)
+        except ValidationError as e:
+            errors = e.errors(include_url=False, include_context=False, include_input=False)
+            return None, _item_error(index, errors)
+        if partial:
+            obj_data = self._prepare_update(obj_in.model_dump(exclude_unset=True))
+        else:
+            obj_data = self._prepare_create(obj_in.model_dump())
+        missing = self.repository.missing_required(obj_data, partial=partial)
+        if missing:
+            return None, _item_error(index, [_field_error(f, "Field required", "missing") for f in missing])
+        return obj_data, None
+
+    def _unique_conflicts(self, rows: List[Dict[str, Any]], exclude_ids: Iterable[int] = ()) -> Dict[int, List[Dict[str, Any]]]:
+        """Positions in `rows` whose unique fields clash with stored rows or earlier rows in the batch."""
+        conflicts: Dict[int, List[Dict[str, Any]]] = {}
+        for field in self.unique_fields:
+            values = [row.get(field) for row in rows]
+            taken = self.repository.existing_values(field, [v for v in values if v is not None], exclude_ids)
+            seen = set()
+            for position, value in enumerate(values):
+                if value is None:
+                    continue
+                if value in taken or value in seen:
+                    conflicts.setdefault(position, []).append(_field_error(field, "Value already exists", "unique"))
+                seen.add(value)
+        return conflicts
+
+    def _sync_portfolio(self, objs: List[ModelType]):
+        if self.portfolio_item_type is not None and objs:
+            sync_items_to_portfolio(self.repository.db, objs, self.portfolio_item_type)
+
+    def bulk_create(self, items: List[Any], schema: Type[BaseModel], tenant_id: int, atomic: bool = False) -> Tuple[List[ModelType], List[Dict[str, Any]]]:
+        rows, indexes, errors = [], [], []
+        for index, raw in enumerate(items):
+            obj_data, error = self._validate(index, raw, schema, partial=False)
+            if error:
+                errors.append(error)
+            else:
+                rows.append(obj_data)
+                indexes.append(index)
+
+        conflicts = self._unique_conflicts(rows)
+        if conflicts:
+            errors.extend(_item_error(indexes[p], e) for p, e in conflicts.items())
+            rows = [row for p, row in enumerate(rows) if p not in conflicts]
+        errors.sort(key=lambda e: e["index"])
+        if not rows or (atomic and errors):
+            return [], errors
+
+        db = self.repository.db
+        objs = self.repository.bulk_create(rows, tenant_id)
+        self._sync_portfolio(objs)
+        # Read ids before commit expires the objects; one SELECT then reloads them all
+        ids = [obj.id for obj in objs]
+        db.commit()
+        return self.repository.get_many(ids), errors
+
+    def bulk_update(self, items: List[Any], schema: Type[BaseModel], tenant_id: int, atomic: bool = False) -> Tuple[List[ModelType], List[Dict[str, Any]]]:
+        """Each item is a partial update carrying its `id`."""
+        parsed, errors = [], []
+        seen_ids = set()
+        for index, raw in enumerate(items):
+            id = raw.get("id") if isinstance(raw, dict) else None
+            if not isinstance(id, int) or isinstance(id, bool):
+                errors.append(_item_error(index, [_field_error("id", "A valid integer id is required", "missing")]))
+                continue
+            if id in seen_ids:
+                errors.append(_item_error(index, [_field_error("id", "Duplicate id in batch", "duplicate")], id))
+                continue
+            seen_ids.add(id)
+            obj_data, error = self._validate(index, {k: v for k, v in raw.items() if k != "id"}, schema, partial=True)
+            if error:
+                errors.append({**error, "id": id})
+            else:
+                parsed.append((index, id, obj_data))
+
+        targets = {obj.id: obj for obj in self.repository.get_many_by_tenant([id for _, id, _ in parsed], tenant_id)} if parsed else {}
+        found = []
+        for index, id, obj_data in parsed:
+            if id in targets:
+                found.append((index, id, obj_data))
+            else:
+                errors.append(_item_error(index, [_field_error("id", "Item not found", "not_found")], id))
+
+        conflicts = self._unique_conflicts([obj_data for _, _, obj_data in found], exclude_ids=[id for _, id, _ in found])
+        if conflicts:
+            errors.extend(_item_error(found[p][0], e, found[p][1]) for p, e in conflicts.items())
+            found = [entry for p, entry in enumerate(found) if p not in conflicts]
+        errors.sort(key=lambda e: e["index"])
+        if not found or (atomic and errors):
+            return [], errors
+
+        db = self.repository.db
+        objs = self.repository.bulk_update([(targets[id], obj_data) for _, id, obj_data in found])
+        self._sync_portfolio(objs)
+        ids = [obj.id for obj in objs]
+        db.commit()
+        return self.repository.get_many(ids), errors
+
+    def bulk_delete(self, ids: List[int], tenant_id: int, atomic: bool = False) -> Tuple[List[int], List[Dict[str, Any]]]:
+        owned = self.repository.owned_ids(ids, tenant_id) if ids else set()
+        deleted, errors = [], []
+        for index, id in enumerate(ids):
+            if id not in owned:
+                errors.append(_item_error(index, [_field_error("id", "Item not found", "not_found")], id))
+            elif id not in deleted:
+                deleted.append(id)
+        if not deleted or (atomic and errors):
+            return [], errors
+
+        db = self.repository.db
+        self.repository.bulk_delete(deleted)
+        if self.portfolio_item_type is not None:
+            delete_portfolio_items(db, deleted, self.portfolio_item_type)
+        db.commit()
+        return deleted, errors
@@ -0,0 +1,275 @@
+"""
+Streaming catalog import for products and services.
+
+An uploaded CSV or JSONL file (optionally gzipped) is read row by row and
+handled in chunks of IMPORT_CHUNK_SIZE rows. Each chunk is:
+- validated against the module's Create schema, row by row
+- given slugs, unique within the tenant (existing slugs are read once per job)
+- loaded with COPY on PostgreSQL, an executemany INSERT elsewhere
+- projected to the public portfolio in bulk
+and committed together with the job's progress counters. A failed chunk
+stops the job; earlier chunks stay imported.
+"""
+import csv
+import gzip
+import io
+import json
+import logging
+import os
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy import JSON, insert
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.company.models.company_products_model import CompanyProduct
+from app.company.models.company_services_model import CompanyService
+from app.company.schemas.company_products_schema import CompanyProductCreate
+from app.company.schemas.company_services_schema import CompanyServiceCreate
+from app.company.services.company_products_service import CompanyProductService
+from app.company.services.company_services_service import CompanyServiceService
+from app.models.import_job_model import ImportJob
+from app.services.portfolio_sync_service import sync_items_to_portfolio
+from app.utils.slug import slugify
+
+logger = logging.getLogger(__name__)
+
+# resource -> (service, create schema, field the slug is made from)
+IMPORT_RESOURCES = {
+    "products": (CompanyProductService, CompanyProductCreate, "name"),
+    "services": (CompanyServiceService, CompanyServiceCreate, "title"),
+}
+
+IMPORT_FORMATS = ("csv", "jsonl")
+
+
+class ImportFileError(Exception):
+    """The file cannot be read as the declared format."""
+    pass
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def detect_format(file_name: Optional[str]) -> Optional[str]:
+    """csv / jsonl from the file name (.csv, .jsonl, .ndjson, each optionally .gz)."""
+    name = (file_name or "").lower()
+    if name.endswith(".gz"):
+        name = name[:-3]
+    if name.endswith(".csv"):
+        return "csv"
+    if name.endswith((".jsonl", ".ndjson")):
+        return "jsonl"
+    return None
+
+
+# ============ Reading ============
+
+def _open_text(path: str):
+    with open(path, "rb") as f:
+        gzipped = f.read(2) == b"\x1f\x8b"
+    if gzipped:
+        return gzip.open(path, "rt", encoding="utf-8-sig", newline="")
+    return open(path, "r", encoding="utf-8-sig", newline="")
+
+
+def _csv_value(value: Optional[str]) -> Any:
+    # Empty cells are missing values; JSON-looking cells carry lists/objects
+    if value is None:
+        return None
+    value = value.strip()
+    if value == "":
+        return None
+    if value[0] in "[{":
+        try:
+            return json.loads(value)
+        except ValueError:
+            pass
+    return value
+
+
+def iter_rows(path: str, file_format: str) -> Iterator[Tuple[int, Any]]:
+    """Yields (row number, raw row) without loading the file into memory."""
+    with _open_text(path) as f:
+        if file_format == "csv":
+            reader = csv.DictReader(f)
+            for number, record in enumerate(reader, start=1):
+                # Empty cells are left out so the schema defaults apply, as for a missing column
+                values = ((key.strip(), _csv_value(value)) for key, value in record.items() if key)
+                yield number, {key: value for key, value in values if value is not None}
+        else:
+            for number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    yield number, json.loads(line)
+                except ValueError as e:
+                    yield number, ImportFileError(f"Invalid JSON: {e}")
+
+
+def _chunks(rows: Iterator[Tuple[int, Any]], size: int) -> Iterator[List[Tuple[int, Any]]]:
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+# ============ Slugs ============
+
+class SlugAllocator:
+    """Hands out slugs unique within one tenant's table, starting from the stored ones."""
+
+    def __init__(self, db: Session, model, tenant_id: int):
+        self.used: Set[str] = {
+            slug for (slug,) in db.query(model.slug).filter(model.tenant_id == tenant_id).all()
+        }
+
+    def allocate(self, wanted: Optional[str], source: Optional[str]) -> str:
+        base = slugify(wanted or source or "") or "item"
+        slug, n = base, 2
+        while slug in self.used:
+            slug, n = f"{base}-{n}", n + 1
+        self.used.add(slug)
+        return slug
+
+
+# ============ Loading ============
+
+def _copy_text(value: Any) -> str:
+    if value is None:
+        return r"\N"
+    return str(value).replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+
+def _copy_rows(db: Session, table, rows: List[Dict[str, Any]]):
+    """COPY ... FROM STDIN (text format) on the session's own connection and transaction."""
+    columns = list(rows[0].keys())
+    json_columns = {c for c in columns if isinstance(table.c[c].type, JSON)}
+    buffer = io.StringIO()
+    for row in rows:
+        values = [json.dumps(row[c]) if c in json_columns and row[c] is not None else row[c] for c in columns]
+        buffer.write("\t".join(_copy_text(v) for v in values))
+        buffer.write("\n")
+    buffer.seek(0)
+
+    sql = f"COPY {table.name} ({', '.join(columns)}) FROM STDIN"
+    cursor = db.connection().connection.cursor()
+    try:
+        if hasattr(cursor, "copy_expert"):  # psycopg2
+            cursor.copy_expert(sql, buffer)
+        else:  # psycopg 3
+            with cursor.copy(sql) as copy:
+                copy.write(buffer.getvalue())
+    finally:
+        cursor.close()
+
+
+def load_rows(db: Session, model, rows: List[Dict[str, Any]]):
+    if not rows:
+        return
+    if db.get_bind().dialect.name == "postgresql":
+        _copy_rows(db, model.__table__, rows)
+    else:
+        db.execute(insert(model.__table__), rows)
+
+
+# ============ Jobs ============
+
+def _record_errors(job: ImportJob, row_errors: List[Dict[str, Any]]):
+    job.error_count += len(row_errors)
+    stored = list(job.errors or [])
+    room = settings.IMPORT_MAX_STORED_ERRORS - len(stored)
+    if room > 0:
+        # Reassign so the JSON column is flagged as changed
+        job.errors = stored + row_errors[:room]
+
+
+def _import_chunk(db: Session, job: ImportJob, service, schema, slug_field: str, slugs: SlugAllocator, chunk):
+    repository = service.repository
+    model = repository.model
+    rows, row_errors = [], []
+
+    for number, raw in chunk:
+        if isinstance(raw, ImportFileError):
+            row_errors.append({"row": number, "errors": [{"loc": [], "msg": str(raw), "type": "invalid_json"}]})
+            continue
+        try:
+            obj_in = schema.model_validate(raw)
+        except ValidationError as e:
+            errors = e.errors(include_url=False, include_context=False, include_input=False)
+            row_errors.append({"row": number, "errors": errors})
+            continue
+        obj_data = obj_in.model_dump()
+        obj_data["slug"] = slugs.allocate(obj_data.get("slug"), obj_data.get(slug_field))
+        obj_data = service._prepare_create(obj_data)
+        missing = repository.missing_required(obj_data)
+        if missing:
+            row_errors.append({"row": number, "errors": [{"loc": [f], "msg": "Field required", "type": "missing"} for f in missing]})
+            continue
+        obj_data["tenant_id"] = job.tenant_id
+        rows.append(obj_data)
+
+    load_rows(db, model, rows)
+    # COPY and executemany INSERT skip the counter listeners
+    repository.apply_stats_deltas([row.get("category") for row in rows], 1)
+
+    if service.portfolio_item_type is not None:
+        published = [row["slug"] for row in rows if row.get("publish_to_portfolio")]
+        if published:
+            # COPY returns no ids; this job's slugs are unique within the tenant
+            items = db.query(model).filter(model.tenant_id == job.tenant_id, model.slug.in_(published)).all()
+            sync_items_to_portfolio(db, items, service.portfolio_item_type)
+
+    job.processed_rows += len(chunk)
+    job.created_count += len(rows)
+    if row_errors:
+        _record_errors(job, row_errors)
+
+
+def run_import_job(db: Session, job_id: int, path: str) -> Optional[str]:
+    """Imports the file for one job. Returns the job's final status."""
+    job = db.get(ImportJob, job_id)
+    if job is None or job.status != "PENDING":
+        return None
+    service_class, schema, slug_field = IMPORT_RESOURCES[job.resource]
+    service = service_class(db)
+
+    job.status = "RUNNING"
+    job.started_at = _now()
+    db.commit()
+
+    try:
+        slugs = SlugAllocator(db, service.repository.model, job.tenant_id)
+        for chunk in _chunks(iter_rows(path, job.file_format), settings.IMPORT_CHUNK_SIZE):
+            _import_chunk(db, job, service, schema, slug_field, slugs, chunk)
+            db.commit()
+        job.status = "COMPLETED"
+    except Exception as e:
+        db.rollback()
+        logger.exception(f"Import job {job_id} failed")
+        job = db.get(ImportJob, job_id)
+        job.status = "FAILED"
+        job.last_error = str(e)[:1000]
+    job.finished_at = _now()
+    db.commit()
+    return job.status
+
+
+def run_import_job_in_background(session_factory, job_id: int, path: str):
+    """Entry point for FastAPI BackgroundTasks: own session, removes the upload afterwards."""
+    db = session_factory()
+    try:
+        run_import_job(db, job_id, path)
+    finally:
+        db.close()
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -24,6 +24,12 @@ class CompanyCareerService(BaseService[CompanyCareer, CompanyCareerRepository]):
                     obj_data[field] = [x.strip() for x in obj_data[field].split('\n') if x.strip()]
         return obj_data
 
+    def _prepare_create(self, obj_data):
+        return self._map_frontend_to_backend(obj_data)
+
+    def _prepare_update(self, obj_data):
+        return self._map_frontend_to_backend(obj_data)
+
     def create(self, obj_in, tenant_id: int):
         # Convert to dict
         obj_data = obj_in.dict()
@@ -2,24 +2,23 @@ from sqlalchemy.orm import Session
 from app.company.models.company_products_model import CompanyProduct
 from app.company.repositories.company_products_repository import CompanyProductRepository
 from app.company.services.base_service import BaseService
+from app.models.public_portfolio_model import PortfolioItemType
+from app.utils.slug import slugify
 
 class CompanyProductService(BaseService[CompanyProduct, CompanyProductRepository]):
+    portfolio_item_type = PortfolioItemType.PRODUCT
+
     def __init__(self, db: Session):
         repository = CompanyProductRepository(db)
         super().__init__(repository)
 
-    def create(self, obj_in, tenant_id: int):
-        if not obj_in.slug and obj_in.name:
-            import re
-            import unicodedata
-            
-            # Simple slugify implementation
-            value = str(obj_in.name)
-            value = unicodedata.normalize('NFKD', value).encode('ascii', 'ignore').decode('ascii')
-            value = re.sub(r'[^\w\s-]', '', value.lower())
-            obj_in.slug = re.sub(r'[-\s]+', '-', value).strip('-')
+    def _prepare_create(self, obj_data):
+        if not obj_data.get('slug') and obj_data.get('name'):
+            obj_data['slug'] = slugify(obj_data['name'])
+        return obj_data
 
-        obj = super().create(obj_in, tenant_id)
+    def create(self, obj_in, tenant_id: int):
+        obj = super().create(self._prepare_create(obj_in.dict()), tenant_id)
         from app.services.portfolio_sync_service import sync_item_to_portfolio
         from app.models.public_portfolio_model import PortfolioItemType
         sync_item_to_portfolio(self.repository.db, obj, PortfolioItemType.PRODUCT)
@@ -2,24 +2,23 @@ from sqlalchemy.orm import Session
 from app.company.models.company_services_model import CompanyService
 from app.company.repositories.company_services_repository import CompanyServiceRepository
 from app.company.services.base_service import BaseService
+from app.models.public_portfolio_model import PortfolioItemType
+from app.utils.slug import slugify
 
 class CompanyServiceService(BaseService[CompanyService, CompanyServiceRepository]):
+    portfolio_item_type = PortfolioItemType.SERVICE
+
     def __init__(self, db: Session):
         repository = CompanyServiceRepository(db)
         super().__init__(repository)
 
+    def _prepare_create(self, obj_data):
+        if not obj_data.get('slug') and obj_data.get('title'):
+            obj_data['slug'] = slugify(obj_data['title'])
+        return obj_data
+
     def create(self, obj_in, tenant_id: int):
-        if not obj_in.slug and obj_in.title:
-            import re
-            import unicodedata
-            
-            # Simple slugify implementation
-            value = str(obj_in.title)
-            value = unicodedata.normalize('NFKD', value).encode('ascii', 'ignore').decode('ascii')
-            value = re.sub(r'[^\w\s-]', '', value.lower())
-            obj_in.slug = re.sub(r'[-\s]+', '-', value).strip('-')
-        
-        obj = super().create(obj_in, tenant_id)
+        obj = super().create(self._prepare_create(obj_in.dict()), tenant_id)
         from app.services.portfolio_sync_service import sync_item_to_portfolio
         from app.models.public_portfolio_model import PortfolioItemType
         sync_item_to_portfolio(self.repository.db, obj, PortfolioItemType.SERVICE)
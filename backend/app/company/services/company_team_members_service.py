@@ -2,8 +2,11 @@ from sqlalchemy.orm import Session
 from app.company.models.company_team_members_model import CompanyTeamMember
 from app.company.repositories.company_team_members_repository import CompanyTeamMemberRepository
 from app.company.services.base_service import BaseService
+from app.models.public_portfolio_model import PortfolioItemType
 
 class CompanyTeamMemberService(BaseService[CompanyTeamMember, CompanyTeamMemberRepository]):
+    portfolio_item_type = PortfolioItemType.TEAM_MEMBER
+
     def __init__(self, db: Session):
         repository = CompanyTeamMemberRepository(db)
         super().__init__(repository)
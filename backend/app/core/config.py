@@ -35,6 +35,7 @@ class Settings(BaseSettings):
     # Razorpay
     RAZORPAY_KEY_ID: str = os.getenv("RAZORPAY_KEY_ID", "")
     RAZORPAY_KEY_SECRET: str = os.getenv("RAZORPAY_KEY_SECRET", "")
+    RAZORPAY_WEBHOOK_SECRET: str = os.getenv("RAZORPAY_WEBHOOK_SECRET", "")
     
     # Stripe
     STRIPE_SECRET_KEY: str = os.getenv("STRIPE_SECRET_KEY", "")
@@ -50,10 +51,68 @@ class Settings(BaseSettings):
     # Backend URL for webhooks
     BACKEND_URL: str = os.getenv("BACKEND_URL", "http://localhost:8000")
     
+    # Payment gateway HTTP: pooled keep-alive connections, timeouts, retries, circuit breaker
+    GATEWAY_CONNECT_TIMEOUT: float = float(os.getenv("GATEWAY_CONNECT_TIMEOUT", "3.05"))
+    GATEWAY_READ_TIMEOUT: float = float(os.getenv("GATEWAY_READ_TIMEOUT", "10"))
+    GATEWAY_MAX_RETRIES: int = int(os.getenv("GATEWAY_MAX_RETRIES", "2"))
+    GATEWAY_POOL_SIZE: int = int(os.getenv("GATEWAY_POOL_SIZE", "10"))
+    GATEWAY_BREAKER_THRESHOLD: int = int(os.getenv("GATEWAY_BREAKER_THRESHOLD", "5"))
+    GATEWAY_BREAKER_RESET_SECONDS: float = float(os.getenv("GATEWAY_BREAKER_RESET_SECONDS", "30"))
+    
+    # Webhook event processing: retries with exponential backoff, then FAILED
+    WEBHOOK_MAX_ATTEMPTS: int = int(os.getenv("WEBHOOK_MAX_ATTEMPTS", "5"))
+    WEBHOOK_RETRY_BASE_SECONDS: int = int(os.getenv("WEBHOOK_RETRY_BASE_SECONDS", "30"))
+    WEBHOOK_POLL_SECONDS: int = int(os.getenv("WEBHOOK_POLL_SECONDS", "10"))
+    
     # Subscription Settings
     DEFAULT_SUBSCRIPTION_DAYS: int = 30
     TRIAL_PERIOD_DAYS: int = 7
     
+    # Password hashing: bcrypt cost, worker processes, and in-flight cap before 429
+    BCRYPT_ROUNDS: int = int(os.getenv("BCRYPT_ROUNDS", "12"))
+    PASSWORD_HASH_WORKERS: int = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+    PASSWORD_HASH_MAX_PENDING: int = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "16"))
+    
+    # Login throttling: failures per sliding window, then exponential backoff
+    LOGIN_THROTTLE_WINDOW_SECONDS: int = int(os.getenv("LOGIN_THROTTLE_WINDOW_SECONDS", "900"))
+    LOGIN_MAX_FAILURES_PER_USER_IP: int = int(os.getenv("LOGIN_MAX_FAILURES_PER_USER_IP", "5"))
+    LOGIN_MAX_FAILURES_PER_IP: int = int(os.getenv("LOGIN_MAX_FAILURES_PER_IP", "50"))
+    LOGIN_MAX_FAILURES_PER_USER: int = int(os.getenv("LOGIN_MAX_FAILURES_PER_USER", "50"))
+    LOGIN_BACKOFF_BASE_SECONDS: float = float(os.getenv("LOGIN_BACKOFF_BASE_SECONDS", "2"))
+    LOGIN_BACKOFF_MAX_SECONDS: float = float(os.getenv("LOGIN_BACKOFF_MAX_SECONDS", "300"))
+    # Optional: share counters between workers (requires the redis package)
+    LOGIN_THROTTLE_REDIS_URL: str = os.getenv("LOGIN_THROTTLE_REDIS_URL", "")
+    
+    # How long a user's token version is trusted from memory before re-reading it
+    TOKEN_VERSION_CACHE_SECONDS: int = int(os.getenv("TOKEN_VERSION_CACHE_SECONDS", "30"))
+    
+    # Revoked-token filter: how often each process pulls new revocations,
+    # how often it rebuilds (dropping expired jtis), and its initial capacity
+    REVOKED_TOKEN_SYNC_SECONDS: int = int(os.getenv("REVOKED_TOKEN_SYNC_SECONDS", "5"))
+    REVOKED_TOKEN_REBUILD_SECONDS: int = int(os.getenv("REVOKED_TOKEN_REBUILD_SECONDS", "3600"))
+    REVOKED_TOKEN_FILTER_CAPACITY: int = int(os.getenv("REVOKED_TOKEN_FILTER_CAPACITY", "100000"))
+    
+    # Listing totals: exact COUNT(*) OVER () up to this many rows, planner estimate above
+    EXACT_TOTAL_THRESHOLD: int = int(os.getenv("EXACT_TOTAL_THRESHOLD", "5000"))
+    
+    # Platform counters: how often stored counters are recomputed from the tables
+    PLATFORM_STATS_RECONCILE_SECONDS: int = int(os.getenv("PLATFORM_STATS_RECONCILE_SECONDS", "3600"))
+    
+    # Company modules: most items accepted by one bulk create/update/delete request
+    BULK_MAX_ITEMS: int = int(os.getenv("BULK_MAX_ITEMS", "1000"))
+    
+    # Catalog file imports: upload size cap, rows validated and loaded per
+    # transaction, and how many row errors a job keeps for the tenant to see
+    IMPORT_MAX_UPLOAD_MB: int = int(os.getenv("IMPORT_MAX_UPLOAD_MB", "100"))
+    IMPORT_CHUNK_SIZE: int = int(os.getenv("IMPORT_CHUNK_SIZE", "2000"))
+    IMPORT_MAX_STORED_ERRORS: int = int(os.getenv("IMPORT_MAX_STORED_ERRORS", "200"))
+    
+    # Streaming exports: rows fetched from the server-side cursor per batch
+    EXPORT_BATCH_SIZE: int = int(os.getenv("EXPORT_BATCH_SIZE", "1000"))
+    
+    # Startup: log indexes the models declare but the database lacks (or has invalid)
+    CHECK_INDEXES_ON_STARTUP: bool = os.getenv("CHECK_INDEXES_ON_STARTUP", "true").lower() == "true"
+    
     class Config:
         env_file = ".env"
 
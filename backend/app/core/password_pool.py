@@ -0,0 +1,74 @@
+"""
+Bounded process pool for CPU-heavy password hashing.
+
+bcrypt runs in worker processes so a burst of logins cannot starve the
+request threadpool (or the GIL). Callers beyond `max_pending` in flight
+get PasswordHasherBusy immediately instead of queueing behind the burst.
+"""
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
+
+class PasswordHasherBusy(Exception):
+    """Too many hashing jobs in flight; the caller should retry shortly."""
+    pass
+
+
+class BoundedProcessPool:
+    """
+    ProcessPoolExecutor with a cap on in-flight jobs.
+    workers=0 runs jobs inline (useful for scripts and tests).
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self._in_flight = 0
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn: workers must not inherit the parent's threads, sockets or DB connections
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    def run(self, fn: Callable[..., Any], *args) -> Any:
+        """Runs fn(*args) in a worker process and waits for the result."""
+        if self.workers <= 0:
+            return fn(*args)
+
+        with self._lock:
+            if self._in_flight >= self.max_pending:
+                raise PasswordHasherBusy()
+            self._in_flight += 1
+            executor = self._get_executor()
+        try:
+            try:
+                return executor.submit(fn, *args).result()
+            except BrokenProcessPool:
+                # A worker died; start a fresh pool and retry once
+                with self._lock:
+                    if self._executor is executor:
+                        self._executor = None
+                    executor = self._get_executor()
+                return executor.submit(fn, *args).result()
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -1,9 +1,46 @@
+from typing import Optional, Tuple
 from passlib.context import CryptContext
+from app.core.config import settings
+from app.core.password_pool import BoundedProcessPool, PasswordHasherBusy
+
+# Hashes below BCRYPT_ROUNDS are flagged for upgrade on the next successful login
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__min_rounds=settings.BCRYPT_ROUNDS
+)
+
+password_pool = BoundedProcessPool(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING
+)
+
+
+# Run inside pool workers; must stay module-level so they can be pickled
+def _hash(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+def _verify_and_update(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    return pwd_context.verify_and_update(plain_password, hashed_password)
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    return verify_and_update_password(plain_password, hashed_password)[0]
+
+
+def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """
+    Returns (valid, new_hash). new_hash is set when the stored hash uses
+    an outdated scheme or cost and should be replaced.
+    Raises PasswordHasherBusy when the hashing pool is saturated.
+    """
+    if not hashed_password:
+        return False, None
+    return password_pool.run(_verify_and_update, plain_password, hashed_password)
+
 
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+    """Raises PasswordHasherBusy when the hashing pool is saturated."""
+    return password_pool.run(_hash, password)
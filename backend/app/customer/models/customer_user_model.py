@@ -26,6 +26,13 @@ class CustomerUser(User):
     customer_type = relationship("CustomerType", back_populates="customers")
     subscription = relationship("CustomerSubscription", back_populates="customer", uselist=False)
     company_info = relationship("CompanyInfo", back_populates="customer", uselist=False)
+    # The ACTIVE subscription (assign_subscription cancels any other); read-only
+    active_subscription = relationship(
+        "CustomerSubscription",
+        primaryjoin="and_(CustomerSubscription.tenant_id == CustomerUser.id, CustomerSubscription.status == 'ACTIVE')",
+        uselist=False,
+        viewonly=True
+    )
     
     __mapper_args__ = {
         "polymorphic_identity": "customer",
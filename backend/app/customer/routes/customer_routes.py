@@ -6,9 +6,7 @@ from sqlalchemy.orm import Session
 from app.database.connection import get_db
 from pydantic import BaseModel
 from typing import Optional
-from passlib.context import CryptContext
-
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.core.security import verify_password, get_password_hash
 
 router = APIRouter(
     prefix="/customer",
@@ -25,33 +23,29 @@ class PasswordChange(BaseModel):
     new_password: str
 
 @router.get("/home")
-def customer_home(user: User = Depends(has_role("customer")), db: Session = Depends(get_db)):
-    # Get the full customer user details from customer_users table
-    customer = db.query(CustomerUser).filter(CustomerUser.id == user.id).first()
-    
+def customer_home(user: User = Depends(has_role("customer"))):
+    # get_current_user already loaded the customer_users columns and roles
     return {
         "message": "Welcome to the Customer Home Page",
         "user": {
             "email": user.email,
             "id": user.id,
             "roles": [r.name for r in user.roles],
-            "full_name": customer.full_name if customer else None,
-            "phone_number": customer.phone_number if customer else None,
+            "full_name": user.full_name,
+            "phone_number": user.phone_number,
         }
     }
 
 @router.get("/profile")
-def get_profile(user: User = Depends(has_role("customer")), db: Session = Depends(get_db)):
+def get_profile(user: User = Depends(has_role("customer"))):
     """Get current customer's profile"""
-    customer = db.query(CustomerUser).filter(CustomerUser.id == user.id).first()
-    
     return {
         "id": user.id,
         "email": user.email,
-        "full_name": customer.full_name if customer else None,
-        "phone_number": customer.phone_number if customer else None,
+        "full_name": user.full_name,
+        "phone_number": user.phone_number,
         "tenant_id": user.tenant_id,
-        "created_at": user.created_at,
+        "created_at": getattr(user, "created_at", None),
         "is_active": user.is_active,
     }
 
@@ -62,10 +56,10 @@ def update_profile(
     db: Session = Depends(get_db)
 ):
     """Update current customer's profile"""
-    customer = db.query(CustomerUser).filter(CustomerUser.id == user.id).first()
-    
-    if not customer:
+    # The dependency's user is the customer row, loaded on this request's session
+    if not isinstance(user, CustomerUser):
         raise HTTPException(status_code=404, detail="Customer profile not found")
+    customer = user
     
     if profile_data.full_name is not None:
         customer.full_name = profile_data.full_name
@@ -73,7 +67,6 @@ def update_profile(
         customer.phone_number = profile_data.phone
     
     db.commit()
-    db.refresh(customer)
     
     return {
         "message": "Profile updated successfully",
@@ -93,7 +86,7 @@ def change_password(
 ):
     """Change current customer's password"""
     # Verify current password
-    if not pwd_context.verify(password_data.current_password, user.hashed_password):
+    if not verify_password(password_data.current_password, user.hashed_password):
         raise HTTPException(status_code=400, detail="Current password is incorrect")
     
     # Validate new password
@@ -101,7 +94,7 @@ def change_password(
         raise HTTPException(status_code=400, detail="New password must be at least 8 characters")
     
     # Hash and update password
-    user.hashed_password = pwd_context.hash(password_data.new_password)
+    user.hashed_password = get_password_hash(password_data.new_password)
     db.commit()
     
     return {"message": "Password changed successfully"}
@@ -1,6 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Literal, Optional
 from datetime import datetime, timezone
 
 from app.database.connection import get_db
@@ -16,6 +17,7 @@ from app.subscriptions.schemas import (
 )
 from app.subscriptions.service import SubscriptionService
 from app.payments.models import PaymentHistory
+from app.utils.export import export_response
 
 router = APIRouter(
     prefix="/customer/subscription",
@@ -86,8 +88,8 @@ def initiate_plan_upgrade(
     
     # Create payment order based on gateway
     if request.payment_gateway == "razorpay":
-        from app.payments.razorpay_service import RazorpayService
-        payment_service = RazorpayService()
+        from app.payments.razorpay_service import get_razorpay_service
+        payment_service = get_razorpay_service()
         
         order = payment_service.create_order(
             amount=plan.price,
@@ -105,8 +107,8 @@ def initiate_plan_upgrade(
         )
     
     elif request.payment_gateway == "stripe":
-        from app.payments.stripe_service import StripeService
-        payment_service = StripeService()
+        from app.payments.stripe_service import get_stripe_service
+        payment_service = get_stripe_service()
         
         session = payment_service.create_checkout_session(
             amount=plan.price,
@@ -174,6 +176,27 @@ def get_my_payment_history(
     
     return payments
 
+@router.get("/payment-history/export")
+def export_my_payment_history(
+    file_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+    compress: Optional[Literal["gzip"]] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(has_role("customer"))
+):
+    """
+    Stream the customer's whole payment history as NDJSON or CSV (optionally gzipped).
+    Gateway metadata is left out.
+    """
+    from app.subscriptions.models import CustomerSubscription
+
+    columns = [c for c in PaymentHistory.__table__.columns if c.key != "payment_metadata"]
+    stmt = select(*columns).join(
+        CustomerSubscription, CustomerSubscription.id == PaymentHistory.subscription_id
+    ).where(
+        CustomerSubscription.tenant_id == current_user.id
+    ).order_by(PaymentHistory.id)
+    return export_response(db, stmt, "payment-history", file_format, compress)
+
 @router.get("/check-access/{module_name}")
 def check_module_access(
     module_name: str,
@@ -245,6 +268,7 @@ def confirm_demo_payment(
     
     # Use raw SQL to insert payment - bypasses ORM field constraints
     from sqlalchemy import text
+    from app.admin.services.dashboard_rollup_service import record_payment
     payment_date = datetime.now(timezone.utc)
     
     try:
@@ -270,6 +294,8 @@ def confirm_demo_payment(
                 "created_at": payment_date  # Add created_at for frontend
             }
         )
+        # Raw insert skips the ORM listeners; record the revenue explicitly
+        record_payment(db.connection(), amount, "demo", "INR", payment_date)
         db.commit()
     except Exception as e:
         db.rollback()
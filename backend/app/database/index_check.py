@@ -0,0 +1,62 @@
+"""
+Startup check: indexes declared on the models but missing from the database.
+
+create_all only builds indexes together with new tables, so on an existing
+database the indexes added later come from migrations. This reports any
+whose migration was never applied, plus (on PostgreSQL) indexes left
+INVALID by an interrupted CREATE INDEX CONCURRENTLY.
+"""
+import logging
+from typing import List, Tuple
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+
+from app.database.base import Base
+
+logger = logging.getLogger(__name__)
+
+
+def _invalid_indexes(connection) -> set:
+    rows = connection.execute(text(
+        "SELECT c.relname FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+        "WHERE NOT i.indisvalid"
+    ))
+    return {name for (name,) in rows}
+
+
+def missing_indexes(engine: Engine) -> List[Tuple[str, str]]:
+    """(table, index) pairs for model indexes absent or invalid in the database."""
+    with engine.connect() as connection:
+        inspector = inspect(connection)
+        tables = set(inspector.get_table_names())
+        invalid = _invalid_indexes(connection) if engine.dialect.name == "postgresql" else set()
+
+        missing = []
+        for table in Base.metadata.sorted_tables:
+            # Tables create_all has not made yet get their indexes with them
+            if table.name not in tables or not table.indexes:
+                continue
+            present = {index["name"] for index in inspector.get_indexes(table.name)} - invalid
+            for index in sorted(table.indexes, key=lambda i: i.name):
+                if index.name not in present:
+                    missing.append((table.name, index.name))
+        return missing
+
+
+def report_missing_indexes(engine: Engine) -> List[Tuple[str, str]]:
+    """Logs a warning naming each missing index; returns them."""
+    try:
+        missing = missing_indexes(engine)
+    except Exception as e:
+        logger.warning(f"Index check skipped: {e}")
+        return []
+    if missing:
+        names = ", ".join(f"{table}.{index}" for table, index in missing)
+        logger.warning(
+            f"{len(missing)} declared indexes are missing or invalid: {names}. "
+            "Run: python manage.py migrate"
+        )
+    else:
+        logger.info("Index check: all declared indexes are present")
+    return missing
@@ -0,0 +1,185 @@
+"""
+Versioned schema migrations.
+
+Each migration is a module in app/database/migrations named
+`v<NNNN>_<name>.py` defining:
+- DESCRIPTION: one line, recorded with the version
+- upgrade(connection): applies the change
+- TRANSACTIONAL = False (optional): run on an autocommit connection, for
+  statements that cannot run in a transaction (CREATE INDEX CONCURRENTLY)
+
+Applied versions are recorded in the schema_version table, one row per
+migration. A migration states its own DDL (or, like the baseline, a
+frozen table snapshot) and never reads the live models, so it does the
+same thing in every later build. Migrations must be idempotent (IF NOT
+EXISTS, add-if-missing), so databases built by the old create_all +
+hand-run scripts can adopt the runner.
+
+App startup only compares the recorded version with HEAD (one query).
+"""
+import importlib
+import logging
+import pkgutil
+import re
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, func, inspect, select, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.schema import CreateIndex
+
+from app.database import migrations
+
+logger = logging.getLogger(__name__)
+
+# Kept out of Base.metadata: the runner owns this table
+schema_version = Table(
+    "schema_version",
+    MetaData(),
+    Column("version", Integer, primary_key=True, autoincrement=False),
+    Column("description", String(255), nullable=False),
+    Column("applied_at", DateTime(timezone=True), nullable=False),
+)
+
+MODULE_NAME = re.compile(r"^v(\d{4})_\w+$")
+
+
+class SchemaOutOfDate(RuntimeError):
+    """The database is behind the migrations this build expects."""
+    pass
+
+
+def discover() -> List[Tuple[int, object]]:
+    """(version, module) for every migration, in version order."""
+    found = []
+    for info in pkgutil.iter_modules(migrations.__path__):
+        match = MODULE_NAME.match(info.name)
+        if match:
+            found.append((int(match.group(1)), importlib.import_module(f"{migrations.__name__}.{info.name}")))
+    found.sort(key=lambda item: item[0])
+    versions = [version for version, _ in found]
+    if len(set(versions)) != len(versions):
+        raise RuntimeError(f"Duplicate migration versions: {versions}")
+    return found
+
+
+def head_version() -> int:
+    found = discover()
+    return found[-1][0] if found else 0
+
+
+def current_version(engine: Engine) -> Optional[int]:
+    """Latest applied version; 0 before any migration; None if the table is missing."""
+    try:
+        with engine.connect() as connection:
+            return connection.execute(select(func.coalesce(func.max(schema_version.c.version), 0))).scalar()
+    except DBAPIError:
+        return None
+
+
+def upgrade(engine: Engine, target: Optional[int] = None) -> List[int]:
+    """Applies pending migrations up to `target` (default: HEAD). Returns the versions applied."""
+    schema_version.create(engine, checkfirst=True)
+    current = current_version(engine) or 0
+    applied = []
+
+    for version, module in discover():
+        if version <= current or (target is not None and version > target):
+            continue
+        logger.info(f"Applying migration {version:04d}: {module.DESCRIPTION}")
+        record = schema_version.insert().values(
+            version=version, description=module.DESCRIPTION, applied_at=datetime.now(timezone.utc)
+        )
+        if getattr(module, "TRANSACTIONAL", True):
+            with engine.begin() as connection:
+                module.upgrade(connection)
+                connection.execute(record)
+        else:
+            with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+                module.upgrade(connection)
+            with engine.begin() as connection:
+                connection.execute(record)
+        applied.append(version)
+    return applied
+
+
+def check_schema_version(engine: Engine) -> int:
+    """
+    Startup check: raises SchemaOutOfDate unless the database is at least at
+    HEAD. A newer database (a later build already migrated it) is accepted,
+    so old and new instances can overlap during a rolling restart.
+    """
+    head = head_version()
+    current = current_version(engine)
+    if current is None or current < head:
+        raise SchemaOutOfDate(
+            f"Database schema is at version {current or 0}, this build needs {head}. "
+            "Run: python manage.py migrate"
+        )
+    if current > head:
+        logger.warning(f"Database schema version {current} is newer than this build ({head})")
+    return current
+
+
+# ============ Helpers for migrations ============
+
+def add_missing_columns(connection: Connection, tables) -> List[str]:
+    """
+    Adds model columns missing from existing tables, as nullable columns
+    (with their server default, if any). Returns "table.column" for each.
+    """
+    inspector = inspect(connection)
+    existing_tables = set(inspector.get_table_names())
+    preparer = connection.dialect.identifier_preparer
+    added = []
+    for table in tables:
+        if table.name not in existing_tables:
+            continue
+        present = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in present:
+                continue
+            column_type = column.type.compile(dialect=connection.dialect)
+            statement = f"ALTER TABLE {preparer.format_table(table)} ADD COLUMN {preparer.format_column(column)} {column_type}"
+            if column.server_default is not None and hasattr(column.server_default, "arg"):
+                default = column.server_default.arg
+                if isinstance(default, str):
+                    statement += f" DEFAULT {default}"
+                # SQLite only accepts constant defaults on ADD COLUMN (no now())
+                elif connection.dialect.name != "sqlite":
+                    statement += f" DEFAULT {default.compile(dialect=connection.dialect)}"
+            connection.exec_driver_sql(statement)
+            added.append(f"{table.name}.{column.name}")
+    return added
+
+
+def create_missing_indexes(connection: Connection, tables) -> List[str]:
+    """
+    CREATE INDEX IF NOT EXISTS for every index declared on existing tables;
+    CONCURRENTLY on PostgreSQL, where INVALID leftovers of an interrupted
+    build are dropped and rebuilt. Needs an autocommit connection there.
+    """
+    dialect = connection.dialect
+    existing_tables = set(inspect(connection).get_table_names())
+    postgresql = dialect.name == "postgresql"
+    invalid = set()
+    if postgresql:
+        invalid = {name for (name,) in connection.execute(text(
+            "SELECT c.relname FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid WHERE NOT i.indisvalid"
+        ))}
+
+    created = []
+    for table in tables:
+        if table.name not in existing_tables:
+            continue
+        for index in sorted(table.indexes, key=lambda i: i.name):
+            if index.name in invalid:
+                connection.exec_driver_sql(f"DROP INDEX CONCURRENTLY IF EXISTS {index.name}")
+            statement = str(CreateIndex(index, if_not_exists=True).compile(dialect=dialect))
+            if postgresql:
+                statement = statement.replace("CREATE INDEX ", "CREATE INDEX CONCURRENTLY ", 1)
+                statement = statement.replace("CREATE UNIQUE INDEX ", "CREATE UNIQUE INDEX CONCURRENTLY ", 1)
+            connection.exec_driver_sql(statement)
+            created.append(index.name)
+    return created
@@ -0,0 +1,7 @@
+"""
+Schema migrations, applied in version order by app.database.migrate.
+
+Add a change as the next `v<NNNN>_<name>.py`; never edit one that has shipped.
+Write its DDL out (or snapshot the tables it creates) rather than reading
+Base.metadata, which changes with the models.
+"""
@@ -0,0 +1,827 @@
+"""
+Baseline: the schema as the models declared it when the runner shipped,
+every table with its indexes, frozen here so later model changes do not
+alter it. Changes since go in later migrations.
+
+Existing tables are left alone (checkfirst), so a database created by the
+old create_all at import adopts this version as is.
+"""
+from sqlalchemy import (
+    ARRAY, BigInteger, Boolean, CheckConstraint, Column, Date, DateTime, Float, ForeignKey,
+    Index, Integer, JSON, MetaData, String, Table, Text, UniqueConstraint, func, text
+)
+
+DESCRIPTION = "Baseline schema from the models"
+
+metadata = MetaData()
+
+categories = Table(
+    "categories",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("name", String(100), nullable=False),
+    Column("slug", String(100), nullable=False),
+    Column("description", Text),
+    Column("icon", String(50)),
+    Column("color", String(50)),
+    Column("image_url", String(500)),
+    Column("is_active", Boolean),
+    Column("display_order", Integer),
+    Column("created_at", DateTime(timezone=True), server_default=func.now()),
+    Column("updated_at", DateTime(timezone=True)),
+)
+Index("ix_categories_id", categories.c.id)
+Index("ix_categories_name", categories.c.name, unique=True)
+Index("ix_categories_slug", categories.c.slug, unique=True)
+
+category_stats = Table(
+    "category_stats",
+    metadata,
+    Column("category_name", String(100), primary_key=True),
+    Column("product_count", Integer, nullable=False),
+    Column("service_count", Integer, nullable=False),
+    Column("updated_at", DateTime(timezone=True), server_default=func.now()),
+)
+
+customer_types = Table(
+    "customer_types",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("name", String, nullable=False),
+    Column("description", Text),
+    Column("is_default", Boolean),
+    Column("is_active", Boolean),
+)
+Index("ix_customer_types_id", customer_types.c.id)
+Index("ix_customer_types_name", customer_types.c.name, unique=True)
+
+dashboard_rollups = Table(
+    "dashboard_rollups",
+    metadata,
+    Column("granularity", String(10), primary_key=True),
+    Column("bucket_start", DateTime, primary_key=True),
+    Column("metric", String(50), primary_key=True),
+    Column("dimension", String(100), primary_key=True),
+    Column("currency", String(10), primary_key=True),
+    Column("value", Float, nullable=False),
+    Column("count", Integer, nullable=False),
+    Column("updated_at", DateTime(timezone=True), server_default=func.now()),
+)
+Index(
+    "ix_dashboard_rollups_series",
+    dashboard_rollups.c.metric,
+    dashboard_rollups.c.granularity,
+    dashboard_rollups.c.bucket_start,
+)
+
+permissions = Table(
+    "permissions",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("name", String),
+    Column("description", String),
+)
+Index("ix_permissions_id", permissions.c.id)
+Index("ix_permissions_name", permissions.c.name, unique=True)
+
+platform_stats = Table(
+    "platform_stats",
+    metadata,
+    Column("name", String(50), primary_key=True),
+    Column("value", BigInteger, nullable=False),
+    Column("updated_at", DateTime(timezone=True), server_default=func.now()),
+)
+
+revoked_tokens = Table(
+    "revoked_tokens",
+    metadata,
+    Column("jti", String(64), primary_key=True),
+    Column("user_id", Integer),
+    Column("expires_at", DateTime(timezone=True), nullable=False),
+    Column("revoked_at", DateTime(timezone=True), nullable=False, server_default=func.now()),
+)
+Index("ix_revoked_tokens_expires_at", revoked_tokens.c.expires_at)
+Index("ix_revoked_tokens_revoked_at", revoked_tokens.c.revoked_at)
+Index("ix_revoked_tokens_user_id", revoked_tokens.c.user_id)
+
+roles = Table(
+    "roles",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("name", String),
+)
+Index("ix_roles_id", roles.c.id)
+Index("ix_roles_name", roles.c.name, unique=True)
+
+site_settings = Table(
+    "site_settings",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("contact_email", String(255)),
+    Column("contact_phone", String(50)),
+    Column("contact_address", String(500)),
+    Column("facebook_url", String(500)),
+    Column("twitter_url", String(500)),
+    Column("linkedin_url", String(500)),
+    Column("instagram_url", String(500)),
+    Column("youtube_url", String(500)),
+    Column("stats_buyers", Integer),
+    Column("stats_sellers", Integer),
+    Column("stats_products", Integer),
+    Column("stats_inquiries", Integer),
+    Column("smtp_host", String(255)),
+    Column("smtp_port", Integer),
+    Column("smtp_username", String(255)),
+    Column("smtp_password", String(255)),
+    Column("smtp_encryption", String(50)),
+    Column("smtp_from_email", String(255)),
+    Column("smtp_from_name", String(255)),
+    Column("quick_links", JSON),
+    Column("support_links", JSON),
+    Column("about_us_content", JSON),
+    Column("hero_content", JSON),
+    Column("help_center_content", JSON),
+    Column("become_seller_content", JSON),
+    Column("created_at", DateTime(timezone=True), server_default=func.now()),
+    Column("updated_at", DateTime(timezone=True)),
+)
+Index("ix_site_settings_id", site_settings.c.id)
+
+states = Table(
+    "states",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("name", String, nullable=False),
+    Column("prefix_code", String, nullable=False),
+    Column("is_active", Boolean),
+)
+Index("ix_states_id", states.c.id)
+Index("ix_states_name", states.c.name, unique=True)
+Index("ix_states_prefix_code", states.c.prefix_code, unique=True)
+
+subscription_plans = Table(
+    "subscription_plans",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("name", String(100), nullable=False),
+    Column("description", Text),
+    Column("price", Float, nullable=False),
+    Column("currency", String(10)),
+    Column("duration_days", Integer),
+    Column("features", JSON),
+    Column("is_default", Boolean),
+    Column("is_active", Boolean),
+    Column("trial_days", Integer),
+    Column("created_at", DateTime(timezone=True), server_default=func.now()),
+    Column("updated_at", DateTime(timezone=True)),
+)
+Index("ix_subscription_plans_id", subscription_plans.c.id)
+Index("ix_subscription_plans_name", subscription_plans.c.name, unique=True)
+
+users = Table(
+    "users",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("email", String),
+    Column("phone_number", String),
+    Column("hashed_password", String),
+    Column("is_active", Boolean),
+    Column("is_superuser", Boolean),
+    Column("is_approved", Boolean),
+    Column("approval_status", String),
+    Column("user_type", String),
+    Column("full_name", String(255)),
+    Column("tenant_id", Integer),
+    Column("token_version", Integer, nullable=False, server_default="0"),
+    CheckConstraint("(email IS NOT NULL) OR (phone_number IS NOT NULL)", name="email_or_phone_required"),
+)
+Index("ix_users_email", users.c.email, unique=True)
+Index("ix_users_id", users.c.id)
+Index("ix_users_phone_number", users.c.phone_number, unique=True)
+
+webhook_events = Table(
+    "webhook_events",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("gateway", String(20), nullable=False),
+    Column("event_id", String(255), nullable=False),
+    Column("event_type", String(100)),
+    Column("payload", JSON, nullable=False),
+    Column("status", String(20), nullable=False),
+    Column("attempts", Integer, nullable=False),
+    Column("last_error", Text),
+    Column("next_attempt_at", DateTime(timezone=True)),
+    Column("processed_at", DateTime(timezone=True)),
+    Column("created_at", DateTime(timezone=True), server_default=func.now()),
+    Column("updated_at", DateTime(timezone=True)),
+    UniqueConstraint("gateway", "event_id", name="uq_webhook_events_gateway_event"),
+)
+Index("ix_webhook_events_due", webhook_events.c.status, webhook_events.c.next_attempt_at)
+Index("ix_webhook_events_id", webhook_events.c.id)
+
+admin_users = Table(
+    "admin_users",
+    metadata,
+    Column("id", Integer, ForeignKey("users.id"), primary_key=True),
+    Column("department", String),
+    Column("position", String),
+    Column("employee_id", String),
+    Column("created_at", DateTime(timezone=True), server_default=func.now()),
+    Column("updated_at", DateTime(timezone=True)),
+    Column("last_login", DateTime(timezone=True)),
+    UniqueConstraint("employee_id"),
+)
+
+customer_users = Table(
+    "customer_users",
+    metadata,
+    Column("id", Integer, ForeignKey("users.id"), primary_key=True),
+    Column("customer_type_id", Integer, ForeignKey("customer_types.id")),
+    Column("created_at", DateTime(timezone=True), server_default=func.now()),
+    Column("updated_at", DateTime(timezone=True)),
+    Column("last_login", DateTime(timezone=True)),
+)
+
+districts = Table(
+    "districts",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("name", String, nullable=False),
+    Column("prefix_code", String, nullable=False),
+    Column("state_id", Integer, ForeignKey("states.id"), nullable=False),
+    Column("is_active", Boolean),
+)
+Index("ix_districts_id", districts.c.id)
+Index("ix_districts_name", districts.c.name)
+Index("ix_districts_prefix_code", districts.c.prefix_code, unique=True)
+
+notifications = Table(
+    "notifications",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("user_id", Integer, ForeignKey("users.id")),
+    Column("title", String(255), nullable=False),
+    Column("message", Text, nullable=False),
+    Column("type", String(50)),
+    Column("is_read", Boolean),
+    Column("is_global", Boolean),
+    Column("created_at", DateTime(timezone=True), server_default=func.now()),
+    Column("updated_at", DateTime(timezone=True)),
+)
+Index("ix_notifications_id", notifications.c.id)
+
+role_permissions = Table(
+    "role_permissions",
+    metadata,
+    Column("role_id", Integer, ForeignKey("roles.id")),
+    Column("permission_id", Integer, ForeignKey("permissions.id")),
+)
+
+user_roles = Table(
+    "user_roles",
+    metadata,
+    Column("user_id", Integer, ForeignKey("users.id")),
+    Column("role_id", Integer, ForeignKey("roles.id")),
+)
+
+company_blog_posts = Table(
+    "company_blog_posts",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("tenant_id", Integer, ForeignKey("customer_users.id"), nullable=False),
+    Column("title", String(255), nullable=False),
+    Column("slug", String(255), nullable=False),
+    Column("excerpt", Text),
+    Column("content", Text, nullable=False),
+    Column("featured_image_url", String(500)),
+    Column("author", String(255)),
+    Column("category", String(100)),
+    Column("meta_description", String(500)),
+    Column("tags", String(500)),
+    Column("published_at", DateTime(timezone=True)),
+    Column("status", String(20)),
+    Column("created_at", DateTime(timezone=True), server_default=func.now()),
+    Column("updated_at", DateTime(timezone=True)),
+)
+Index("ix_company_blog_posts_id", company_blog_posts.c.id)
+Index(
+    "ix_company_blog_posts_published_at",
+    company_blog_posts.c.published_at.desc(),
+    postgresql_where=text("status = 'published'"),
+    sqlite_where=text("status = 'published'"),
+)
+Index(
+    "ix_company_blog_posts_published_category",
+    company_blog_posts.c.category,
+    company_blog_posts.c.published_at.desc(),
+    postgresql_where=text("status = 'published'"),
+    sqlite_where=text("status = 'published'"),
+)
+Index("ix_company_blog_posts_slug", company_blog_posts.c.slug, unique=True)
+Index("ix_company_blog_posts_tenant_id", company_blog_posts.c.tenant_id)
+Index(
+    "ix_company_blog_posts_tenant_sort_created_at",
+    company_blog_posts.c.tenant_id,
+    company_blog_posts.c.created_at,
+    company_blog_posts.c.id,
+)
+Index("ix_company_blog_posts_tenant_sort_id", company_blog_posts.c.tenant_id, company_blog_posts.c.id)
+Index(
+    "ix_company_blog_posts_tenant_sort_published_at",
+    company_blog_posts.c.tenant_id,
+    company_blog_posts.c.published_at,
+    company_blog_posts.c.id,
+)
+Index(
+    "ix_company_blog_posts_tenant_sort_title",
+    company_blog_posts.c.tenant_id,
+    company_blog_posts.c.title,
+    company_blog_posts.c.id,
+)
+
+company_careers = Table(
+    "company_careers",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("tenant_id", Integer, ForeignKey("customer_users.id"), nullable=False),
+    Column("job_title", String(255), nullable=False),
+    Column("department", String(100)),
+    Column("location", String(255)),
+    Column("job_type", String(50)),
+    Column("description", Text, nullable=False),
+    Column("requirements", JSON),
+    Column("responsibilities", JSON),
+    Column("salary_range", String(100)),
+    Column("experience_level", String(100)),
+    Column("is_active", Boolean),
+    Column("posted_date", Date),
+    Column("closing_date", Date),
+    Column("created_at", DateTime(timezone=True), server_default=func.now()),
+    Column("updated_at", DateTime(timezone=True)),
+)
+Index("ix_company_careers_id", company_careers.c.id)
+Index("ix_company_careers_tenant_id", company_careers.c.tenant_id)
+Index(
+    "ix_company_careers_tenant_sort_created_at",
+    company_careers.c.tenant_id,
+    company_careers.c.created_at,
+    company_careers.c.id,
+)
+Index("ix_company_careers_tenant_sort_id", company_careers.c.tenant_id, company_careers.c.id)
+Index(
+    "ix_company_careers_tenant_sort_job_title",
+    company_careers.c.tenant_id,
+    company_careers.c.job_title,
+    company_careers.c.id,
+)
+Index(
+    "ix_company_careers_tenant_sort_posted_date",
+    company_careers.c.tenant_id,
+    company_careers.c.posted_date,
+    company_careers.c.id,
+)
+
+company_gallery_images = Table(
+    "company_gallery_images",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("tenant_id", Integer, ForeignKey("customer_users.id"), nullable=False),
+    Column("title", String(255)),
+    Column("description", Text),
+    Column("image_url", String(500), nullable=False),
+    Column("category", String(100)),
+    Column("alt_text", String(255)),
+    Column("display_order", Integer),
+    Column("is_active", Boolean),
+    Column("created_at", DateTime(timezone=True), server_default=func.now()),
+    Column("updated_at", DateTime(timezone=True)),
+)
+Index("ix_company_gallery_images_id", company_gallery_images.c.id)
+Index("ix_company_gallery_images_tenant_id", company_gallery_images.c.tenant_id)
+Index(
+    "ix_company_gallery_images_tenant_sort_created_at",
+    company_gallery_images.c.tenant_id,
+    company_gallery_images.c.created_at,
+    company_gallery_images.c.id,
+)
+Index(
+    "ix_company_gallery_images_tenant_sort_display_order",
+    company_gallery_images.c.tenant_id,
+    company_gallery_images.c.display_order,
+    company_gallery_images.c.id,
+)
+Index("ix_company_gallery_images_tenant_sort_id", company_gallery_images.c.tenant_id, company_gallery_images.c.id)
+
+company_info = Table(
+    "company_info",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("tenant_id", Integer, ForeignKey("customer_users.id"), nullable=False),
+    Column("company_name", String(255), nullable=False),
+    Column("subdomain", String(100)),
+    Column("address", Text),
+    Column("city", String(100)),
+    Column("state", String(100)),
+    Column("country", String(100)),
+    Column("postal_code", String(20)),
+    Column("tagline", String(255)),
+    Column("about", Text),
+    Column("mission", Text),
+    Column("vision", Text),
+    Column("values", Text),
+    Column("founding_year", Integer),
+    Column("industry", String(100)),
+    Column("company_size", String(50)),
+    Column("logo_url", String(500)),
+    Column("hero_image_url", String(500)),
+    Column("email", String(255)),
+    Column("phone", String(20)),
+    Column("whatsapp", String(20)),
+    Column("website_url", String(500)),
+    Column("linkedin_url", String(500)),
+    Column("instagram_url", String(500)),
+    Column("facebook_url", String(500)),
+    Column("youtube_url", String(500)),
+    Column("created_at", DateTime(timezone=True), server_default=func.now()),
+    Column("updated_at", DateTime(timezone=True)),
+)
+Index("ix_company_info_id", company_info.c.id)
+Index("ix_company_info_sort_company_name", company_info.c.company_name, company_info.c.id)
+Index("ix_company_info_sort_created_at", company_info.c.created_at, company_info.c.id)
+Index("ix_company_info_subdomain", company_info.c.subdomain, unique=True)
+Index("ix_company_info_tenant_id", company_info.c.tenant_id, unique=True)
+
+company_inquiries = Table(
+    "company_inquiries",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("tenant_id", Integer, ForeignKey("customer_users.id"), nullable=False),
+    Column("name", String(255), nullable=False),
+    Column("email", String(255), nullable=False),
+    Column("phone", String(20)),
+    Column("subject", String(255)),
+    Column("message", Text, nullable=False),
+    Column("status", String(20)),
+    Column("created_at", DateTime(timezone=True), server_default=func.now()),
+    Column("updated_at", DateTime(timezone=True)),
+)
+Index("ix_company_inquiries_id", company_inquiries.c.id)
+Index("ix_company_inquiries_tenant_id", company_inquiries.c.tenant_id)
+Index(
+    "ix_company_inquiries_tenant_sort_created_at",
+    company_inquiries.c.tenant_id,
+    company_inquiries.c.created_at,
+    company_inquiries.c.id,
+)
+Index("ix_company_inquiries_tenant_sort_id", company_inquiries.c.tenant_id, company_inquiries.c.id)
+
+company_products = Table(
+    "company_products",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("tenant_id", Integer, ForeignKey("customer_users.id"), nullable=False),
+    Column("name", String(255), nullable=False),
+    Column("slug", String(255), nullable=False),
+    Column("price", Float),
+    Column("sku", String(100)),
+    Column("stock_quantity", Integer),
+    Column("short_description", Text),
+    Column("full_description", Text),
+    Column("category", String(100)),
+    Column("features", JSON),
+    Column("specifications", JSON),
+    Column("main_image_url", String(500)),
+    Column("gallery_images", JSON),
+    Column("stock_status", String(20)),
+    Column("publish_to_portfolio", Boolean),
+    Column("created_at", DateTime(timezone=True), server_default=func.now()),
+    Column("updated_at", DateTime(timezone=True)),
+)
+Index("ix_company_products_category_created_at", company_products.c.category, company_products.c.created_at.desc())
+Index("ix_company_products_created_at", company_products.c.created_at.desc())
+Index("ix_company_products_id", company_products.c.id)
+Index("ix_company_products_slug", company_products.c.slug)
+Index("ix_company_products_tenant_id", company_products.c.tenant_id)
+Index(
+    "ix_company_products_tenant_sort_created_at",
+    company_products.c.tenant_id,
+    company_products.c.created_at,
+    company_products.c.id,
+)
+Index("ix_company_products_tenant_sort_id", company_products.c.tenant_id, company_products.c.id)
+Index(
+    "ix_company_products_tenant_sort_name",
+    company_products.c.tenant_id,
+    company_products.c.name,
+    company_products.c.id,
+)
+Index(
+    "ix_company_products_tenant_sort_price",
+    company_products.c.tenant_id,
+    company_products.c.price,
+    company_products.c.id,
+)
+
+company_projects = Table(
+    "company_projects",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("tenant_id", Integer, ForeignKey("customer_users.id"), nullable=False),
+    Column("title", String(255), nullable=False),
+    Column("slug", String(255), nullable=False),
+    Column("short_description", Text),
+    Column("full_description", Text),
+    Column("client_name", String(255)),
+    Column("project_url", String(500)),
+    Column("category", String(100)),
+    Column("technologies", JSON),
+    Column("featured_image_url", String(500)),
+    Column("gallery_images", JSON),
+    Column("start_date", DateTime(timezone=True)),
+    Column("end_date", DateTime(timezone=True)),
+    Column("status", String(20)),
+    Column("is_featured", Boolean),
+    Column("publish_to_portfolio", Boolean),
+    Column("created_at", DateTime(timezone=True), server_default=func.now()),
+    Column("updated_at", DateTime(timezone=True)),
+)
+Index("ix_company_projects_id", company_projects.c.id)
+Index("ix_company_projects_slug", company_projects.c.slug)
+Index("ix_company_projects_tenant_id", company_projects.c.tenant_id)
+Index(
+    "ix_company_projects_tenant_sort_created_at",
+    company_projects.c.tenant_id,
+    company_projects.c.created_at,
+    company_projects.c.id,
+)
+Index("ix_company_projects_tenant_sort_id", company_projects.c.tenant_id, company_projects.c.id)
+Index(
+    "ix_company_projects_tenant_sort_start_date",
+    company_projects.c.tenant_id,
+    company_projects.c.start_date,
+    company_projects.c.id,
+)
+Index(
+    "ix_company_projects_tenant_sort_title",
+    company_projects.c.tenant_id,
+    company_projects.c.title,
+    company_projects.c.id,
+)
+
+company_services = Table(
+    "company_services",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("tenant_id", Integer, ForeignKey("customer_users.id"), nullable=False),
+    Column("title", String(255), nullable=False),
+    Column("slug", String(255), nullable=False),
+    Column("short_description", Text),
+    Column("full_description", Text),
+    Column("icon_url", String(500)),
+    Column("banner_image_url", String(500)),
+    Column("category", String(100)),
+    Column("features", JSON),
+    Column("pricing", String(100)),
+    Column("status", String(20)),
+    Column("publish_to_portfolio", Boolean),
+    Column("created_at", DateTime(timezone=True), server_default=func.now()),
+    Column("updated_at", DateTime(timezone=True)),
+)
+Index(
+    "ix_company_services_active_category_created_at",
+    company_services.c.category,
+    company_services.c.created_at.desc(),
+    postgresql_where=text("status = 'active'"),
+    sqlite_where=text("status = 'active'"),
+)
+Index(
+    "ix_company_services_active_created_at",
+    company_services.c.created_at.desc(),
+    postgresql_where=text("status = 'active'"),
+    sqlite_where=text("status = 'active'"),
+)
+Index("ix_company_services_id", company_services.c.id)
+Index("ix_company_services_slug", company_services.c.slug)
+Index(
+    "ix_company_services_tenant_active_created_at",
+    company_services.c.tenant_id,
+    company_services.c.created_at.desc(),
+    postgresql_where=text("status = 'active'"),
+    sqlite_where=text("status = 'active'"),
+)
+Index("ix_company_services_tenant_id", company_services.c.tenant_id)
+Index(
+    "ix_company_services_tenant_sort_created_at",
+    company_services.c.tenant_id,
+    company_services.c.created_at,
+    company_services.c.id,
+)
+Index("ix_company_services_tenant_sort_id", company_services.c.tenant_id, company_services.c.id)
+Index(
+    "ix_company_services_tenant_sort_title",
+    company_services.c.tenant_id,
+    company_services.c.title,
+    company_services.c.id,
+)
+
+company_team_members = Table(
+    "company_team_members",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("tenant_id", Integer, ForeignKey("customer_users.id"), nullable=False),
+    Column("name", String(255), nullable=False),
+    Column("position", String(255)),
+    Column("department", String(255)),
+    Column("bio", Text),
+    Column("email", String(255)),
+    Column("phone", String(50)),
+    Column("image_url", String(500)),
+    Column("linkedin_url", String(500)),
+    Column("twitter_url", String(500)),
+    Column("github_url", String(500)),
+    Column("skills", ARRAY(String)),
+    Column("display_order", Integer),
+    Column("publish_to_portfolio", Boolean),
+    Column("is_active", Boolean),
+    Column("created_at", DateTime(timezone=True), server_default=func.now()),
+    Column("updated_at", DateTime(timezone=True)),
+)
+Index("ix_company_team_members_id", company_team_members.c.id)
+Index(
+    "ix_company_team_members_tenant_active_order",
+    company_team_members.c.tenant_id,
+    company_team_members.c.display_order,
+    postgresql_where=text("is_active"),
+    sqlite_where=text("is_active = 1"),
+)
+Index("ix_company_team_members_tenant_id", company_team_members.c.tenant_id)
+Index(
+    "ix_company_team_members_tenant_sort_created_at",
+    company_team_members.c.tenant_id,
+    company_team_members.c.created_at,
+    company_team_members.c.id,
+)
+Index(
+    "ix_company_team_members_tenant_sort_display_order",
+    company_team_members.c.tenant_id,
+    company_team_members.c.display_order,
+    company_team_members.c.id,
+)
+Index("ix_company_team_members_tenant_sort_id", company_team_members.c.tenant_id, company_team_members.c.id)
+Index(
+    "ix_company_team_members_tenant_sort_name",
+    company_team_members.c.tenant_id,
+    company_team_members.c.name,
+    company_team_members.c.id,
+)
+
+company_testimonials = Table(
+    "company_testimonials",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("tenant_id", Integer, ForeignKey("customer_users.id"), nullable=False),
+    Column("client_name", String(255), nullable=False),
+    Column("client_designation", String(255)),
+    Column("client_company", String(255)),
+    Column("client_image_url", String(500)),
+    Column("content", Text, nullable=False),
+    Column("rating", Integer),
+    Column("is_featured", Boolean),
+    Column("publish_to_portfolio", Boolean),
+    Column("created_at", DateTime(timezone=True), server_default=func.now()),
+    Column("updated_at", DateTime(timezone=True)),
+)
+Index("ix_company_testimonials_id", company_testimonials.c.id)
+Index("ix_company_testimonials_tenant_id", company_testimonials.c.tenant_id)
+Index(
+    "ix_company_testimonials_tenant_sort_created_at",
+    company_testimonials.c.tenant_id,
+    company_testimonials.c.created_at,
+    company_testimonials.c.id,
+)
+Index("ix_company_testimonials_tenant_sort_id", company_testimonials.c.tenant_id, company_testimonials.c.id)
+Index(
+    "ix_company_testimonials_tenant_sort_rating",
+    company_testimonials.c.tenant_id,
+    company_testimonials.c.rating,
+    company_testimonials.c.id,
+)
+
+customer_subscriptions = Table(
+    "customer_subscriptions",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("tenant_id", Integer, ForeignKey("customer_users.id"), nullable=False),
+    Column("plan_id", Integer, ForeignKey("subscription_plans.id"), nullable=False),
+    Column("start_date", DateTime(timezone=True), server_default=func.now()),
+    Column("end_date", DateTime(timezone=True), nullable=False),
+    Column("status", String(20)),
+    Column("auto_renew", Boolean),
+    Column("created_at", DateTime(timezone=True), server_default=func.now()),
+    Column("updated_at", DateTime(timezone=True)),
+)
+Index("ix_customer_subscriptions_id", customer_subscriptions.c.id)
+Index("ix_customer_subscriptions_plan_status", customer_subscriptions.c.plan_id, customer_subscriptions.c.status)
+Index("ix_customer_subscriptions_status", customer_subscriptions.c.status)
+Index("ix_customer_subscriptions_status_end_date", customer_subscriptions.c.status, customer_subscriptions.c.end_date)
+Index("ix_customer_subscriptions_tenant_id", customer_subscriptions.c.tenant_id)
+
+import_jobs = Table(
+    "import_jobs",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("tenant_id", Integer, ForeignKey("customer_users.id"), nullable=False),
+    Column("resource", String(50), nullable=False),
+    Column("file_name", String(255)),
+    Column("file_format", String(10), nullable=False),
+    Column("size_bytes", Integer),
+    Column("status", String(20), nullable=False),
+    Column("processed_rows", Integer, nullable=False),
+    Column("created_count", Integer, nullable=False),
+    Column("error_count", Integer, nullable=False),
+    Column("errors", JSON),
+    Column("last_error", Text),
+    Column("created_at", DateTime(timezone=True), server_default=func.now()),
+    Column("started_at", DateTime(timezone=True)),
+    Column("finished_at", DateTime(timezone=True)),
+)
+Index("ix_import_jobs_id", import_jobs.c.id)
+Index("ix_import_jobs_status", import_jobs.c.status)
+Index("ix_import_jobs_tenant_id", import_jobs.c.tenant_id)
+
+payment_history = Table(
+    "payment_history",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("subscription_id", Integer, ForeignKey("customer_subscriptions.id"), nullable=False),
+    Column("amount", Float, nullable=False),
+    Column("currency", String(10)),
+    Column("payment_gateway", String(20), nullable=False),
+    Column("transaction_id", String(255)),
+    Column("payment_status", String(20)),
+    Column("payment_date", DateTime(timezone=True), server_default=func.now()),
+    Column("payment_metadata", JSON),
+    Column("notes", Text),
+    Column("created_at", DateTime(timezone=True), server_default=func.now()),
+    Column("updated_at", DateTime(timezone=True)),
+)
+Index("ix_payment_history_id", payment_history.c.id)
+Index("ix_payment_history_payment_status", payment_history.c.payment_status)
+Index("ix_payment_history_transaction_id", payment_history.c.transaction_id, unique=True)
+
+public_portfolio = Table(
+    "public_portfolio",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("tenant_id", Integer, ForeignKey("company_info.tenant_id"), nullable=False),
+    Column("item_type", String(50), nullable=False),
+    Column("item_id", Integer, nullable=False),
+    Column("title", String(255), nullable=False),
+    Column("description", Text),
+    Column("image_url", String(500)),
+    Column("category", String(100)),
+    Column("is_active", Boolean),
+    Column("created_at", DateTime(timezone=True), server_default=func.now()),
+    Column("updated_at", DateTime(timezone=True)),
+)
+Index(
+    "ix_public_portfolio_active_created_at",
+    public_portfolio.c.created_at.desc(),
+    postgresql_where=text("is_active"),
+    sqlite_where=text("is_active = 1"),
+)
+Index("ix_public_portfolio_id", public_portfolio.c.id)
+Index("ix_public_portfolio_item", public_portfolio.c.item_type, public_portfolio.c.item_id)
+Index("ix_public_portfolio_item_type", public_portfolio.c.item_type)
+Index(
+    "ix_public_portfolio_tenant_active_created_at",
+    public_portfolio.c.tenant_id,
+    public_portfolio.c.created_at.desc(),
+    postgresql_where=text("is_active"),
+    sqlite_where=text("is_active = 1"),
+)
+Index("ix_public_portfolio_tenant_id", public_portfolio.c.tenant_id)
+
+wishlists = Table(
+    "wishlists",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("user_id", Integer, ForeignKey("users.id"), nullable=False),
+    Column("product_id", Integer, ForeignKey("company_products.id")),
+    Column("created_at", DateTime(timezone=True), server_default=func.now()),
+)
+Index("ix_wishlists_id", wishlists.c.id)
+
+public_likes = Table(
+    "public_likes",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("portfolio_item_id", Integer, ForeignKey("public_portfolio.id"), nullable=False),
+    Column("ip_address", String(45)),
+    Column("created_at", DateTime(timezone=True), server_default=func.now()),
+)
+Index("ix_public_likes_id", public_likes.c.id)
+
+
+def upgrade(connection):
+    metadata.create_all(bind=connection, checkfirst=True)
@@ -0,0 +1,17 @@
+"""
+Columns that hand-run add-column scripts used to add to tables created
+before them. Anything a database is still missing from the baseline
+snapshot is added as a nullable column; present columns are skipped.
+
+Data fixes and type changes (the remaining migrate_*.py, fix_*.py) stay
+one-off scripts.
+"""
+from app.database.migrate import add_missing_columns, logger
+from app.database.migrations.v0001_baseline import metadata
+
+DESCRIPTION = "Add model columns missing from pre-existing tables"
+
+
+def upgrade(connection):
+    for column in add_missing_columns(connection, metadata.sorted_tables):
+        logger.info(f"Added column {column}")
@@ -0,0 +1,30 @@
+"""
+Every index of the baseline snapshot, on tables created before the index was:
+tenant/list-query, public read path and subscription listing indexes,
+plus the admin customer search trigram indexes on PostgreSQL.
+
+Built CONCURRENTLY on PostgreSQL, so tables stay writable.
+"""
+from app.database.migrate import create_missing_indexes
+from app.database.migrations.v0001_baseline import metadata
+
+DESCRIPTION = "Declared, list query and search indexes"
+
+# CREATE INDEX CONCURRENTLY cannot run inside a transaction
+TRANSACTIONAL = False
+
+TRIGRAM_INDEXES = [
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_email_trgm ON users USING gin (email gin_trgm_ops)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_full_name_trgm ON users USING gin (full_name gin_trgm_ops)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_phone_number_trgm ON users USING gin (phone_number gin_trgm_ops)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_customer_subscriptions_tenant_created "
+    "ON customer_subscriptions (tenant_id, created_at DESC)",
+]
+
+
+def upgrade(connection):
+    create_missing_indexes(connection, metadata.sorted_tables)
+    if connection.dialect.name == "postgresql":
+        connection.exec_driver_sql("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        for statement in TRIGRAM_INDEXES:
+            connection.exec_driver_sql(statement)
@@ -0,0 +1,200 @@
+"""
+What the removed migrate_add_help_center / hero_content / become_seller,
+migrate_add_public_portfolio and migrate_add_customer_type scripts did
+beyond adding the column, for databases that got the column from v0002:
+
+- site_settings content columns: JSON default, NULL rows backfilled
+- publish_to_portfolio: DEFAULT FALSE, NULL rows backfilled
+- customer_users.customer_type_id: foreign key to customer_types
+
+Column defaults and the foreign key are PostgreSQL only (SQLite cannot
+alter either on an existing column); the backfills run everywhere.
+"""
+import json
+
+from sqlalchemy import JSON, bindparam, inspect, text
+
+DESCRIPTION = "Defaults, backfills and foreign key of legacy add-column scripts"
+
+HERO_CONTENT = {
+    "badge_text": "India's Most Trusted B2B Platform",
+    "title_prefix": "Discover Thousands of",
+    "title_highlight": "Trusted Suppliers",
+    "subtitle": "Connect with verified manufacturers, wholesalers, and service providers across India",
+    "popular_searches": [
+        "Industrial Machinery", "Steel Products", "Medical Equipment",
+        "Electronics Components", "Building Materials"
+    ],
+    "features": [
+        {"title": "Verified Sellers", "desc": "100% Trusted & Verified"},
+        {"title": "Quick Response", "desc": "Within 24 Hours"},
+        {"title": "24/7 Support", "desc": "Always Available"}
+    ]
+}
+
+HELP_CENTER_CONTENT = {
+    "title": "How Can We Help?",
+    "subtitle": "Find answers to common questions or reach out to our support team.",
+    "search_placeholder": "Search for help articles...",
+    "support_options": [
+        {
+            "title": "Email Support",
+            "description": "Send us an email and we'll respond within 24 hours.",
+            "action": "support@b2bconnect.com",
+            "link": "mailto:support@b2bconnect.com",
+            "icon": "Mail",
+            "color": "from-indigo-500 to-purple-500"
+        },
+        {
+            "title": "Phone Support",
+            "description": "Speak directly with our support team.",
+            "action": "+91 1800-XXX-XXXX",
+            "link": "tel:+911800XXXXXXX",
+            "icon": "Phone",
+            "color": "from-green-500 to-emerald-500"
+        },
+        {
+            "title": "Live Chat",
+            "description": "Chat with us in real-time for instant help.",
+            "action": "Start Chat",
+            "link": "#",
+            "icon": "MessageCircle",
+            "color": "from-orange-500 to-red-500"
+        }
+    ],
+    "categories": [
+        {
+            "id": "getting-started",
+            "name": "Getting Started",
+            "icon": "Sparkles",
+            "color": "from-indigo-500 to-purple-500",
+            "faqs": [
+                {"question": "How do I create an account?", "answer": "Click on the 'Register' button in the top navigation. Fill in your business details, email, and password. Verify your email address to complete registration."},
+                {"question": "Is registration free?", "answer": "Yes! Basic registration is completely free. You can create your business profile, list products, and receive inquiries at no cost."}
+            ]
+        },
+        {
+            "id": "products-services",
+            "name": "Products & Services",
+            "icon": "Package",
+            "color": "from-orange-500 to-red-500",
+            "faqs": [
+                {"question": "How do I list my products?", "answer": "Go to Dashboard > Products > Add New Product. Fill in the product details including name, description, price, category, and upload high-quality images."}
+            ]
+        }
+    ]
+}
+
+BECOME_SELLER_CONTENT = {
+    "hero": {
+        "badge": "Join 10,000+ Sellers",
+        "title_line1": "Grow Your Business",
+        "title_highlight": "With Us",
+        "subtitle": "Reach millions of buyers across India. List your products for free and start receiving genuine business inquiries today.",
+        "cta_primary": "Start Selling Free",
+        "cta_secondary": "View Success Stories"
+    },
+    "stats": [
+        {"value": "10K+", "label": "Active Sellers"},
+        {"value": "50K+", "label": "Monthly Inquiries"},
+        {"value": "500+", "label": "Cities Covered"}
+    ],
+    "benefits": {
+        "title": "Everything You Need to Succeed",
+        "subtitle": "We provide all the tools and support you need to grow your B2B business online.",
+        "items": [
+            {"title": "Nationwide Reach", "desc": "Connect with buyers across India. Expand your business beyond geographical boundaries.", "icon": "Globe", "color": "from-indigo-500 to-purple-500"},
+            {"title": "Trust & Credibility", "desc": "Get verified badge and build trust with authentic buyer inquiries.", "icon": "BadgeCheck", "color": "from-green-500 to-emerald-500"},
+            {"title": "Grow Your Sales", "desc": "Access thousands of potential buyers actively looking for products like yours.", "icon": "TrendingUp", "color": "from-orange-500 to-red-500"}
+        ]
+    },
+    "steps": {
+        "title": "Get Started in 4 Easy Steps",
+        "subtitle": "Start selling within minutes. No technical skills required.",
+        "items": [
+            {"number": "01", "title": "Create Your Account", "desc": "Sign up for free in just 2 minutes with your business details.", "icon": "Store"},
+            {"number": "02", "title": "Set Up Your Profile", "desc": "Add your company information, logo, and business description.", "icon": "Users"},
+            {"number": "03", "title": "List Your Products", "desc": "Upload your products with images, descriptions, and pricing.", "icon": "Package"},
+            {"number": "04", "title": "Start Receiving Inquiries", "desc": "Get genuine buyer inquiries and grow your business.", "icon": "Target"}
+        ]
+    },
+    "pricing": {
+        "title": "Choose Your Plan",
+        "subtitle": "Start free and upgrade as you grow. No hidden fees.",
+        "plans": [
+            {
+                "name": "Starter", "price": "Free", "period": "Forever", "description": "Perfect for small businesses just getting started",
+                "features": ["Up to 20 product listings", "Basic business profile", "Receive buyer inquiries", "Email notifications", "Basic analytics"],
+                "cta": "Get Started Free", "popular": False
+            },
+            {
+                "name": "Professional", "price": "₹999", "period": "/month", "description": "For growing businesses that want more visibility",
+                "features": ["Unlimited product listings", "Verified seller badge", "Priority in search results", "Advanced analytics dashboard", "Featured business placement"],
+                "cta": "Start Free Trial", "popular": True
+            }
+        ]
+    },
+    "testimonials": {
+        "title": "Trusted by Businesses Like Yours",
+        "items": [
+            {"name": "Rajesh Kumar", "company": "Steel Industries Pvt Ltd", "location": "Mumbai", "quote": "Since joining this platform, our business inquiries have increased by 300%. The quality of leads is exceptional.", "rating": 5}
+        ]
+    },
+    "cta_bottom": {
+        "title": "Ready to Grow Your Business?",
+        "subtitle": "Join thousands of successful sellers. Start for free today – no credit card required.",
+        "button_text": "Start Selling Now – It's Free",
+        "features": ["Free forever plan available", "No credit card required", "Setup in 2 minutes"]
+    }
+}
+
+SITE_SETTINGS_CONTENT = {
+    "hero_content": HERO_CONTENT,
+    "help_center_content": HELP_CENTER_CONTENT,
+    "become_seller_content": BECOME_SELLER_CONTENT,
+}
+
+PORTFOLIO_TABLES = [
+    "company_services",
+    "company_products",
+    "company_projects",
+    "company_testimonials",
+    "company_team_members",
+]
+
+
+def upgrade(connection):
+    inspector = inspect(connection)
+    tables = set(inspector.get_table_names())
+    postgresql = connection.dialect.name == "postgresql"
+
+    if "site_settings" in tables:
+        for column, content in SITE_SETTINGS_CONTENT.items():
+            if postgresql:
+                # text() escapes the % signs in the content for the driver; colons must not read as binds
+                literal = json.dumps(content).replace("'", "''").replace(":", "\\:")
+                connection.execute(text(f"ALTER TABLE site_settings ALTER COLUMN {column} SET DEFAULT '{literal}'"))
+            backfill = text(f"UPDATE site_settings SET {column} = :value WHERE {column} IS NULL")
+            connection.execute(backfill.bindparams(bindparam("value", type_=JSON)), {"value": content})
+
+    for table in PORTFOLIO_TABLES:
+        if table not in tables:
+            continue
+        if postgresql:
+            connection.exec_driver_sql(f"ALTER TABLE {table} ALTER COLUMN publish_to_portfolio SET DEFAULT FALSE")
+        connection.execute(text(f"UPDATE {table} SET publish_to_portfolio = :value WHERE publish_to_portfolio IS NULL"), {"value": False})
+
+    if postgresql and {"customer_users", "customer_types"} <= tables:
+        has_foreign_key = any(
+            fk["constrained_columns"] == ["customer_type_id"] for fk in inspector.get_foreign_keys("customer_users")
+        )
+        if not has_foreign_key:
+            # Ids of deleted types would fail the constraint; they pointed nowhere already
+            connection.exec_driver_sql(
+                "UPDATE customer_users SET customer_type_id = NULL WHERE customer_type_id IS NOT NULL "
+                "AND customer_type_id NOT IN (SELECT id FROM customer_types)"
+            )
+            connection.exec_driver_sql(
+                "ALTER TABLE customer_users ADD CONSTRAINT customer_users_customer_type_id_fkey "
+                "FOREIGN KEY (customer_type_id) REFERENCES customer_types (id)"
+            )
@@ -0,0 +1,29 @@
+"""
+Build markers of derived tables get their own table. They were rows
+named "built:<table>" in platform_stats; existing ones are moved over.
+"""
+from sqlalchemy import Column, DateTime, MetaData, String, Table, func, inspect, text
+
+DESCRIPTION = "Derived table build markers"
+
+metadata = MetaData()
+
+derived_table_builds = Table(
+    "derived_table_builds",
+    metadata,
+    Column("table_name", String(100), primary_key=True),
+    Column("built_at", DateTime(timezone=True), nullable=False, server_default=func.now()),
+)
+
+
+def upgrade(connection):
+    metadata.create_all(bind=connection, checkfirst=True)
+    if "platform_stats" not in inspect(connection).get_table_names():
+        return
+    markers = {"pattern": "built:%"}
+    connection.execute(text(
+        "INSERT INTO derived_table_builds (table_name, built_at) "
+        "SELECT SUBSTR(name, 7), COALESCE(updated_at, CURRENT_TIMESTAMP) FROM platform_stats "
+        "WHERE name LIKE :pattern AND SUBSTR(name, 7) NOT IN (SELECT table_name FROM derived_table_builds)"
+    ), markers)
+    connection.execute(text("DELETE FROM platform_stats WHERE name LIKE :pattern"), markers)
@@ -0,0 +1,46 @@
+"""
+Imports every model so Base.metadata describes the whole schema.
+
+Import this module (not individual models) wherever the complete metadata
+is needed: the app, the migration runner, scripts.
+"""
+# Core Models
+from app.models.user_model import User
+from app.models.role_model import Role
+from app.models.permission_model import Permission
+
+# User Models
+from app.customer.models.customer_user_model import CustomerUser
+from app.admin.models.admin_user_model import AdminUser
+
+# Admin Models
+from app.admin.models.state_model import State
+from app.admin.models.district_model import District
+from app.admin.models.customer_type_model import CustomerType
+from app.admin.models.category_model import Category
+
+# Subscription Models (NEW)
+from app.subscriptions.models import SubscriptionPlan, CustomerSubscription
+from app.payments.models import PaymentHistory, WebhookEvent
+
+# Company Models
+from app.company.models.company_info_model import CompanyInfo
+from app.company.models.company_services_model import CompanyService
+from app.company.models.company_products_model import CompanyProduct
+from app.company.models.company_projects_model import CompanyProject
+from app.company.models.company_testimonials_model import CompanyTestimonial
+from app.company.models.company_team_members_model import CompanyTeamMember
+from app.company.models.company_blog_posts_model import CompanyBlogPost
+from app.company.models.company_careers_model import CompanyCareer
+from app.company.models.company_inquiries_model import CompanyInquiry
+from app.company.models.company_gallery_images_model import CompanyGalleryImage
+from app.models.site_settings_model import SiteSettings
+from app.models.notification_model import Notification
+from app.models.wishlist_model import Wishlist
+from app.models.category_stats_model import CategoryStats
+from app.models.platform_stats_model import PlatformStats
+from app.models.dashboard_rollup_model import DashboardRollup
+from app.models.derived_table_build_model import DerivedTableBuild
+from app.models.revoked_token_model import RevokedToken
+from app.models.import_job_model import ImportJob
+from app.models.public_portfolio_model import PublicPortfolio, PublicLike
@@ -0,0 +1,110 @@
+"""
+Cross-process lock around schema and seed work.
+
+Every container (and every `manage.py` run) may try to migrate and seed
+at once; the lock lets one do it while the others wait, then find
+nothing left to do.
+- PostgreSQL: session-level advisory lock, held on its own connection,
+  so it spans hosts and is released if the holder dies
+- SQLite: an exclusive lock on `<database file>.lock`
+- Anything else: no lock
+
+try_advisory_lock is the non-blocking variant for periodic jobs that only
+one process should run at a time.
+"""
+import logging
+import os
+import zlib
+from contextlib import contextmanager
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# Advisory lock keys are one bigint shared by the whole database
+SCHEMA_LOCK_KEY = zlib.crc32(b"b2b-saas:schema")
+
+
+@contextmanager
+def _advisory_lock(engine: Engine, key: int):
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        if not connection.execute(text("SELECT pg_try_advisory_lock(:key)"), {"key": key}).scalar():
+            logger.info("Waiting for another process to finish schema work...")
+            connection.execute(text("SELECT pg_advisory_lock(:key)"), {"key": key})
+        try:
+            yield
+        finally:
+            connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": key})
+
+
+try:
+    import fcntl
+
+    def _lock_file(handle):
+        try:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            logger.info("Waiting for another process to finish schema work...")
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+
+    def _unlock_file(handle):
+        fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+except ImportError:  # Windows
+    import msvcrt
+
+    def _lock_file(handle):
+        handle.seek(0)
+        # LK_LOCK gives up after ~10s; keep waiting
+        while True:
+            try:
+                msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                logger.info("Waiting for another process to finish schema work...")
+
+    def _unlock_file(handle):
+        handle.seek(0)
+        msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+@contextmanager
+def _file_lock(path: str):
+    with open(path, "a+b") as handle:
+        _lock_file(handle)
+        try:
+            yield
+        finally:
+            _unlock_file(handle)
+
+
+@contextmanager
+def schema_lock(engine: Engine, key: int = SCHEMA_LOCK_KEY):
+    """Holds the database-wide schema lock for the duration of the block."""
+    dialect = engine.dialect.name
+    if dialect == "postgresql":
+        with _advisory_lock(engine, key):
+            yield
+    elif dialect == "sqlite" and engine.url.database not in (None, "", ":memory:"):
+        with _file_lock(os.path.abspath(engine.url.database) + ".lock"):
+            yield
+    else:
+        yield
+
+
+@contextmanager
+def try_advisory_lock(engine: Engine, key: int):
+    """
+    Yields True if this process now holds `key` for the block, False if
+    another process does. Locks on PostgreSQL only; elsewhere always True.
+    """
+    if engine.dialect.name != "postgresql":
+        yield True
+        return
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        acquired = connection.execute(text("SELECT pg_try_advisory_lock(:key)"), {"key": key}).scalar()
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": key})
@@ -2,7 +2,6 @@ from fastapi import FastAPI
 import json
 from app.core.config import settings
 from app.database.connection import engine, SessionLocal
-from app.database.base import Base
 
 # Import Middleware
 from app.tenants.middleware import TenantMiddleware
@@ -42,49 +41,14 @@ from app.company.routes import (
     company_blog_posts_routes,
     company_careers_routes,
     company_inquiries_routes,
-    company_gallery_images_routes
+    company_gallery_images_routes,
+    company_imports_routes
 )
 
-from app.utils.seed_data import seed_data
-
-# ============ Import Models to Register with Base.metadata ============
-
-# Core Models
-from app.models.user_model import User
-from app.models.role_model import Role
-from app.models.permission_model import Permission
-
-# User Models
-from app.customer.models.customer_user_model import CustomerUser
-from app.admin.models.admin_user_model import AdminUser
-
-# Admin Models
-from app.admin.models.state_model import State
-from app.admin.models.district_model import District
-from app.admin.models.customer_type_model import CustomerType
-from app.admin.models.category_model import Category
-
-# Subscription Models (NEW)
-from app.subscriptions.models import SubscriptionPlan, CustomerSubscription
-from app.payments.models import PaymentHistory
-
-# Company Models
-from app.company.models.company_info_model import CompanyInfo
-from app.company.models.company_services_model import CompanyService
-from app.company.models.company_products_model import CompanyProduct
-from app.company.models.company_projects_model import CompanyProject
-from app.company.models.company_testimonials_model import CompanyTestimonial
-from app.company.models.company_team_members_model import CompanyTeamMember
-from app.company.models.company_blog_posts_model import CompanyBlogPost
-from app.company.models.company_careers_model import CompanyCareer
-from app.company.models.company_inquiries_model import CompanyInquiry
-from app.company.models.company_gallery_images_model import CompanyGalleryImage
-from app.models.site_settings_model import SiteSettings
-from app.models.notification_model import Notification
-from app.models.wishlist_model import Wishlist
-
-# Create tables
-Base.metadata.create_all(bind=engine)
+# ============ Register Models with Base.metadata ============
+
+# The schema itself is managed by versioned migrations (python manage.py migrate)
+import app.database.models  # noqa: F401
 
 # ============ Swagger Tags ============
 
@@ -130,11 +94,17 @@ tags_metadata = [
 
 # ============ Create FastAPI App ============
 
+from fastapi.datastructures import Default
+from app.utils.responses import ORJSONResponse
+
 app = FastAPI(
     title=settings.PROJECT_NAME, 
     version=settings.PROJECT_VERSION,
     openapi_tags=tags_metadata,
-    description="Multi-tenant SaaS platform with subscription management"
+    description="Multi-tenant SaaS platform with subscription management",
+    # orjson for routes returning dicts; wrapped in Default so routes with a
+    # response_model keep FastAPI's direct Pydantic-to-JSON path
+    default_response_class=Default(ORJSONResponse)
 )
 
 from fastapi.middleware.cors import CORSMiddleware
@@ -163,6 +133,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Total-Count", "X-Total-Exact", "X-Next-Cursor"],
 )
 
 # Tenant Middleware (must be first to inject tenant context)
@@ -171,6 +142,27 @@ app.add_middleware(TenantMiddleware)
 # Subscription Check Middleware (checks subscription expiry)
 app.add_middleware(SubscriptionCheckMiddleware)
 
+# ============ Exception Handlers ============
+
+from fastapi import Request
+from fastapi.responses import JSONResponse
+from app.core.password_pool import PasswordHasherBusy
+from app.company.repositories.list_query import ListQueryError
+
+@app.exception_handler(PasswordHasherBusy)
+async def password_hasher_busy_handler(request: Request, exc: PasswordHasherBusy):
+    """Shed load instead of queueing when every hashing worker is busy"""
+    return JSONResponse(
+        status_code=429,
+        content={"detail": "Too many authentication requests. Please retry shortly."},
+        headers={"Retry-After": "1"}
+    )
+
+@app.exception_handler(ListQueryError)
+async def list_query_error_handler(request: Request, exc: ListQueryError):
+    """Disallowed filter/sort fields and malformed cursors are client errors"""
+    return JSONResponse(status_code=400, content={"detail": str(exc)})
+
 # ============ Include Routers ============
 
 # Authentication
@@ -228,6 +220,7 @@ app.include_router(company_blog_posts_routes.customer_router)
 app.include_router(company_careers_routes.customer_router)
 app.include_router(company_inquiries_routes.customer_router)
 app.include_router(company_gallery_images_routes.customer_router)
+app.include_router(company_imports_routes.customer_router)
 
 # Company Routes - Admin (Can View All Tenants)
 app.include_router(company_info_routes.admin_router)
@@ -245,24 +238,50 @@ app.include_router(company_gallery_images_routes.admin_router)
 
 @app.on_event("startup")
 async def startup_event():
-    """Seed initial data on startup"""
-    import logging
-    logger = logging.getLogger(__name__)
-    
-    # Wait a bit for database to be ready
+    """Check the schema version, warm up, then start background workers"""
     import asyncio
-    await asyncio.sleep(2)
+    from app.database.migrate import check_schema_version
     
-    db = SessionLocal()
-    try:
-        seed_data(db)
-        logger.info("Database seeding completed successfully")
-    except Exception as e:
-        logger.error(f"Database seeding failed: {str(e)}")
-        logger.warning("Application will continue without seeded data")
-        # Don't crash the app if seeding fails
-    finally:
-        db.close()
+    app.state.ready = False
+    
+    # One query; refuses to serve on a schema older than this build's migrations.
+    # Migrating and seeding are explicit: python manage.py migrate / seed
+    check_schema_version(engine)
+    
+    # Warm-up: build mapper configuration and the polymorphic user entity
+    # now rather than on the first requests
+    from sqlalchemy.orm import configure_mappers
+    from app.auth.user_queries import polymorphic_user
+    configure_mappers()
+    polymorphic_user()
+    
+    # Report declared indexes that are missing, off the startup path
+    if settings.CHECK_INDEXES_ON_STARTUP:
+        from app.database.index_check import report_missing_indexes
+        app.state.index_check_task = asyncio.create_task(asyncio.to_thread(report_missing_indexes, engine))
+    
+    # Keep the public platform counters honest
+    from app.services.platform_stats_service import reconcile_platform_stats_periodically
+    app.state.platform_stats_task = asyncio.create_task(reconcile_platform_stats_periodically(SessionLocal))
+    
+    # Apply queued payment webhooks (retries and anything missed by the request path)
+    from app.payments.webhook_service import run_webhook_worker
+    app.state.webhook_worker_task = asyncio.create_task(run_webhook_worker(SessionLocal))
+    
+    # Mirror revoked token ids into this process's in-memory filter
+    from app.auth.token_revocation import run_revocation_sync
+    app.state.revocation_sync_task = asyncio.create_task(run_revocation_sync(SessionLocal))
+    
+    app.state.ready = True
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close pooled payment gateway connections and password hashing workers"""
+    app.state.ready = False
+    from app.payments.gateway_client import close_gateway_clients
+    from app.core.security import password_pool
+    close_gateway_clients()
+    password_pool.shutdown()
 
 # ============ Root Endpoint ============
 
@@ -284,3 +303,10 @@ def root():
 def health_check():
     """Health check endpoint"""
     return {"status": "healthy", "version": settings.PROJECT_VERSION}
+
+@app.get("/ready")
+def readiness_check():
+    """Readiness: 200 once this worker has finished warm-up, 503 before and while shutting down"""
+    if not getattr(app.state, "ready", False):
+        return JSONResponse(status_code=503, content={"status": "starting"})
+    return {"status": "ready"}
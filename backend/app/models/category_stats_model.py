@@ -0,0 +1,20 @@
+from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy.sql import func
+from app.database.base import Base
+
+
+class CategoryStats(Base):
+    """
+    Precomputed product/service counts per category name.
+    Kept in sync incrementally by the category stats service so
+    category listings never have to aggregate the catalog tables.
+    """
+    __tablename__ = "category_stats"
+
+    # Keyed by the category string stored on products/services
+    category_name = Column(String(100), primary_key=True)
+
+    product_count = Column(Integer, nullable=False, default=0)
+    service_count = Column(Integer, nullable=False, default=0)
+
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -0,0 +1,40 @@
+from sqlalchemy import Column, DateTime, Float, Integer, String, Index
+from sqlalchemy.sql import func
+from app.database.base import Base
+
+
+class DashboardRollup(Base):
+    """
+    Pre-aggregated admin dashboard metrics.
+
+    One row per (granularity, bucket_start, metric, dimension, currency):
+    - granularity "hour" / "day": time-bucketed events (signups, revenue)
+    - granularity "total": running totals and gauges (customers,
+      subscriptions per plan, lifetime revenue); bucket_start is fixed
+
+    Kept in sync incrementally by the dashboard rollup service.
+    """
+    __tablename__ = "dashboard_rollups"
+
+    # hour, day, total
+    granularity = Column(String(10), primary_key=True)
+
+    # Start of the bucket in UTC (naive)
+    bucket_start = Column(DateTime, primary_key=True)
+
+    # signups, customers, revenue, subscriptions, active_subscriptions
+    metric = Column(String(50), primary_key=True)
+
+    # Gateway for revenue, plan id for subscriptions, "" otherwise
+    dimension = Column(String(100), primary_key=True, default="")
+    currency = Column(String(10), primary_key=True, default="")
+
+    value = Column(Float, nullable=False, default=0)
+    count = Column(Integer, nullable=False, default=0)
+
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        # Time-series reads: one metric over a bucket range
+        Index("ix_dashboard_rollups_series", "metric", "granularity", "bucket_start"),
+    )
@@ -0,0 +1,16 @@
+from sqlalchemy import Column, String, DateTime
+from sqlalchemy.sql import func
+from app.database.base import Base
+
+
+class DerivedTableBuild(Base):
+    """
+    One row per derived table (category_stats, dashboard_rollups, ...)
+    that has had a complete build from its source tables.
+    """
+    __tablename__ = "derived_table_builds"
+
+    # Name of the derived table
+    table_name = Column(String(100), primary_key=True)
+
+    built_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
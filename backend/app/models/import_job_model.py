@@ -0,0 +1,33 @@
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, JSON
+from sqlalchemy.sql import func
+from app.database.base import Base
+
+
+class ImportJob(Base):
+    """
+    A tenant's catalog file import (products or services).
+    Rows are loaded in chunks after the upload request returns;
+    this row reports progress and per-row errors.
+    """
+    __tablename__ = "import_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    tenant_id = Column(Integer, ForeignKey("customer_users.id"), nullable=False, index=True)
+
+    resource = Column(String(50), nullable=False)  # products / services
+    file_name = Column(String(255), nullable=True)
+    file_format = Column(String(10), nullable=False)  # csv / jsonl
+    size_bytes = Column(Integer, nullable=True)
+
+    # PENDING -> RUNNING -> COMPLETED / FAILED
+    status = Column(String(20), nullable=False, default="PENDING", index=True)
+    processed_rows = Column(Integer, nullable=False, default=0)
+    created_count = Column(Integer, nullable=False, default=0)
+    error_count = Column(Integer, nullable=False, default=0)
+    # First IMPORT_MAX_STORED_ERRORS row errors: [{"row": n, "errors": [...]}]
+    errors = Column(JSON, nullable=True)
+    last_error = Column(Text, nullable=True)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
@@ -0,0 +1,19 @@
+from sqlalchemy import Column, BigInteger, String, DateTime
+from sqlalchemy.sql import func
+from app.database.base import Base
+
+
+class PlatformStats(Base):
+    """
+    Platform-wide row counters (businesses, products, services, ...).
+    Adjusted incrementally on create/delete and reconciled periodically,
+    so the public stats endpoint never counts whole tables.
+    """
+    __tablename__ = "platform_stats"
+
+    # Counter name, e.g. "products"
+    name = Column(String(50), primary_key=True)
+
+    value = Column(BigInteger, nullable=False, default=0)
+
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
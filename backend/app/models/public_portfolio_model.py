@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, Boolean, Enum
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, Boolean, Enum, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database.base import Base
@@ -39,6 +39,16 @@ class PublicPortfolio(Base):
     company_info = relationship("CompanyInfo", backref="portfolio_items")
     likes = relationship("PublicLike", back_populates="portfolio_item", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # Public feed and per-tenant portfolio: active items, newest first
+        Index("ix_public_portfolio_active_created_at", created_at.desc(),
+              postgresql_where=text("is_active"), sqlite_where=text("is_active = 1")),
+        Index("ix_public_portfolio_tenant_active_created_at", "tenant_id", created_at.desc(),
+              postgresql_where=text("is_active"), sqlite_where=text("is_active = 1")),
+        # Portfolio sync looks rows up by their source item
+        Index("ix_public_portfolio_item", "item_type", "item_id"),
+    )
+
 class PublicLike(Base):
     """
     Likes on portfolio items.
@@ -0,0 +1,21 @@
+from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy.sql import func
+from app.database.base import Base
+
+
+class RevokedToken(Base):
+    """
+    Access tokens revoked before their expiry (logout), by jti.
+    Rows are purged once the token would have expired anyway.
+    """
+    __tablename__ = "revoked_tokens"
+
+    jti = Column(String(64), primary_key=True)
+
+    user_id = Column(Integer, index=True, nullable=True)
+
+    # Token's own exp; the row is useless after this
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
+
+    # Watermark for incremental sync into each process's filter
+    revoked_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), index=True)
@@ -27,6 +27,9 @@ class User(Base):
     full_name = Column(String(255), nullable=True)
     tenant_id = Column(Integer, nullable=True)  # For multi-tenant isolation (customer's user ID)
     
+    # Bumped on password/role/activation changes; tokens with an older "ver" are rejected
+    token_version = Column(Integer, nullable=False, default=0, server_default="0")
+    
     roles = relationship("Role", secondary=user_roles, backref="users")
     
     # Dynamic Relationships
@@ -0,0 +1,226 @@
+"""
+Shared HTTP client layer for payment gateway calls.
+
+One client per gateway per process, with:
+- a pooled keep-alive requests.Session, also handed to the gateway SDKs
+- connect/read timeouts on every request
+- bounded retries for connection failures (and idempotent GETs on 5xx)
+- a circuit breaker that fails fast while the gateway is down
+"""
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from app.core.config import settings
+
+
+class GatewayError(Exception):
+    """Gateway call failed."""
+    pass
+
+
+class GatewayUnavailableError(GatewayError):
+    """Gateway timed out, refused the connection, or the circuit is open."""
+    pass
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    - closed: calls pass; `failure_threshold` failures in a row open it
+    - open: calls fail fast for `reset_timeout` seconds
+    - half-open: one trial call; success closes, failure re-opens, any
+      other outcome (an API or programming error) leaves it half-open
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state()
+
+    def _state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+
+    def allow(self) -> bool:
+        with self._lock:
+            state = self._state()
+            if state == "closed":
+                return True
+            if state == "half-open" and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def release(self):
+        """Ends a call that says nothing about the gateway; frees the half-open trial."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self._opened_at is not None or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+
+
+class _TimeoutSession(requests.Session):
+    """requests.Session that applies a default timeout (SDKs do not pass one)."""
+
+    def __init__(self, timeout: Tuple[float, float]):
+        super().__init__()
+        self.default_timeout = timeout
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", self.default_timeout)
+        return super().request(method, url, **kwargs)
+
+
+class GatewayHTTPClient:
+    """Pooled, timeout-bounded, circuit-broken HTTP client for one gateway."""
+
+    def __init__(
+        self,
+        name: str,
+        base_url: str = "",
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        max_retries: Optional[int] = None,
+        pool_size: Optional[int] = None,
+        breaker: Optional[CircuitBreaker] = None
+    ):
+        self.name = name
+        self.base_url = base_url.rstrip("/")
+        self.connect_timeout = settings.GATEWAY_CONNECT_TIMEOUT if connect_timeout is None else connect_timeout
+        self.read_timeout = settings.GATEWAY_READ_TIMEOUT if read_timeout is None else read_timeout
+        self.max_retries = settings.GATEWAY_MAX_RETRIES if max_retries is None else max_retries
+        self.pool_size = settings.GATEWAY_POOL_SIZE if pool_size is None else pool_size
+        self.breaker = breaker or CircuitBreaker(
+            settings.GATEWAY_BREAKER_THRESHOLD, settings.GATEWAY_BREAKER_RESET_SECONDS
+        )
+        # Exceptions that mean "gateway unreachable"; SDKs add their own wrappers
+        self.transport_errors: Tuple[type, ...] = (requests.ConnectionError, requests.Timeout)
+        self._session: Optional[_TimeoutSession] = None
+        self._lock = threading.Lock()
+
+    @property
+    def timeout(self) -> Tuple[float, float]:
+        return (self.connect_timeout, self.read_timeout)
+
+    def _url(self, path: str) -> str:
+        return path if path.startswith("http") else f"{self.base_url}{path}"
+
+    # ============ Sync ============
+
+    @property
+    def session(self) -> requests.Session:
+        """Shared keep-alive session; also handed to gateway SDKs."""
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    # Connection errors are retried for every method (nothing was sent);
+                    # 5xx responses only for GET, so POSTs never create duplicate orders
+                    retry = Retry(
+                        total=self.max_retries,
+                        connect=self.max_retries,
+                        read=0,
+                        status=self.max_retries,
+                        status_forcelist=(502, 503, 504),
+                        allowed_methods=frozenset({"GET"}),
+                        backoff_factor=0.2,
+                        raise_on_status=False
+                    )
+                    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size, max_retries=retry)
+                    session = _TimeoutSession(self.timeout)
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    self._session = session
+        return self._session
+
+    def call(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Runs a gateway call (ours or an SDK's) behind the circuit breaker.
+        Transport failures count against the breaker; API errors do not.
+        """
+        if not self.breaker.allow():
+            raise GatewayUnavailableError(f"{self.name} is unavailable (circuit open)")
+        try:
+            result = func(*args, **kwargs)
+        except self.transport_errors as e:
+            self.breaker.record_failure()
+            raise GatewayUnavailableError(f"{self.name} request failed: {e}") from e
+        except BaseException:
+            self.breaker.release()
+            raise
+        self.breaker.record_success()
+        return result
+
+    def _send(self, method: str, path: str, **kwargs) -> requests.Response:
+        response = self.session.request(method, self._url(path), **kwargs)
+        if response.status_code >= 500:
+            raise requests.ConnectionError(f"HTTP {response.status_code}")
+        return response
+
+    def request(self, method: str, path: str, **kwargs) -> requests.Response:
+        return self.call(self._send, method, path, **kwargs)
+
+    def get(self, path: str, **kwargs) -> requests.Response:
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path: str, **kwargs) -> requests.Response:
+        return self.request("POST", path, **kwargs)
+
+    # ============ Lifecycle ============
+
+    def close(self):
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+
+_clients: Dict[str, GatewayHTTPClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_gateway_client(name: str, base_url: str = "") -> GatewayHTTPClient:
+    """Process-wide client for a gateway, created on first use."""
+    client = _clients.get(name)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(name)
+            if client is None:
+                client = GatewayHTTPClient(name, base_url)
+                _clients[name] = client
+    return client
+
+
+def close_gateway_clients():
+    """Closes every pooled connection; called at application shutdown."""
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        client.close()
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, JSON, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, Float, DateTime, JSON, ForeignKey, Text, Index, UniqueConstraint
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.database.base import Base
@@ -43,3 +43,41 @@ class PaymentHistory(Base):
     
     # Relationships
     subscription = relationship("CustomerSubscription", back_populates="payments")
+
+
+class WebhookEvent(Base):
+    """
+    Every payment gateway webhook as received, before it is applied.
+    The (gateway, event_id) unique constraint makes gateway retries and
+    replays a no-op; a background worker applies pending events.
+    """
+    __tablename__ = "webhook_events"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    
+    # razorpay, stripe, phonepe
+    gateway = Column(String(20), nullable=False)
+    
+    # Gateway event id (or transaction id when the gateway has no event id)
+    event_id = Column(String(255), nullable=False)
+    event_type = Column(String(100), nullable=True)
+    
+    payload = Column(JSON, nullable=False)
+    
+    # Status: PENDING, PROCESSING, PROCESSED, IGNORED, FAILED
+    status = Column(String(20), default="PENDING", nullable=False)
+    attempts = Column(Integer, default=0, nullable=False)
+    last_error = Column(Text, nullable=True)
+    
+    # When the event is next due (retry backoff, or lease expiry while PROCESSING)
+    next_attempt_at = Column(DateTime(timezone=True), nullable=True)
+    processed_at = Column(DateTime(timezone=True), nullable=True)
+    
+    # Timestamps
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    
+    __table_args__ = (
+        UniqueConstraint("gateway", "event_id", name="uq_webhook_events_gateway_event"),
+        Index("ix_webhook_events_due", "status", "next_attempt_at"),
+    )
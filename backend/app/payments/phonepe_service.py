@@ -1,8 +1,8 @@
 import hashlib
 import base64
-import requests
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 from app.core.config import settings
+from app.payments.gateway_client import get_gateway_client
 
 class PhonePeService:
     """
@@ -17,6 +17,7 @@ class PhonePeService:
         self.salt_key = settings.PHONEPE_SALT_KEY
         self.salt_index = settings.PHONEPE_SALT_INDEX
         self.base_url = settings.PHONEPE_BASE_URL  # Production or UAT
+        self.http = get_gateway_client("phonepe", self.base_url)
     
     def create_payment(self, amount: float, customer_id: int, plan_id: int) -> Dict[str, Any]:
         """
@@ -51,6 +52,12 @@ class PhonePeService:
                 "mode": "demo"  # Flag indicating demo mode
             }
         
+        path, request_payload, headers = self._pay_request(transaction_id, amount_in_paise, customer_id)
+        response = self.http.post(path, json=request_payload, headers=headers)
+        return self._pay_result(response.json(), transaction_id, amount)
+    
+    def _pay_request(self, transaction_id: str, amount_in_paise: int, customer_id: int) -> Tuple[str, Dict[str, Any], Dict[str, str]]:
+        """Builds path, body and signed headers for /pg/v1/pay."""
         # Create payment payload
         payload = {
             "merchantId": self.merchant_id,
@@ -76,21 +83,18 @@ class PhonePeService:
         checksum = hashlib.sha256(checksum_string.encode()).hexdigest()
         checksum_with_index = f"{checksum}###{self.salt_index}"
         
-        # Make API request
         headers = {
             "Content-Type": "application/json",
             "X-VERIFY": checksum_with_index
         }
         
-        api_url = f"{self.base_url}/pg/v1/pay"
-        
         request_payload = {
             "request": payload_base64
         }
         
-        response = requests.post(api_url, json=request_payload, headers=headers)
-        response_data = response.json()
-        
+        return "/pg/v1/pay", request_payload, headers
+    
+    def _pay_result(self, response_data: Dict[str, Any], transaction_id: str, amount: float) -> Dict[str, Any]:
         if response_data.get("success"):
             payment_url = response_data["data"]["instrumentResponse"]["redirectInfo"]["url"]
             
@@ -113,24 +117,26 @@ class PhonePeService:
         Returns:
             Payment status details
         """
+        path, headers = self._status_request(transaction_id)
+        response = self.http.get(path, headers=headers)
+        return response.json()
+    
+    def _status_request(self, transaction_id: str) -> Tuple[str, Dict[str, str]]:
+        """Builds path and signed headers for a status check."""
+        path = f"/pg/v1/status/{self.merchant_id}/{transaction_id}"
+        
         # Generate checksum for status check
-        checksum_string = f"/pg/v1/status/{self.merchant_id}/{transaction_id}" + self.salt_key
+        checksum_string = path + self.salt_key
         checksum = hashlib.sha256(checksum_string.encode()).hexdigest()
         checksum_with_index = f"{checksum}###{self.salt_index}"
         
-        # Make status check request
         headers = {
             "Content-Type": "application/json",
             "X-VERIFY": checksum_with_index,
             "X-MERCHANT-ID": self.merchant_id
         }
         
-        api_url = f"{self.base_url}/pg/v1/status/{self.merchant_id}/{transaction_id}"
-        
-        response = requests.get(api_url, headers=headers)
-        response_data = response.json()
-        
-        return response_data
+        return path, headers
     
     def verify_callback_checksum(self, response_base64: str, checksum: str) -> bool:
         """
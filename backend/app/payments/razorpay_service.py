@@ -1,6 +1,9 @@
-import razorpay
-from typing import Dict, Any
+import hashlib
+import hmac
+from functools import lru_cache
+from typing import Dict, Any, Optional
 from app.core.config import settings
+from app.payments.gateway_client import get_gateway_client
 
 class RazorpayService:
     """
@@ -9,7 +12,15 @@ class RazorpayService:
     """
     
     def __init__(self):
-        self.client = razorpay.Client(auth=(settings.RAZORPAY_KEY_ID, settings.RAZORPAY_KEY_SECRET))
+        # Imported on first use: only upgrade and payment paths need the SDK
+        import razorpay
+        
+        # SDK calls share the pooled, timeout-bounded gateway session
+        self.http = get_gateway_client("razorpay")
+        self.client = razorpay.Client(
+            session=self.http.session,
+            auth=(settings.RAZORPAY_KEY_ID, settings.RAZORPAY_KEY_SECRET)
+        )
     
     def create_order(self, amount: float, currency: str, customer_id: int, plan_id: int) -> Dict[str, Any]:
         """
@@ -39,7 +50,7 @@ class RazorpayService:
             }
         }
         
-        order = self.client.order.create(data=order_data)
+        order = self.http.call(self.client.order.create, data=order_data)
         
         # Generate payment URL (for hosted checkout)
         payment_url = f"https://api.razorpay.com/v1/checkout/embedded?order_id={order['id']}&key_id={settings.RAZORPAY_KEY_ID}"
@@ -63,6 +74,8 @@ class RazorpayService:
         Returns:
             True if signature is valid
         """
+        import razorpay
+        
         try:
             params_dict = {
                 'razorpay_order_id': order_id,
@@ -77,4 +90,21 @@ class RazorpayService:
     
     def get_payment_details(self, payment_id: str) -> Dict[str, Any]:
         """Get payment details from Razorpay"""
-        return self.client.payment.fetch(payment_id)
+        return self.http.call(self.client.payment.fetch, payment_id)
+
+
+@lru_cache(maxsize=1)
+def get_razorpay_service() -> RazorpayService:
+    """Process-wide service instance (one SDK client, one connection pool)."""
+    return RazorpayService()
+
+
+def verify_webhook_signature(body: bytes, signature: Optional[str]) -> bool:
+    """
+    Verify a Razorpay webhook: X-Razorpay-Signature is the hex HMAC-SHA256
+    of the raw body with the webhook secret. Needs no SDK client.
+    """
+    if not signature or not settings.RAZORPAY_WEBHOOK_SECRET:
+        return False
+    expected = hmac.new(settings.RAZORPAY_WEBHOOK_SECRET.encode(), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, signature)
@@ -1,6 +1,7 @@
-import stripe
+from functools import lru_cache
 from typing import Dict, Any
 from app.core.config import settings
+from app.payments.gateway_client import GatewayHTTPClient, get_gateway_client
 
 class StripeService:
     """
@@ -8,8 +9,9 @@ class StripeService:
     Handles checkout session creation and webhook verification.
     """
     
-    def __init__(self):
-        stripe.api_key = settings.STRIPE_SECRET_KEY
+    def __init__(self, http: GatewayHTTPClient):
+        # The stripe module itself is configured once, by get_stripe_service
+        self.http = http
     
     def create_checkout_session(self, amount: float, currency: str, customer_id: int, plan_id: int) -> Dict[str, Any]:
         """
@@ -24,11 +26,14 @@ class StripeService:
         Returns:
             Dict with session_id and checkout URL
         """
+        import stripe
+        
         # Convert amount to smallest currency unit (paise for INR, cents for USD)
         amount_in_cents = int(amount * 100)
         
         # Create checkout session
-        session = stripe.checkout.Session.create(
+        session = self.http.call(
+            stripe.checkout.Session.create,
             payment_method_types=['card'],
             line_items=[{
                 'price_data': {
@@ -72,6 +77,8 @@ class StripeService:
         Raises:
             ValueError: If signature verification fails
         """
+        import stripe
+        
         try:
             event = stripe.Webhook.construct_event(
                 payload, sig_header, settings.STRIPE_WEBHOOK_SECRET
@@ -84,4 +91,25 @@ class StripeService:
     
     def get_session_details(self, session_id: str) -> Dict[str, Any]:
         """Get checkout session details from Stripe"""
-        return stripe.checkout.Session.retrieve(session_id)
+        import stripe
+        return self.http.call(stripe.checkout.Session.retrieve, session_id)
+
+
+@lru_cache(maxsize=1)
+def get_stripe_service() -> StripeService:
+    """
+    Process-wide service instance (one HTTP client, one connection pool).
+    Configures the stripe module and the pooled "stripe" client on first use.
+    """
+    # Imported on first use: only upgrade, payment and webhook paths need the SDK
+    import stripe
+
+    # Retries are left to the SDK, which sends idempotency keys with them
+    http = get_gateway_client("stripe")
+    http.max_retries = 0
+    http.transport_errors += (stripe.APIConnectionError,)
+
+    stripe.api_key = settings.STRIPE_SECRET_KEY
+    stripe.max_network_retries = settings.GATEWAY_MAX_RETRIES
+    stripe.default_http_client = stripe.RequestsClient(timeout=http.timeout, session=http.session)
+    return StripeService(http)
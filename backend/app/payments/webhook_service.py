@@ -0,0 +1,312 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+from sqlalchemy import or_, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.payments.models import PaymentHistory, WebhookEvent
+from app.subscriptions.service import SubscriptionService
+
+logger = logging.getLogger(__name__)
+
+# How long a claimed event stays PROCESSING before another worker may retry it
+PROCESSING_LEASE = timedelta(minutes=5)
+
+
+class WebhookEventError(Exception):
+    """Event can never be applied (bad metadata); marked FAILED without retries."""
+    pass
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+# ============ Intake ============
+
+def record_webhook_event(
+    db: Session,
+    gateway: str,
+    event_id: str,
+    event_type: Optional[str],
+    payload: Dict[str, Any]
+) -> Optional[int]:
+    """
+    Stores a webhook event. Returns its id, or None when the same
+    (gateway, event_id) was already received.
+    """
+    values = dict(
+        gateway=gateway,
+        event_id=event_id,
+        event_type=event_type,
+        payload=payload,
+        status="PENDING",
+        attempts=0,
+        next_attempt_at=_now()
+    )
+    table = WebhookEvent.__table__
+    dialect = db.get_bind().dialect.name
+
+    if dialect in ("postgresql", "sqlite"):
+        insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        stmt = insert(table).values(**values).on_conflict_do_nothing(
+            index_elements=[table.c.gateway, table.c.event_id]
+        ).returning(table.c.id)
+        row = db.execute(stmt).first()
+        db.commit()
+        return row[0] if row else None
+
+    event = WebhookEvent(**values)
+    db.add(event)
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        return None
+    return event.id
+
+
+# ============ Gateway handlers ============
+
+def _apply_payment(
+    db: Session,
+    gateway: str,
+    customer_id: int,
+    plan_id: int,
+    transaction_id: str,
+    amount: float,
+    currency: str,
+    payment_status: str,
+    metadata: Dict[str, Any],
+    notes: str
+) -> int:
+    """
+    Records a gateway payment and extends the customer's subscription.
+    A payment already on file (replay, or captured after authorized)
+    only has its status updated; the subscription is never renewed twice.
+    """
+    existing = db.query(PaymentHistory).filter(PaymentHistory.transaction_id == transaction_id).first()
+    if existing:
+        if payment_status == "SUCCESS" and existing.payment_status != "SUCCESS":
+            existing.payment_status = "SUCCESS"
+            db.commit()
+        return existing.subscription_id
+
+    payment_record = PaymentHistory(
+        amount=amount,
+        currency=currency,
+        payment_gateway=gateway,
+        transaction_id=transaction_id,
+        payment_status=payment_status,
+        payment_metadata=metadata,
+        notes=notes
+    )
+
+    subscription_service = SubscriptionService(db)
+    subscription = subscription_service.get_customer_subscription(customer_id)
+
+    if not subscription:
+        # Create new subscription
+        subscription = subscription_service.assign_subscription(customer_id, plan_id)
+        payment_record.subscription_id = subscription.id
+        db.add(payment_record)
+        db.commit()
+    else:
+        # Renew existing subscription; the renewal commit also stores the payment
+        payment_record.subscription_id = subscription.id
+        db.add(payment_record)
+        subscription_service.renew_subscription(subscription.id)
+
+    return subscription.id
+
+
+def _handle_razorpay(db: Session, payload: Dict[str, Any]) -> Optional[int]:
+    event = payload.get("event")
+    if event not in ["payment.authorized", "payment.captured"]:
+        return None
+
+    payment_entity = payload.get("payload", {}).get("payment", {}).get("entity", {})
+    notes = payment_entity.get("notes", {})
+    customer_id = int(notes.get("customer_id", 0))
+    plan_id = int(notes.get("plan_id", 0))
+    if not customer_id or not plan_id:
+        raise WebhookEventError("Invalid payment metadata")
+
+    payment_id = payment_entity.get("id")
+    return _apply_payment(
+        db,
+        gateway="razorpay",
+        customer_id=customer_id,
+        plan_id=plan_id,
+        transaction_id=payment_id,
+        amount=payment_entity.get("amount", 0) / 100,  # Convert from paise
+        currency=payment_entity.get("currency", "INR"),
+        payment_status="SUCCESS" if payment_entity.get("status") == "captured" else "PENDING",
+        metadata={
+            "order_id": payment_entity.get("order_id"),
+            "razorpay_payment_id": payment_id,
+            "event": event
+        },
+        notes=f"Razorpay payment {event}"
+    )
+
+
+def _handle_stripe(db: Session, payload: Dict[str, Any]) -> Optional[int]:
+    if payload.get("type") != "checkout.session.completed":
+        return None
+
+    session = payload.get("data", {}).get("object", {})
+    metadata = session.get("metadata") or {}
+    customer_id = int(metadata.get("customer_id", 0))
+    plan_id = int(metadata.get("plan_id", 0))
+    if not customer_id or not plan_id:
+        raise WebhookEventError("Invalid session metadata")
+
+    payment_intent = session.get("payment_intent")
+    return _apply_payment(
+        db,
+        gateway="stripe",
+        customer_id=customer_id,
+        plan_id=plan_id,
+        transaction_id=payment_intent or session.get("id"),
+        amount=session.get("amount_total", 0) / 100,  # Convert from cents
+        currency=session.get("currency", "usd").upper(),
+        payment_status="SUCCESS",
+        metadata={
+            "session_id": session.get("id"),
+            "payment_intent": payment_intent,
+            "event": payload.get("type")
+        },
+        notes="Stripe checkout completed"
+    )
+
+
+def _handle_phonepe(db: Session, payload: Dict[str, Any]) -> Optional[int]:
+    if not (payload.get("success") and payload.get("code") == "PAYMENT_SUCCESS"):
+        return None
+
+    transaction_data = payload.get("data", {})
+    transaction_id = transaction_data.get("merchantTransactionId") or ""
+
+    # Format: TXN_{customer_id}_{plan_id}_{timestamp}
+    parts = transaction_id.split("_")
+    if len(parts) < 3:
+        raise WebhookEventError(f"Unrecognised transaction id: {transaction_id}")
+
+    return _apply_payment(
+        db,
+        gateway="phonepe",
+        customer_id=int(parts[1]),
+        plan_id=int(parts[2]),
+        transaction_id=transaction_id,
+        amount=transaction_data.get("amount", 0) / 100,  # Convert from paise
+        currency="INR",
+        payment_status="SUCCESS",
+        metadata={
+            "transaction_id": transaction_id,
+            "payment_instrument": transaction_data.get("paymentInstrument"),
+            "response": payload
+        },
+        notes="PhonePe payment success"
+    )
+
+
+_HANDLERS = {
+    "razorpay": _handle_razorpay,
+    "stripe": _handle_stripe,
+    "phonepe": _handle_phonepe,
+}
+
+
+# ============ Processing ============
+
+def _claim(db: Session, event_pk: int) -> bool:
+    """Atomically moves a due event to PROCESSING; False if someone else has it."""
+    now = _now()
+    result = db.execute(
+        update(WebhookEvent)
+        .where(
+            WebhookEvent.id == event_pk,
+            WebhookEvent.status.in_(["PENDING", "PROCESSING"]),
+            or_(WebhookEvent.next_attempt_at.is_(None), WebhookEvent.next_attempt_at <= now)
+        )
+        .values(status="PROCESSING", attempts=WebhookEvent.attempts + 1, next_attempt_at=now + PROCESSING_LEASE)
+    )
+    db.commit()
+    return result.rowcount == 1
+
+
+def process_webhook_event(db: Session, event_pk: int) -> Optional[str]:
+    """
+    Applies one stored event. Returns its new status, or None if it was
+    not due or is being processed elsewhere.
+    Transient errors are retried with exponential backoff up to
+    WEBHOOK_MAX_ATTEMPTS; WebhookEventError fails the event immediately.
+    """
+    if not _claim(db, event_pk):
+        return None
+
+    event = db.get(WebhookEvent, event_pk)
+    error = None
+    try:
+        applied = _HANDLERS[event.gateway](db, event.payload)
+        status = "PROCESSED" if applied else "IGNORED"
+    except WebhookEventError as e:
+        db.rollback()
+        status, error = "FAILED", str(e)
+    except Exception as e:
+        db.rollback()
+        logger.exception(f"Webhook event {event_pk} failed")
+        error = str(e)
+        status = "FAILED" if event.attempts >= settings.WEBHOOK_MAX_ATTEMPTS else "PENDING"
+
+    event = db.get(WebhookEvent, event_pk)
+    event.status = status
+    event.last_error = error
+    if status == "PENDING":
+        backoff = settings.WEBHOOK_RETRY_BASE_SECONDS * 2 ** (event.attempts - 1)
+        event.next_attempt_at = _now() + timedelta(seconds=backoff)
+    else:
+        event.next_attempt_at = None
+        event.processed_at = _now()
+    db.commit()
+    return status
+
+
+def process_webhook_event_in_background(session_factory, event_pk: int):
+    """Entry point for FastAPI BackgroundTasks: runs on its own session."""
+    db = session_factory()
+    try:
+        process_webhook_event(db, event_pk)
+    finally:
+        db.close()
+
+
+def process_due_webhook_events(session_factory, limit: int = 50) -> int:
+    """Processes events that are pending, due for retry, or whose lease expired."""
+    db = session_factory()
+    try:
+        due = db.query(WebhookEvent.id).filter(
+            WebhookEvent.status.in_(["PENDING", "PROCESSING"]),
+            WebhookEvent.next_attempt_at <= _now()
+        ).order_by(WebhookEvent.id).limit(limit).all()
+        for (event_pk,) in due:
+            process_webhook_event(db, event_pk)
+        return len(due)
+    finally:
+        db.close()
+
+
+async def run_webhook_worker(session_factory):
+    """Background loop started at application startup."""
+    from starlette.concurrency import run_in_threadpool
+
+    while True:
+        try:
+            await run_in_threadpool(process_due_webhook_events, session_factory)
+        except Exception as e:
+            logger.warning(f"Webhook worker pass failed: {e}")
+        await asyncio.sleep(settings.WEBHOOK_POLL_SECONDS)
@@ -1,12 +1,21 @@
-from fastapi import APIRouter, Depends, HTTPException, Request
-from sqlalchemy.orm import Session
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session, load_only
 from sqlalchemy import func, or_, and_
 from typing import List, Optional
 import json
 from pydantic import BaseModel, EmailStr
+from app.database import connection
 from app.database.connection import get_db
 from app.services.public_portfolio_service import PublicPortfolioService
 from app.schemas.public_portfolio_schema import PublicPortfolioResponse, PublicLikeCreate
+from app.services.category_stats_service import get_category_counts
+from app.services.platform_stats_service import get_platform_counts
+from app.services.search_facets_service import compute_facets, get_cached_facets
+from app.utils.pagination import paginate_with_total, set_total_headers
+from app.utils.responses import json_response
+from app.utils.cache import StaleWhileRevalidateCache
 
 # Import models for direct queries
 from app.company.models.company_info_model import CompanyInfo
@@ -19,7 +28,6 @@ from app.company.models.company_blog_posts_model import CompanyBlogPost
 from app.company.models.company_careers_model import CompanyCareer
 from app.company.models.company_gallery_images_model import CompanyGalleryImage
 from app.company.models.company_inquiries_model import CompanyInquiry
-from app.customer.models.customer_user_model import CustomerUser
 from app.admin.models.category_model import Category
 from app.models.site_settings_model import SiteSettings
 
@@ -77,20 +85,66 @@ def like_portfolio_item(id: int, request: Request, db: Session = Depends(get_db)
         return {"message": "Liked successfully"}
     return {"message": "Already liked"}
 
+# ============ LIST CARD COLUMNS ============
+# List endpoints load only the columns their cards serialize (no
+# full_description, specifications, gallery_images...). raiseload makes
+# touching any other column an error rather than a query per row.
+
+BUSINESS_CARD_COLUMNS = (
+    CompanyInfo.tenant_id, CompanyInfo.company_name, CompanyInfo.logo_url, CompanyInfo.industry,
+    CompanyInfo.city, CompanyInfo.state, CompanyInfo.tagline, CompanyInfo.about
+)
+PRODUCT_CARD_COLUMNS = (
+    CompanyProduct.tenant_id, CompanyProduct.name, CompanyProduct.slug, CompanyProduct.main_image_url,
+    CompanyProduct.price, CompanyProduct.category, CompanyProduct.short_description
+)
+SERVICE_CARD_COLUMNS = (
+    CompanyService.tenant_id, CompanyService.title, CompanyService.slug, CompanyService.icon_url,
+    CompanyService.banner_image_url, CompanyService.category, CompanyService.pricing,
+    CompanyService.short_description
+)
+BLOG_CARD_COLUMNS = (
+    CompanyBlogPost.tenant_id, CompanyBlogPost.title, CompanyBlogPost.slug, CompanyBlogPost.excerpt,
+    CompanyBlogPost.content, CompanyBlogPost.featured_image_url, CompanyBlogPost.category,
+    CompanyBlogPost.tags, CompanyBlogPost.author, CompanyBlogPost.published_at
+)
+# What product/service/blog cards show about their business
+COMPANY_REF_COLUMNS = (CompanyInfo.tenant_id, CompanyInfo.company_name, CompanyInfo.city)
+
+
+def _card_columns(*columns):
+    return load_only(*columns, raiseload=True)
+
+
+# ============ BATCH LOOKUP HELPERS ============
+
+def _companies_by_tenant(db: Session, tenant_ids) -> dict:
+    """Load the CompanyInfo card references for many tenants in one query, keyed by tenant_id."""
+    tenant_ids = set(tenant_ids)
+    if not tenant_ids:
+        return {}
+    companies = db.query(CompanyInfo).options(_card_columns(*COMPANY_REF_COLUMNS)).filter(
+        CompanyInfo.tenant_id.in_(tenant_ids)
+    ).all()
+    return {c.tenant_id: c for c in companies}
+
+
+def _counts_by_tenant(db: Session, model, tenant_ids) -> dict:
+    """Count rows of a tenant-scoped model for many tenants with one GROUP BY."""
+    tenant_ids = set(tenant_ids)
+    if not tenant_ids:
+        return {}
+    rows = db.query(model.tenant_id, func.count(model.id)).filter(
+        model.tenant_id.in_(tenant_ids)
+    ).group_by(model.tenant_id).all()
+    return dict(rows)
+
+
 # ============ LANDING PAGE APIs ============
 
-@router.get("/businesses")
-def get_featured_businesses(
-    skip: int = 0,
-    limit: int = 10,
-    industry: Optional[str] = None,
-    db: Session = Depends(get_db)
-):
-    """
-    Get list of businesses for landing page.
-    Returns company info with product/service counts.
-    """
-    query = db.query(CompanyInfo)
+def _business_cards(db: Session, skip: int, limit: int, industry: Optional[str]):
+    """One page of business cards, with the total and whether it is exact."""
+    query = db.query(CompanyInfo).options(_card_columns(*BUSINESS_CARD_COLUMNS))
     
     if industry:
         query = query.filter(CompanyInfo.industry == industry)
@@ -98,19 +152,17 @@ def get_featured_businesses(
     # Get companies with at least some data filled
     query = query.filter(CompanyInfo.company_name.isnot(None))
     
-    companies = query.order_by(CompanyInfo.created_at.desc()).offset(skip).limit(limit).all()
+    companies, total, exact = paginate_with_total(db, query.order_by(CompanyInfo.created_at.desc()), skip, limit)
+    
+    # Product/service counts for the whole page in two grouped queries
+    tenant_ids = [c.tenant_id for c in companies]
+    product_counts = _counts_by_tenant(db, CompanyProduct, tenant_ids)
+    service_counts = _counts_by_tenant(db, CompanyService, tenant_ids)
     
     result = []
     for company in companies:
-        # Count products for this tenant
-        product_count = db.query(func.count(CompanyProduct.id)).filter(
-            CompanyProduct.tenant_id == company.tenant_id
-        ).scalar() or 0
-        
-        # Count services for this tenant
-        service_count = db.query(func.count(CompanyService.id)).filter(
-            CompanyService.tenant_id == company.tenant_id
-        ).scalar() or 0
+        product_count = product_counts.get(company.tenant_id, 0)
+        service_count = service_counts.get(company.tenant_id, 0)
         
         result.append({
             "id": company.id,
@@ -128,32 +180,41 @@ def get_featured_businesses(
             "reviews": 0  # Placeholder for reviews count
         })
     
-    return result
+    return result, total, exact
 
 
-@router.get("/products")
-def get_latest_products(
+@router.get("/businesses")
+def get_featured_businesses(
+    response: Response,
     skip: int = 0,
-    limit: int = 12,
-    category: Optional[str] = None,
+    limit: int = 10,
+    industry: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
     """
-    Get latest products for landing page.
+    Get list of businesses for landing page.
+    Returns company info with product/service counts.
+    Total matches are reported in the X-Total-Count header.
     """
-    query = db.query(CompanyProduct)
+    result, total, exact = _business_cards(db, skip, limit, industry)
+    set_total_headers(response, total, exact)
+    return json_response(result, response)
+
+
+def _product_cards(db: Session, skip: int, limit: int, category: Optional[str]):
+    """One page of the latest product cards, with the total and whether it is exact."""
+    query = db.query(CompanyProduct).options(_card_columns(*PRODUCT_CARD_COLUMNS))
     
     if category:
         query = query.filter(CompanyProduct.category == category)
     
-    products = query.order_by(CompanyProduct.created_at.desc()).offset(skip).limit(limit).all()
+    products, total, exact = paginate_with_total(db, query.order_by(CompanyProduct.created_at.desc()), skip, limit)
+    
+    companies = _companies_by_tenant(db, (p.tenant_id for p in products))
     
     result = []
     for product in products:
-        # Get company info for this product's tenant
-        company = db.query(CompanyInfo).filter(
-            CompanyInfo.tenant_id == product.tenant_id
-        ).first()
+        company = companies.get(product.tenant_id)
         
         result.append({
             "id": product.id,
@@ -171,32 +232,42 @@ def get_latest_products(
             "description": product.short_description
         })
     
-    return result
+    return result, total, exact
 
 
-@router.get("/services")
-def get_latest_services(
+@router.get("/products")
+def get_latest_products(
+    response: Response,
     skip: int = 0,
     limit: int = 12,
     category: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
     """
-    Get latest services for landing page.
+    Get latest products for landing page.
+    Total matches are reported in the X-Total-Count header.
     """
-    query = db.query(CompanyService).filter(CompanyService.status == "active")
+    result, total, exact = _product_cards(db, skip, limit, category)
+    set_total_headers(response, total, exact)
+    return json_response(result, response)
+
+
+def _service_cards(db: Session, skip: int, limit: int, category: Optional[str]):
+    """One page of the latest active service cards, with the total and whether it is exact."""
+    query = db.query(CompanyService).options(_card_columns(*SERVICE_CARD_COLUMNS)).filter(
+        CompanyService.status == "active"
+    )
     
     if category:
         query = query.filter(CompanyService.category == category)
     
-    services = query.order_by(CompanyService.created_at.desc()).offset(skip).limit(limit).all()
+    services, total, exact = paginate_with_total(db, query.order_by(CompanyService.created_at.desc()), skip, limit)
+    
+    companies = _companies_by_tenant(db, (s.tenant_id for s in services))
     
     result = []
     for service in services:
-        # Get company info for this service's tenant
-        company = db.query(CompanyInfo).filter(
-            CompanyInfo.tenant_id == service.tenant_id
-        ).first()
+        company = companies.get(service.tenant_id)
         
         result.append({
             "id": service.id,
@@ -212,7 +283,24 @@ def get_latest_services(
             "location": f"{company.city or ''}" if company else ""
         })
     
-    return result
+    return result, total, exact
+
+
+@router.get("/services")
+def get_latest_services(
+    response: Response,
+    skip: int = 0,
+    limit: int = 12,
+    category: Optional[str] = None,
+    db: Session = Depends(get_db)
+):
+    """
+    Get latest services for landing page.
+    Total matches are reported in the X-Total-Count header.
+    """
+    result, total, exact = _service_cards(db, skip, limit, category)
+    set_total_headers(response, total, exact)
+    return json_response(result, response)
 
 
 @router.get("/stats")
@@ -220,20 +308,13 @@ def get_platform_stats(db: Session = Depends(get_db)):
     """
     Get platform statistics for landing page.
     """
-    # Count businesses (customers with company info)
-    businesses_count = db.query(func.count(CompanyInfo.id)).scalar() or 0
-    
-    # Count products
-    products_count = db.query(func.count(CompanyProduct.id)).scalar() or 0
-    
-    # Count services
-    services_count = db.query(func.count(CompanyService.id)).scalar() or 0
-    
-    # Count projects
-    projects_count = db.query(func.count(CompanyProject.id)).scalar() or 0
-    
-    # Count registered customers/buyers
-    buyers_count = db.query(func.count(CustomerUser.id)).scalar() or 0
+    # Stored counters, maintained incrementally and reconciled periodically
+    counts = get_platform_counts(db)
+    businesses_count = counts["businesses"]
+    products_count = counts["products"]
+    services_count = counts["services"]
+    projects_count = counts["projects"]
+    buyers_count = counts["buyers"]
     
     return {
         "businesses": businesses_count,
@@ -284,23 +365,18 @@ def get_categories(db: Session = Depends(get_db)):
     """
     Get list of categories from database with product/service counts.
     """
-    # Fetch categories from Category table
+    # Counts come from the precomputed category_stats table
+    counts = get_category_counts(db)
+    
     categories = db.query(Category).filter(
         Category.is_active == True
     ).order_by(Category.display_order, Category.name).all()
     
     result = []
     for cat in categories:
-        # Count products and services for this category
-        product_count = db.query(func.count(CompanyProduct.id)).filter(
-            CompanyProduct.category == cat.name
-        ).scalar() or 0
-        
-        service_count = db.query(func.count(CompanyService.id)).filter(
-            CompanyService.category == cat.name
-        ).scalar() or 0
-        
-        total_count = product_count + service_count
+        stats = counts.get(cat.name, {})
+        product_count = stats.get("product_count", 0)
+        service_count = stats.get("service_count", 0)
         
         result.append({
             "id": cat.id,
@@ -310,7 +386,7 @@ def get_categories(db: Session = Depends(get_db)):
             "icon": cat.icon,
             "color": cat.color,
             "image_url": cat.image_url,
-            "count": total_count,
+            "count": product_count + service_count,
             "product_count": product_count,
             "service_count": service_count
         })
@@ -318,6 +394,50 @@ def get_categories(db: Session = Depends(get_db)):
     return result
 
 
+# ============ HOME (AGGREGATED LANDING PAGE) ============
+
+# Fresh for 30s, then served stale for up to 5 minutes while refreshing
+_home_cache = StaleWhileRevalidateCache(ttl_seconds=30, stale_seconds=300)
+
+HOME_SECTIONS = {
+    "stats": lambda db: get_platform_stats(db=db),
+    "categories": lambda db: get_categories(db=db),
+    "businesses": lambda db: _business_cards(db, skip=0, limit=8, industry=None)[0],
+    "products": lambda db: _product_cards(db, skip=0, limit=8, category=None)[0],
+    "services": lambda db: _service_cards(db, skip=0, limit=8, category=None)[0],
+    "site_settings": lambda db: get_public_site_settings(db=db),
+}
+
+
+def _run_section(build):
+    # Each section gets its own session, and so its own pooled connection
+    session = connection.SessionLocal()
+    try:
+        return build(session)
+    finally:
+        session.close()
+
+
+async def _load_home_sections() -> dict:
+    # In the threadpool even where sections cannot overlap (SQLite): the
+    # queries must never block the event loop
+    results = await asyncio.gather(*[
+        run_in_threadpool(_run_section, build) for build in HOME_SECTIONS.values()
+    ])
+    return dict(zip(HOME_SECTIONS.keys(), results))
+
+
+@router.get("/home")
+async def get_home_page():
+    """
+    Everything the landing page needs in one response:
+    stats, categories, businesses, products, services and site settings.
+    Sections are queried concurrently and the result is cached briefly;
+    concurrent misses share one load.
+    """
+    return json_response(await _home_cache.get_or_load("home", _load_home_sections))
+
+
 # ============ BUSINESS PORTFOLIO DETAIL ============
 
 @router.get("/business/{identifier}")
@@ -501,6 +621,81 @@ def get_business_portfolio(identifier: str, db: Session = Depends(get_db)):
 
 # ============ ADVANCED SEARCH ============
 
+def _business_search_query(db: Session, q: Optional[str], category: Optional[str], location: Optional[str]):
+    query = db.query(CompanyInfo).filter(CompanyInfo.company_name.isnot(None))
+    
+    if q:
+        query = query.filter(
+            or_(
+                CompanyInfo.company_name.ilike(f"%{q}%"),
+                CompanyInfo.tagline.ilike(f"%{q}%"),
+                CompanyInfo.about.ilike(f"%{q}%"),
+                CompanyInfo.industry.ilike(f"%{q}%")
+            )
+        )
+    
+    if category:
+        query = query.filter(CompanyInfo.industry.ilike(f"%{category}%"))
+    
+    if location:
+        query = query.filter(
+            or_(
+                CompanyInfo.city.ilike(f"%{location}%"),
+                CompanyInfo.state.ilike(f"%{location}%")
+            )
+        )
+    
+    return query
+
+
+def _product_search_query(
+    db: Session,
+    q: Optional[str],
+    category: Optional[str],
+    min_price: Optional[float],
+    max_price: Optional[float]
+):
+    query = db.query(CompanyProduct)
+    
+    if q:
+        query = query.filter(
+            or_(
+                CompanyProduct.name.ilike(f"%{q}%"),
+                CompanyProduct.short_description.ilike(f"%{q}%"),
+                CompanyProduct.category.ilike(f"%{q}%")
+            )
+        )
+    
+    if category:
+        query = query.filter(CompanyProduct.category.ilike(f"%{category}%"))
+    
+    if min_price:
+        query = query.filter(CompanyProduct.price >= min_price)
+    
+    if max_price:
+        query = query.filter(CompanyProduct.price <= max_price)
+    
+    return query
+
+
+def _service_search_query(db: Session, q: Optional[str], category: Optional[str]):
+    query = db.query(CompanyService).filter(CompanyService.status == "active")
+    
+    if q:
+        query = query.filter(
+            or_(
+                CompanyService.title.ilike(f"%{q}%"),
+                CompanyService.short_description.ilike(f"%{q}%"),
+                CompanyService.category.ilike(f"%{q}%")
+            )
+        )
+    
+    if category:
+        query = query.filter(CompanyService.category.ilike(f"%{category}%"))
+    
+    return query
+
+
 @router.get("/search")
 def search_public(
     q: Optional[str] = None,
@@ -512,44 +707,31 @@ def search_public(
     max_price: Optional[float] = None,
     skip: int = 0,
     limit: int = 20,
+    facets: bool = False,
     db: Session = Depends(get_db)
 ):
     """
     Advanced search across businesses, products, and services.
+    Pass facets=true to also get industry/city/state/category/price counts
+    over the filtered (unpaginated) results.
     """
     results = []
+    totals = {}
+    
+    business_query = _business_search_query(db, q, category, location) if type in ["all", "businesses"] else None
+    product_query = _product_search_query(db, q, category, min_price, max_price) if type in ["all", "products"] else None
+    service_query = _service_search_query(db, q, category) if type in ["all", "services"] else None
     
     # Search Businesses
-    if type in ["all", "businesses"]:
-        query = db.query(CompanyInfo).filter(CompanyInfo.company_name.isnot(None))
-        
-        if q:
-            query = query.filter(
-                or_(
-                    CompanyInfo.company_name.ilike(f"%{q}%"),
-                    CompanyInfo.tagline.ilike(f"%{q}%"),
-                    CompanyInfo.about.ilike(f"%{q}%"),
-                    CompanyInfo.industry.ilike(f"%{q}%")
-                )
-            )
-        
-        if category:
-            query = query.filter(CompanyInfo.industry.ilike(f"%{category}%"))
-        
-        if location:
-            query = query.filter(
-                or_(
-                    CompanyInfo.city.ilike(f"%{location}%"),
-                    CompanyInfo.state.ilike(f"%{location}%")
-                )
-            )
-        
-        businesses = query.order_by(CompanyInfo.created_at.desc()).offset(skip).limit(limit).all()
+    if business_query is not None:
+        businesses, total, exact = paginate_with_total(
+            db, business_query.options(_card_columns(*BUSINESS_CARD_COLUMNS)).order_by(CompanyInfo.created_at.desc()), skip, limit
+        )
+        totals["businesses"] = (total, exact)
+        product_counts = _counts_by_tenant(db, CompanyProduct, (b.tenant_id for b in businesses))
         
         for b in businesses:
-            product_count = db.query(func.count(CompanyProduct.id)).filter(
-                CompanyProduct.tenant_id == b.tenant_id
-            ).scalar() or 0
+            product_count = product_counts.get(b.tenant_id, 0)
             
             results.append({
                 "id": b.id,
@@ -568,33 +750,15 @@ def search_public(
             })
     
     # Search Products
-    if type in ["all", "products"]:
-        query = db.query(CompanyProduct)
-        
-        if q:
-            query = query.filter(
-                or_(
-                    CompanyProduct.name.ilike(f"%{q}%"),
-                    CompanyProduct.short_description.ilike(f"%{q}%"),
-                    CompanyProduct.category.ilike(f"%{q}%")
-                )
-            )
-        
-        if category:
-            query = query.filter(CompanyProduct.category.ilike(f"%{category}%"))
-        
-        if min_price:
-            query = query.filter(CompanyProduct.price >= min_price)
-        
-        if max_price:
-            query = query.filter(CompanyProduct.price <= max_price)
-        
-        products = query.order_by(CompanyProduct.created_at.desc()).offset(skip).limit(limit).all()
+    if product_query is not None:
+        products, total, exact = paginate_with_total(
+            db, product_query.options(_card_columns(*PRODUCT_CARD_COLUMNS)).order_by(CompanyProduct.created_at.desc()), skip, limit
+        )
+        totals["products"] = (total, exact)
+        companies = _companies_by_tenant(db, (p.tenant_id for p in products))
         
         for p in products:
-            company = db.query(CompanyInfo).filter(
-                CompanyInfo.tenant_id == p.tenant_id
-            ).first()
+            company = companies.get(p.tenant_id)
             
             results.append({
                 "id": p.id,
@@ -614,27 +778,15 @@ def search_public(
             })
     
     # Search Services
-    if type in ["all", "services"]:
-        query = db.query(CompanyService).filter(CompanyService.status == "active")
-        
-        if q:
-            query = query.filter(
-                or_(
-                    CompanyService.title.ilike(f"%{q}%"),
-                    CompanyService.short_description.ilike(f"%{q}%"),
-                    CompanyService.category.ilike(f"%{q}%")
-                )
-            )
-        
-        if category:
-            query = query.filter(CompanyService.category.ilike(f"%{category}%"))
-        
-        services = query.order_by(CompanyService.created_at.desc()).offset(skip).limit(limit).all()
+    if service_query is not None:
+        services, total, exact = paginate_with_total(
+            db, service_query.options(_card_columns(*SERVICE_CARD_COLUMNS)).order_by(CompanyService.created_at.desc()), skip, limit
+        )
+        totals["services"] = (total, exact)
+        companies = _companies_by_tenant(db, (s.tenant_id for s in services))
         
         for s in services:
-            company = db.query(CompanyInfo).filter(
-                CompanyInfo.tenant_id == s.tenant_id
-            ).first()
+            company = companies.get(s.tenant_id)
             
             results.append({
                 "id": s.id,
@@ -651,12 +803,28 @@ def search_public(
                 "description": s.short_description
             })
     
-    return {
+    response = {
         "results": results,
-        "total": len(results),
+        "total": sum(total for total, _ in totals.values()),
+        "total_exact": all(exact for _, exact in totals.values()),
+        "totals": {name: total for name, (total, _) in totals.items()},
         "skip": skip,
         "limit": limit
     }
+    
+    if facets:
+        facet_queries = {
+            "business_query": business_query,
+            "product_query": product_query,
+            "service_query": service_query
+        }
+        is_empty_query = not any([q, category, location, min_price, max_price])
+        if is_empty_query:
+            response["facets"] = get_cached_facets(db, type, **facet_queries)
+        else:
+            response["facets"] = compute_facets(db, **facet_queries)
+    
+    return json_response(response)
 
 
 # ============ SUBMIT INQUIRY ============
@@ -701,22 +869,13 @@ def submit_inquiry(inquiry: InquiryCreate, request: Request, db: Session = Depen
 def get_locations(db: Session = Depends(get_db)):
     """
     Get unique locations (cities/states) from businesses.
+    Served from the cached business facets, most common first.
     """
-    # Get unique cities
-    cities = db.query(CompanyInfo.city).filter(
-        CompanyInfo.city.isnot(None),
-        CompanyInfo.city != ""
-    ).distinct().all()
-    
-    # Get unique states
-    states = db.query(CompanyInfo.state).filter(
-        CompanyInfo.state.isnot(None),
-        CompanyInfo.state != ""
-    ).distinct().all()
+    facets = get_cached_facets(db, "businesses", business_query=_business_search_query(db, None, None, None))
     
     return {
-        "cities": [c[0] for c in cities if c[0]],
-        "states": [s[0] for s in states if s[0]]
+        "cities": [c["value"] for c in facets["city"]],
+        "states": [s["value"] for s in facets["state"]]
     }
 
 
@@ -724,14 +883,12 @@ def get_locations(db: Session = Depends(get_db)):
 def get_industries(db: Session = Depends(get_db)):
     """
     Get unique industries from businesses.
+    Served from the cached business facets, most common first.
     """
-    industries = db.query(CompanyInfo.industry).filter(
-        CompanyInfo.industry.isnot(None),
-        CompanyInfo.industry != ""
-    ).distinct().all()
+    facets = get_cached_facets(db, "businesses", business_query=_business_search_query(db, None, None, None))
     
     return {
-        "industries": [i[0] for i in industries if i[0]]
+        "industries": [i["value"] for i in facets["industry"]]
     }
 
 
@@ -739,6 +896,7 @@ def get_industries(db: Session = Depends(get_db)):
 
 @router.get("/blogs")
 def get_public_blogs(
+    response: Response,
     skip: int = 0,
     limit: int = 12,
     category: Optional[str] = None,
@@ -746,21 +904,23 @@ def get_public_blogs(
 ):
     """
     Get public blog posts.
+    Total matches are reported in the X-Total-Count header.
     """
-    query = db.query(CompanyBlogPost).filter(
+    query = db.query(CompanyBlogPost).options(_card_columns(*BLOG_CARD_COLUMNS)).filter(
         CompanyBlogPost.status == "published"
     )
     
     if category:
         query = query.filter(CompanyBlogPost.category == category)
     
-    blogs = query.order_by(CompanyBlogPost.published_at.desc()).offset(skip).limit(limit).all()
+    blogs, total, exact = paginate_with_total(db, query.order_by(CompanyBlogPost.published_at.desc()), skip, limit)
+    set_total_headers(response, total, exact)
+    
+    companies = _companies_by_tenant(db, (b.tenant_id for b in blogs))
     
     result = []
     for blog in blogs:
-        company = db.query(CompanyInfo).filter(
-            CompanyInfo.tenant_id == blog.tenant_id
-        ).first()
+        company = companies.get(blog.tenant_id)
         
         result.append({
             "id": blog.id,
@@ -771,19 +931,20 @@ def get_public_blogs(
             "featured_image": blog.featured_image_url,
             "category": blog.category,
             "tags": blog.tags,
-            "author": blog.author_name,
+            "author": blog.author,
             "published_at": blog.published_at,
             "business": company.company_name if company else "Unknown",
             "business_id": blog.tenant_id
         })
     
-    return result
+    return json_response(result, response)
 
 
 # ============ PUBLIC CAREERS/JOBS ============
 
 @router.get("/careers")
 def get_public_careers(
+    response: Response,
     skip: int = 0,
     limit: int = 12,
     location: Optional[str] = None,
@@ -793,6 +954,7 @@ def get_public_careers(
 ):
     """
     Get public job listings.
+    Total matches are reported in the X-Total-Count header.
     """
     query = db.query(CompanyCareer).filter(
         CompanyCareer.status == "active"
@@ -807,7 +969,8 @@ def get_public_careers(
     if job_type:
         query = query.filter(CompanyCareer.job_type == job_type)
     
-    jobs = query.order_by(CompanyCareer.created_at.desc()).offset(skip).limit(limit).all()
+    jobs, total, exact = paginate_with_total(db, query.order_by(CompanyCareer.created_at.desc()), skip, limit)
+    set_total_headers(response, total, exact)
     
     result = []
     for job in jobs:
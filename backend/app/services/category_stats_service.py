@@ -0,0 +1,149 @@
+from collections import Counter
+from typing import Dict, Iterable, Optional
+from sqlalchemy import event, func, inspect, literal, select, union_all
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from app.models.category_stats_model import CategoryStats
+from app.company.models.company_products_model import CompanyProduct
+from app.company.models.company_services_model import CompanyService
+from app.services.derived_tables_service import is_built, mark_built
+
+# Counter column maintained for each catalog model
+_COUNT_COLUMNS = {
+    CompanyProduct: "product_count",
+    CompanyService: "service_count",
+}
+
+_stats_ready = False
+
+
+def apply_category_delta(connection, category: Optional[str], column: str, delta: int):
+    """
+    Adds `delta` to one counter of a category row, creating the row if needed.
+    Runs on the flush connection so it commits or rolls back with the item.
+    """
+    if not category or not delta:
+        return
+
+    table = CategoryStats.__table__
+    dialect = connection.dialect.name
+
+    if dialect in ("postgresql", "sqlite"):
+        insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        stmt = insert(table).values(category_name=category, **{column: max(delta, 0)})
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.category_name],
+            set_={column: table.c[column] + delta, "updated_at": func.now()}
+        )
+        connection.execute(stmt)
+        return
+
+    # Generic fallback: update first, insert when the row does not exist yet
+    result = connection.execute(
+        table.update()
+        .where(table.c.category_name == category)
+        .values(**{column: table.c[column] + delta})
+    )
+    if result.rowcount == 0:
+        connection.execute(table.insert().values(category_name=category, **{column: max(delta, 0)}))
+
+
+def apply_category_deltas(connection, model, categories: Iterable[Optional[str]], sign: int):
+    """
+    Batch form of the listeners, for rows written by bulk statements or COPY
+    (which skip them): one delta per distinct category, `sign` per row.
+    """
+    column = _COUNT_COLUMNS.get(model)
+    if column is None:
+        return
+    for category, count in Counter(c for c in categories if c).items():
+        apply_category_delta(connection, category, column, sign * count)
+
+
+def rebuild_category_stats(db: Session) -> Dict[str, Dict[str, int]]:
+    """
+    Recomputes all category counters with a single grouped aggregate
+    over products and services and replaces the stored rows.
+    """
+    products = select(
+        CompanyProduct.category.label("category"),
+        literal("product_count").label("counter"),
+        func.count(CompanyProduct.id).label("total")
+    ).where(CompanyProduct.category.isnot(None)).group_by(CompanyProduct.category)
+
+    services = select(
+        CompanyService.category.label("category"),
+        literal("service_count").label("counter"),
+        func.count(CompanyService.id).label("total")
+    ).where(CompanyService.category.isnot(None)).group_by(CompanyService.category)
+
+    totals: Dict[str, Dict[str, int]] = {}
+    for category, counter, total in db.execute(union_all(products, services)).all():
+        if not category:
+            continue
+        row = totals.setdefault(category, {"product_count": 0, "service_count": 0})
+        row[counter] = total
+
+    db.query(CategoryStats).delete()
+    db.add_all([
+        CategoryStats(category_name=name, **counts) for name, counts in totals.items()
+    ])
+    mark_built(db, CategoryStats.__tablename__)
+    db.commit()
+    return totals
+
+
+def ensure_category_stats(db: Session):
+    """Backfill the stats table once per process if it has never been built."""
+    global _stats_ready
+    if _stats_ready:
+        return
+    if not is_built(db, CategoryStats.__tablename__):
+        rebuild_category_stats(db)
+    _stats_ready = True
+
+
+def get_category_counts(db: Session) -> Dict[str, Dict[str, int]]:
+    """Returns {category_name: {"product_count", "service_count"}} from the stats table."""
+    ensure_category_stats(db)
+    return {
+        row.category_name: {
+            "product_count": max(row.product_count or 0, 0),
+            "service_count": max(row.service_count or 0, 0)
+        }
+        for row in db.query(CategoryStats).all()
+    }
+
+
+# ============ Incremental maintenance ============
+
+def _track_previous_category(target, value, oldvalue, initiator):
+    # No-op; registered with active_history so updates can see the old category
+    pass
+
+
+def _register_listeners(model, column: str):
+    event.listen(model.category, "set", _track_previous_category, active_history=True)
+
+    @event.listens_for(model, "after_insert")
+    def _after_insert(mapper, connection, target):
+        apply_category_delta(connection, target.category, column, 1)
+
+    @event.listens_for(model, "after_delete")
+    def _after_delete(mapper, connection, target):
+        apply_category_delta(connection, target.category, column, -1)
+
+    @event.listens_for(model, "after_update")
+    def _after_update(mapper, connection, target):
+        history = inspect(target).attrs.category.history
+        if not history.has_changes():
+            return
+        old_category = history.deleted[0] if history.deleted else None
+        if old_category == target.category:
+            return
+        apply_category_delta(connection, old_category, column, -1)
+        apply_category_delta(connection, target.category, column, 1)
+
+
+for _model, _column in _COUNT_COLUMNS.items():
+    _register_listeners(_model, _column)
@@ -0,0 +1,19 @@
+"""
+Build markers for derived tables that listeners keep current.
+
+Such a table is only correct after one full build from its source
+tables; an empty table proves nothing, since listener writes can fill it
+before the first build. mark_built records that build.
+"""
+from datetime import datetime, timezone
+from sqlalchemy.orm import Session
+from app.models.derived_table_build_model import DerivedTableBuild
+
+
+def is_built(db: Session, table_name: str) -> bool:
+    return db.get(DerivedTableBuild, table_name) is not None
+
+
+def mark_built(db: Session, table_name: str):
+    """Records a completed full build; commits with the caller's session."""
+    db.merge(DerivedTableBuild(table_name=table_name, built_at=datetime.now(timezone.utc)))
@@ -0,0 +1,173 @@
+import asyncio
+import logging
+import zlib
+from typing import Dict
+from sqlalchemy import event, func, literal, select, text, union_all
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.database.schema_lock import try_advisory_lock
+from app.models.platform_stats_model import PlatformStats
+from app.company.models.company_info_model import CompanyInfo
+from app.company.models.company_products_model import CompanyProduct
+from app.company.models.company_services_model import CompanyService
+from app.company.models.company_projects_model import CompanyProject
+from app.customer.models.customer_user_model import CustomerUser
+from app.utils.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Counter name -> model whose rows it counts
+TRACKED_MODELS = {
+    "businesses": CompanyInfo,
+    "products": CompanyProduct,
+    "services": CompanyService,
+    "projects": CompanyProject,
+    "buyers": CustomerUser,
+}
+
+# Advisory lock key (same scheme as the schema lock): one reconciler at a time
+RECONCILE_LOCK_KEY = zlib.crc32(b"b2b-saas:platform-stats")
+
+_COUNTER_NAMES = {model: name for name, model in TRACKED_MODELS.items()}
+
+_counts_cache = TTLCache(ttl_seconds=60, maxsize=1)
+
+
+def apply_counter_delta(connection, name: str, delta: int):
+    """
+    Adds `delta` to a platform counter, creating it if needed.
+    Runs on the flush connection so it commits or rolls back with the row.
+    """
+    if not delta:
+        return
+
+    table = PlatformStats.__table__
+    dialect = connection.dialect.name
+
+    if dialect in ("postgresql", "sqlite"):
+        insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        stmt = insert(table).values(name=name, value=max(delta, 0))
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.name],
+            set_={"value": table.c.value + delta, "updated_at": func.now()}
+        )
+        connection.execute(stmt)
+        return
+
+    result = connection.execute(
+        table.update().where(table.c.name == name).values(value=table.c.value + delta)
+    )
+    if result.rowcount == 0:
+        connection.execute(table.insert().values(name=name, value=max(delta, 0)))
+
+
+def apply_model_delta(connection, model, delta: int):
+    """Counter delta for rows of `model` written without the ORM listeners (bulk statements, COPY)."""
+    name = _COUNTER_NAMES.get(model)
+    if name is not None:
+        apply_counter_delta(connection, name, delta)
+
+
+def reconcile_platform_stats(db: Session) -> Dict[str, int]:
+    """
+    Recomputes every counter with exact counts (one UNION ALL statement)
+    and overwrites the stored values. Corrects drift from bulk deletes
+    and other writes that bypass the ORM.
+    """
+    # Lock the counter rows before counting: deltas from concurrent writes
+    # wait for this transaction instead of being overwritten by it
+    db.query(PlatformStats.name).filter(PlatformStats.name.in_(list(TRACKED_MODELS))).with_for_update().all()
+    counts = union_all(*[
+        select(literal(name).label("name"), func.count().label("total")).select_from(model.__table__)
+        for name, model in TRACKED_MODELS.items()
+    ])
+    totals = {name: total for name, total in db.execute(counts).all()}
+
+    # Overwrite row by row so readers never see an empty table
+    for name, total in totals.items():
+        db.merge(PlatformStats(name=name, value=total))
+    db.commit()
+    _counts_cache.invalidate()
+    return totals
+
+
+def estimate_platform_counts(db: Session) -> Dict[str, int]:
+    """
+    Planner estimates from pg_class.reltuples (PostgreSQL only).
+    Tables never analyzed report -1 and come back as 0.
+    """
+    table_names = {model.__table__.name: name for name, model in TRACKED_MODELS.items()}
+    rows = db.execute(
+        text("SELECT relname, reltuples FROM pg_class WHERE relkind = 'r' AND relname = ANY(:names)"),
+        {"names": list(table_names)}
+    ).all()
+    estimates = {name: 0 for name in TRACKED_MODELS}
+    for relname, reltuples in rows:
+        estimates[table_names[relname]] = max(int(reltuples), 0)
+    return estimates
+
+
+def get_platform_counts(db: Session) -> Dict[str, int]:
+    """
+    Returns {counter: value} for every tracked counter.
+
+    Read order: in-process cache, then the counters table. If the table
+    has not been backfilled yet, PostgreSQL answers from pg_class estimates
+    (the periodic reconcile fills the table later); other databases
+    reconcile immediately since their counts are cheap.
+    """
+    cached = _counts_cache.get("counts")
+    if cached is not None:
+        return cached
+
+    stored = {row.name: row.value for row in db.query(PlatformStats).all()}
+    if any(name not in stored for name in TRACKED_MODELS):
+        if db.get_bind().dialect.name == "postgresql":
+            stored = {**estimate_platform_counts(db), **stored}
+        else:
+            stored = reconcile_platform_stats(db)
+
+    counts = {name: max(int(stored.get(name) or 0), 0) for name in TRACKED_MODELS}
+    _counts_cache.set("counts", counts)
+    return counts
+
+
+async def reconcile_platform_stats_periodically(session_factory):
+    """
+    Background loop started at application startup, in every worker; each
+    round only the worker holding the advisory lock reconciles.
+    """
+    from starlette.concurrency import run_in_threadpool
+
+    def run_once():
+        db = session_factory()
+        try:
+            with try_advisory_lock(db.get_bind(), RECONCILE_LOCK_KEY) as acquired:
+                if acquired:
+                    reconcile_platform_stats(db)
+        finally:
+            db.close()
+
+    while True:
+        try:
+            await run_in_threadpool(run_once)
+        except Exception as e:
+            logger.warning(f"Platform stats reconcile failed: {e}")
+        await asyncio.sleep(settings.PLATFORM_STATS_RECONCILE_SECONDS)
+
+
+# ============ Incremental maintenance ============
+
+def _register_listeners(model, name: str):
+    @event.listens_for(model, "after_insert")
+    def _after_insert(mapper, connection, target):
+        apply_counter_delta(connection, name, 1)
+
+    @event.listens_for(model, "after_delete")
+    def _after_delete(mapper, connection, target):
+        apply_counter_delta(connection, name, -1)
+
+
+for _name, _model in TRACKED_MODELS.items():
+    _register_listeners(_model, _name)
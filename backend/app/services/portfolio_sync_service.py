@@ -1,6 +1,48 @@
+from typing import Iterable, List
+from sqlalchemy import insert, update
 from sqlalchemy.orm import Session
 from app.models.public_portfolio_model import PublicPortfolio, PortfolioItemType
 
+def _portfolio_fields(item) -> dict:
+    """
+    Maps a company item's fields onto the portfolio columns.
+    """
+    # Title mapping
+    if hasattr(item, "title"): title = item.title
+    elif hasattr(item, "name"): title = item.name
+    elif hasattr(item, "client_name"): title = item.client_name
+    else: title = "Untitled"
+
+    # Description mapping
+    if hasattr(item, "short_description"): description = item.short_description
+    elif hasattr(item, "bio"): description = item.bio
+    elif hasattr(item, "testimonial_text"): description = item.testimonial_text
+    elif hasattr(item, "description"): description = item.description
+    else: description = None
+
+    # Image mapping
+    if hasattr(item, "banner_image_url"): image_url = item.banner_image_url
+    elif hasattr(item, "main_image_url"): image_url = item.main_image_url
+    elif hasattr(item, "featured_image_url"): image_url = item.featured_image_url
+    elif hasattr(item, "client_photo_url"): image_url = item.client_photo_url
+    elif hasattr(item, "photo_url"): image_url = item.photo_url
+    elif hasattr(item, "image_url"): image_url = item.image_url
+    else: image_url = None
+
+    # Category mapping
+    if hasattr(item, "category"): category = item.category
+    elif hasattr(item, "position"): category = item.position # For team members
+    elif hasattr(item, "client_position"): category = item.client_position # For testimonials
+    else: category = None
+
+    return {
+        "title": title,
+        "description": description,
+        "image_url": image_url,
+        "category": category,
+        "is_active": True,
+    }
+
 def sync_item_to_portfolio(db: Session, item, item_type: str):
     """
     Syncs a company item (Service, Product, etc.) to the PublicPortfolio table.
@@ -12,35 +54,6 @@ def sync_item_to_portfolio(db: Session, item, item_type: str):
             PublicPortfolio.item_type == item_type,
             PublicPortfolio.item_id == item.id
         ).first()
-        
-        # Map fields dynamically based on item type
-        # Title mapping
-        if hasattr(item, "title"): title = item.title
-        elif hasattr(item, "name"): title = item.name
-        elif hasattr(item, "client_name"): title = item.client_name
-        else: title = "Untitled"
-
-        # Description mapping
-        if hasattr(item, "short_description"): description = item.short_description
-        elif hasattr(item, "bio"): description = item.bio
-        elif hasattr(item, "testimonial_text"): description = item.testimonial_text
-        elif hasattr(item, "description"): description = item.description
-        else: description = None
-
-        # Image mapping
-        if hasattr(item, "banner_image_url"): image_url = item.banner_image_url
-        elif hasattr(item, "main_image_url"): image_url = item.main_image_url
-        elif hasattr(item, "featured_image_url"): image_url = item.featured_image_url
-        elif hasattr(item, "client_photo_url"): image_url = item.client_photo_url
-        elif hasattr(item, "photo_url"): image_url = item.photo_url
-        elif hasattr(item, "image_url"): image_url = item.image_url
-        else: image_url = None
-
-        # Category mapping
-        if hasattr(item, "category"): category = item.category
-        elif hasattr(item, "position"): category = item.position # For team members
-        elif hasattr(item, "client_position"): category = item.client_position # For testimonials
-        else: category = None
 
         if not portfolio_item:
             portfolio_item = PublicPortfolio(
@@ -49,13 +62,10 @@ def sync_item_to_portfolio(db: Session, item, item_type: str):
                 item_id=item.id
             )
             db.add(portfolio_item)
-        
-        portfolio_item.title = title
-        portfolio_item.description = description
-        portfolio_item.image_url = image_url
-        portfolio_item.category = category
-        portfolio_item.is_active = True 
-        
+
+        for field, value in _portfolio_fields(item).items():
+            setattr(portfolio_item, field, value)
+
         db.commit()
         db.refresh(portfolio_item)
     else:
@@ -66,6 +76,41 @@ def sync_item_to_portfolio(db: Session, item, item_type: str):
         ).delete()
         db.commit()
 
+def sync_items_to_portfolio(db: Session, items: Iterable, item_type: str):
+    """
+    Projects many items of one type at once: one lookup, one multi-row
+    insert, one executemany update and one delete. Does not commit; the
+    caller's transaction covers the items and their portfolio rows.
+    """
+    items = list(items)
+    published = [item for item in items if getattr(item, "publish_to_portfolio", False)]
+    unpublished_ids = [item.id for item in items if not getattr(item, "publish_to_portfolio", False)]
+
+    if unpublished_ids:
+        delete_portfolio_items(db, unpublished_ids, item_type)
+    if not published:
+        return
+
+    existing = dict(
+        db.query(PublicPortfolio.item_id, PublicPortfolio.id).filter(
+            PublicPortfolio.item_type == item_type,
+            PublicPortfolio.item_id.in_([item.id for item in published])
+        ).all()
+    )
+
+    new_rows, changed_rows = [], []
+    for item in published:
+        fields = _portfolio_fields(item)
+        if item.id in existing:
+            changed_rows.append({"id": existing[item.id], **fields})
+        else:
+            new_rows.append({"tenant_id": item.tenant_id, "item_type": item_type, "item_id": item.id, **fields})
+
+    if new_rows:
+        db.execute(insert(PublicPortfolio), new_rows)
+    if changed_rows:
+        db.execute(update(PublicPortfolio), changed_rows)
+
 def delete_portfolio_item(db: Session, item_id: int, item_type: str):
     """
     Removes an item from the portfolio when the original item is deleted.
@@ -75,3 +120,12 @@ def delete_portfolio_item(db: Session, item_id: int, item_type: str):
         PublicPortfolio.item_id == item_id
     ).delete()
     db.commit()
+
+def delete_portfolio_items(db: Session, item_ids: List[int], item_type: str):
+    """
+    Removes many items of one type in one statement. Does not commit.
+    """
+    db.query(PublicPortfolio).filter(
+        PublicPortfolio.item_type == item_type,
+        PublicPortfolio.item_id.in_(item_ids)
+    ).delete(synchronize_session=False)
@@ -0,0 +1,163 @@
+from itertools import chain
+from typing import Any, Dict, List, Optional
+from sqlalchemy import and_, case, event, func, literal, select, union_all
+from sqlalchemy.orm import Query, Session
+from app.company.models.company_info_model import CompanyInfo
+from app.company.models.company_products_model import CompanyProduct
+from app.company.models.company_services_model import CompanyService
+from app.utils.cache import TTLCache
+
+# Price histogram edges in INR; the last bucket is open-ended
+PRICE_BUCKETS = [
+    (0, 1000),
+    (1000, 10000),
+    (10000, 50000),
+    (50000, 100000),
+    (100000, None),
+]
+
+FACET_NAMES = ["industry", "city", "state", "category", "price"]
+
+# Facets for unfiltered searches change slowly; keep them for a few minutes.
+# A commit that writes a facet model drops this process's copy; other
+# workers pick the change up when their copy expires.
+_empty_query_cache = TTLCache(ttl_seconds=300)
+
+FACET_MODELS = (CompanyInfo, CompanyProduct, CompanyService)
+
+
+def _bucket_label(low: float, high: Optional[float]) -> str:
+    return f"{low:g}-{high:g}" if high is not None else f"{low:g}+"
+
+
+def _price_bucket_expression(price_column):
+    whens = [
+        (price_column < high, literal(_bucket_label(low, high)))
+        for low, high in PRICE_BUCKETS if high is not None
+    ]
+    low, high = PRICE_BUCKETS[-1]
+    return case(*whens, else_=literal(_bucket_label(low, high)))
+
+
+def _grouped_counts(db: Session, filtered: Query, facets: Dict[str, Any]) -> Dict[str, Dict[str, int]]:
+    """
+    Counts values of several columns of one filtered query in a single statement.
+    The filtered set is a CTE that every GROUP BY reads, so it is scanned once.
+    """
+    cte = filtered.with_entities(*[col.label(name) for name, col in facets.items()]).order_by(None).cte("filtered")
+
+    selects = []
+    for name in facets:
+        column = cte.c[name]
+        if name == "price":
+            value = _price_bucket_expression(column)
+            condition = column.isnot(None)
+        else:
+            value = column
+            condition = and_(column.isnot(None), column != "")
+        selects.append(
+            select(literal(name).label("facet"), value.label("value"), func.count().label("total"))
+            .select_from(cte)
+            .where(condition)
+            .group_by(value)
+        )
+
+    counts: Dict[str, Dict[str, int]] = {}
+    for facet, value, total in db.execute(union_all(*selects)).all():
+        counts.setdefault(facet, {})[value] = total
+    return counts
+
+
+def _as_list(counts: Dict[str, int]) -> List[dict]:
+    return [
+        {"value": value, "count": count}
+        for value, count in sorted(counts.items(), key=lambda item: (-item[1], str(item[0])))
+    ]
+
+
+def _price_list(counts: Dict[str, int]) -> List[dict]:
+    # Price buckets keep their natural order and include empty buckets
+    return [
+        {
+            "value": _bucket_label(low, high),
+            "min": low,
+            "max": high,
+            "count": counts.get(_bucket_label(low, high), 0)
+        }
+        for low, high in PRICE_BUCKETS
+    ]
+
+
+def compute_facets(
+    db: Session,
+    business_query: Optional[Query] = None,
+    product_query: Optional[Query] = None,
+    service_query: Optional[Query] = None
+) -> dict:
+    """
+    Builds facet aggregations for the filtered (unpaginated) search queries.
+    Categories from products and services are merged into one facet.
+    """
+    merged: Dict[str, Dict[str, int]] = {name: {} for name in FACET_NAMES}
+
+    def merge(counts: Dict[str, Dict[str, int]]):
+        for facet, values in counts.items():
+            for value, total in values.items():
+                merged[facet][value] = merged[facet].get(value, 0) + total
+
+    if business_query is not None:
+        merge(_grouped_counts(db, business_query, {
+            "industry": CompanyInfo.industry,
+            "city": CompanyInfo.city,
+            "state": CompanyInfo.state,
+        }))
+
+    if product_query is not None:
+        merge(_grouped_counts(db, product_query, {
+            "category": CompanyProduct.category,
+            "price": CompanyProduct.price,
+        }))
+
+    if service_query is not None:
+        merge(_grouped_counts(db, service_query, {
+            "category": CompanyService.category,
+        }))
+
+    facets = {name: _as_list(merged[name]) for name in FACET_NAMES if name != "price"}
+    facets["price"] = _price_list(merged["price"])
+    return facets
+
+
+def get_cached_facets(db: Session, search_type: str, **queries) -> dict:
+    """Facets for an empty search, served from the in-process cache."""
+    cached = _empty_query_cache.get(search_type)
+    if cached is None:
+        cached = compute_facets(db, **queries)
+        _empty_query_cache.set(search_type, cached)
+    return cached
+
+
+def invalidate_facet_cache():
+    _empty_query_cache.invalidate()
+
+
+def mark_facets_stale(db: Session):
+    """Drops the cached facets when `db` commits (for writes that bypass the flush)."""
+    db.info["facets_stale"] = True
+
+
+@event.listens_for(Session, "after_flush")
+def _check_flushed_facet_models(session, flush_context):
+    if any(isinstance(obj, FACET_MODELS) for obj in chain(session.new, session.dirty, session.deleted)):
+        mark_facets_stale(session)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session):
+    if session.info.pop("facets_stale", False):
+        invalidate_facet_cache()
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back(session):
+    session.info.pop("facets_stale", None)
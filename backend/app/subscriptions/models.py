@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, JSON, ForeignKey, Text, event
+from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, JSON, ForeignKey, Text, Index, event
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database.base import Base
@@ -69,6 +69,12 @@ class CustomerSubscription(Base):
     plan = relationship("SubscriptionPlan", back_populates="subscriptions")
     customer = relationship("CustomerUser", back_populates="subscription")
     payments = relationship("PaymentHistory", back_populates="subscription")
+    
+    __table_args__ = (
+        # Admin listing filters: status + expiry window, and plan + status
+        Index("ix_customer_subscriptions_status_end_date", "status", "end_date"),
+        Index("ix_customer_subscriptions_plan_status", "plan_id", "status"),
+    )
 
 
 # Event listener to ensure only one default plan exists
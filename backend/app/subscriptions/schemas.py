@@ -58,6 +58,9 @@ class CustomerSubscriptionResponse(BaseModel):
     status: str
     auto_renew: bool
     days_remaining: Optional[int] = None
+    # Filled by the admin listing
+    customer_email: Optional[str] = None
+    customer_name: Optional[str] = None
     
     class Config:
         from_attributes = True
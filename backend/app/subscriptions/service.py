@@ -1,9 +1,11 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import Integer, case, cast, func
+from sqlalchemy.orm import Session, joinedload
 from datetime import datetime, timedelta
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from app.subscriptions.models import SubscriptionPlan, CustomerSubscription
 from app.payments.models import PaymentHistory
 from app.tenants.context import TenantContext
+from app.utils.pagination import count_total
 
 class SubscriptionService:
     """
@@ -73,10 +75,13 @@ class SubscriptionService:
         end_date = start_date + timedelta(days=days)
         
         # Cancel existing active subscriptions
-        self.db.query(CustomerSubscription).filter(
+        # (through the ORM so the dashboard rollups see the status change)
+        active = self.db.query(CustomerSubscription).filter(
             CustomerSubscription.tenant_id == tenant_id,
             CustomerSubscription.status.in_(["ACTIVE", "TRIAL"])
-        ).update({"status": "CANCELLED"})
+        ).all()
+        for existing in active:
+            existing.status = "CANCELLED"
         
         # Create new subscription
         subscription = CustomerSubscription(
@@ -125,6 +130,68 @@ class SubscriptionService:
         """Get all customer subscriptions (admin only)"""
         return self.db.query(CustomerSubscription).offset(skip).limit(limit).all()
     
+    def _days_remaining_expr(self):
+        """Whole days until end_date for ACTIVE/TRIAL subscriptions, else 0 (never negative)."""
+        if self.db.get_bind().dialect.name == "postgresql":
+            seconds = func.extract("epoch", CustomerSubscription.end_date - func.now())
+        else:
+            seconds = (func.julianday(CustomerSubscription.end_date) - func.julianday("now")) * 86400
+        # Truncation equals floor for the positive values that survive the clamp
+        days = cast(seconds / 86400, Integer)
+        return case(
+            (CustomerSubscription.status.in_(["ACTIVE", "TRIAL"]) & (days > 0), days),
+            else_=0
+        )
+    
+    def list_subscriptions(
+        self,
+        limit: int = 100,
+        cursor: Optional[int] = None,
+        skip: int = 0,
+        status: Optional[str] = None,
+        plan_id: Optional[int] = None,
+        expires_after: Optional[datetime] = None,
+        expires_before: Optional[datetime] = None
+    ) -> Tuple[List[CustomerSubscription], int, bool, Optional[int]]:
+        """
+        Admin listing, newest first (by id), with plan and customer eager-loaded
+        and days_remaining computed by the database.
+        Pass the previous page's next_cursor to page by keyset; without a
+        cursor, skip is used as an offset.
+        Returns (subscriptions, total, exact, next_cursor).
+        """
+        filters = []
+        if status:
+            filters.append(CustomerSubscription.status == status.upper())
+        if plan_id is not None:
+            filters.append(CustomerSubscription.plan_id == plan_id)
+        if expires_after is not None:
+            filters.append(CustomerSubscription.end_date >= expires_after)
+        if expires_before is not None:
+            filters.append(CustomerSubscription.end_date < expires_before)
+        
+        query = self.db.query(CustomerSubscription, self._days_remaining_expr().label("days_remaining"))\
+            .options(joinedload(CustomerSubscription.plan), joinedload(CustomerSubscription.customer))\
+            .filter(*filters)\
+            .order_by(CustomerSubscription.id.desc())
+        
+        if cursor is not None:
+            query = query.filter(CustomerSubscription.id < cursor)
+        else:
+            query = query.offset(skip)
+        
+        subscriptions = []
+        for subscription, days_remaining in query.limit(limit).all():
+            subscription.days_remaining = days_remaining
+            subscriptions.append(subscription)
+        
+        total, exact = count_total(
+            self.db, self.db.query(CustomerSubscription.id).filter(*filters),
+            offset=None if cursor is not None else skip, page_rows=len(subscriptions), limit=limit
+        )
+        next_cursor = subscriptions[-1].id if len(subscriptions) == limit else None
+        return subscriptions, total, exact, next_cursor
+    
     def check_feature_limit(self, tenant_id: int, feature: str, current_count: int) -> bool:
         """
         Check if customer has reached feature limit.
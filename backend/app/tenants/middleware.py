@@ -1,26 +1,63 @@
 from fastapi import Request
+from starlette.concurrency import run_in_threadpool
 from starlette.middleware.base import BaseHTTPMiddleware
 from app.tenants.context import TenantContext
 from app.auth.jwt_handler import decode_access_token
+from app.auth.token_version import cached_token_version, get_token_version, is_token_current
+from app.auth.token_revocation import is_token_revoked, might_be_revoked
 from app.database.connection import SessionLocal
 from app.models.user_model import User
 
+
+def _lookup_token_version(user_id: int):
+    db = SessionLocal()
+    try:
+        return get_token_version(db, user_id)
+    finally:
+        db.close()
+
+
+def _lookup_revoked(payload: dict) -> bool:
+    db = SessionLocal()
+    try:
+        return is_token_revoked(db, payload)
+    finally:
+        db.close()
+
+
+def _lookup_principal(email_or_phone: str):
+    # Tokens issued before principal claims existed: resolve the user by subject
+    db = SessionLocal()
+    try:
+        user = db.query(User.id, User.user_type).filter(
+            (User.email == email_or_phone) | (User.phone_number == email_or_phone)
+        ).first()
+        return (user.id, user.user_type) if user else (None, None)
+    finally:
+        db.close()
+
+
 class TenantMiddleware(BaseHTTPMiddleware):
     """
     Injects tenant_id into context for every request.
     - For customers: tenant_id = their user ID
     - For admins: sets admin flag (bypasses tenant filtering)
+    
+    Principal comes from the signed uid/typ/tid claims; the only database
+    access is a token-version check on a cache miss, and a revocation
+    check when the in-memory filter reports a possible hit.
     """
     
     async def dispatch(self, request: Request, call_next):
         # Clear previous context
         TenantContext.clear()
         
-        # Skip tenant injection for public routes
+        # Skip tenant injection for public routes ("/" itself, the rest by prefix)
         public_routes = ["/auth/login", "/auth/register", "/auth/forgot-password", "/auth/reset-password", 
-                        "/docs", "/openapi.json", "/redoc", "/", "/payments/webhook", "/public"]
+                        "/docs", "/openapi.json", "/redoc", "/payments/webhook", "/public"]
         
-        if any(request.url.path.startswith(route) for route in public_routes):
+        path = request.url.path
+        if path == "/" or any(path.startswith(route) for route in public_routes):
             response = await call_next(request)
             return response
         
@@ -33,25 +70,28 @@ class TenantMiddleware(BaseHTTPMiddleware):
         token = auth_header.split(" ")[1]
         payload = decode_access_token(token)
         
+        # Only possible filter hits cost a database round trip
+        if payload and might_be_revoked(payload) and await run_in_threadpool(_lookup_revoked, payload):
+            payload = None
+        
         if payload:
-            email_or_phone = payload.get("sub")
+            if payload.get("uid") is not None:
+                version = cached_token_version(payload["uid"])
+                if version is None:
+                    version = await run_in_threadpool(_lookup_token_version, payload["uid"])
+                if is_token_current(payload, version):
+                    user_type, tenant_id = payload.get("typ"), payload.get("tid")
+                else:
+                    user_type, tenant_id = None, None
+            else:
+                tenant_id, user_type = await run_in_threadpool(_lookup_principal, payload.get("sub"))
             
-            # Get user from database
-            db = SessionLocal()
-            try:
-                user = db.query(User).filter(
-                    (User.email == email_or_phone) | (User.phone_number == email_or_phone)
-                ).first()
-                
-                if user:
-                    if user.user_type == "admin":
-                        # Admin bypasses tenant filtering
-                        TenantContext.set_admin(True)
-                    elif user.user_type == "customer":
-                        # Customer: set tenant_id to their user ID
-                        TenantContext.set_tenant_id(user.id)
-            finally:
-                db.close()
+            if user_type == "admin":
+                # Admin bypasses tenant filtering
+                TenantContext.set_admin(True)
+            elif user_type == "customer" and tenant_id is not None:
+                # Customer: set tenant_id to their user ID
+                TenantContext.set_tenant_id(tenant_id)
         
         response = await call_next(request)
         
@@ -0,0 +1,128 @@
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class TTLCache:
+    """
+    Small thread-safe in-process cache with per-entry expiry.
+    Used for hot, read-mostly public data (facets, counters, landing page).
+    """
+
+    def __init__(self, ttl_seconds: float, maxsize: int = 256):
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        self._data = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            value, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return default
+            return value
+
+    def set(self, key: Hashable, value: Any):
+        with self._lock:
+            if len(self._data) >= self.maxsize and key not in self._data:
+                # Drop the entry closest to expiry to make room
+                oldest = min(self._data, key=lambda k: self._data[k][1])
+                del self._data[oldest]
+            self._data[key] = (value, time.monotonic() + self.ttl_seconds)
+
+    def invalidate(self, key: Optional[Hashable] = None):
+        with self._lock:
+            if key is None:
+                self._data.clear()
+            else:
+                self._data.pop(key, None)
+
+
+class StaleWhileRevalidateCache:
+    """
+    Async cache that serves a stale value while refreshing it in the background.
+
+    - Younger than ttl_seconds: returned as is.
+    - Older, but younger than ttl_seconds + stale_seconds: returned immediately,
+      and a single background refresh is started.
+    - Older than that (or missing): loaded inline, once: concurrent callers
+      for the same key await the same load.
+    """
+
+    def __init__(self, ttl_seconds: float, stale_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self._data = {}
+        self._refreshing = set()
+        self._tasks = set()
+        self._loading = {}
+        self._lock = threading.Lock()
+
+    def _store(self, key: Hashable, value: Any):
+        now = time.monotonic()
+        with self._lock:
+            self._data[key] = (value, now + self.ttl_seconds, now + self.ttl_seconds + self.stale_seconds)
+
+    async def _refresh(self, key: Hashable, loader: Callable[[], Awaitable[Any]]):
+        try:
+            self._store(key, await loader())
+        except Exception as e:
+            logger.warning(f"Background refresh of {key!r} failed, keeping stale value: {e}")
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    async def _load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            value = await loader()
+            self._store(key, value)
+            return value
+        finally:
+            with self._lock:
+                self._loading.pop(key, None)
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            start_refresh = False
+            if entry is not None:
+                value, fresh_until, stale_until = entry
+                if now < fresh_until:
+                    return value
+                if now < stale_until:
+                    if key not in self._refreshing:
+                        self._refreshing.add(key)
+                        start_refresh = True
+                else:
+                    entry = None
+
+        if entry is not None:
+            if start_refresh:
+                task = asyncio.get_running_loop().create_task(self._refresh(key, loader))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+            return entry[0]
+
+        with self._lock:
+            load = self._loading.get(key)
+            if load is None:
+                load = asyncio.get_running_loop().create_task(self._load(key, loader))
+                self._loading[key] = load
+        # Shielded: a caller that goes away must not cancel the load the others await
+        return await asyncio.shield(load)
+
+    def invalidate(self, key: Optional[Hashable] = None):
+        with self._lock:
+            if key is None:
+                self._data.clear()
+            else:
+                self._data.pop(key, None)
@@ -0,0 +1,111 @@
+import json
+from typing import Any, List, Optional, Tuple
+from fastapi import Response
+from sqlalchemy.orm import Query, Session
+from app.core.config import settings
+
+
+def estimate_row_count(db: Session, query: Query) -> Optional[int]:
+    """
+    Planner row estimate for a query (PostgreSQL only).
+    Returns None on other databases or if EXPLAIN fails.
+    """
+    bind = db.get_bind()
+    if bind.dialect.name != "postgresql":
+        return None
+
+    statement = query.order_by(None).limit(None).offset(None).statement
+    # Expanding IN parameters are rendered into the SQL text
+    compiled = statement.compile(dialect=bind.dialect, compile_kwargs={"render_postcompile": True})
+    try:
+        # In a savepoint: a failed EXPLAIN must not abort the caller's transaction
+        with db.begin_nested():
+            raw = db.connection().exec_driver_sql(
+                f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params
+            ).scalar()
+    except Exception:
+        return None
+
+    plan = json.loads(raw) if isinstance(raw, str) else raw
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def _total_from_page(offset: Optional[int], page_rows: int, limit: int) -> Optional[int]:
+    """
+    Total implied by a page fetched by offset: one shorter than `limit`
+    ends the set. None when the page says nothing (full, keyset, or empty
+    past the first page).
+    """
+    if offset is None or page_rows >= limit or (offset and not page_rows):
+        return None
+    return offset + page_rows
+
+
+def paginate_with_total(
+    db: Session,
+    query: Query,
+    skip: int,
+    limit: int,
+    exact_threshold: Optional[int] = None
+) -> Tuple[List[Any], int, bool]:
+    """
+    Fetch one page plus the size of the whole filtered set.
+
+    A page shorter than `limit` ends the set, so it gives an exact total
+    with no further query. Only full pages need count_total (and, on
+    PostgreSQL, its planner estimate). An empty page past the end reports
+    the offset as an upper bound (exact=False) rather than counting.
+    Returns (items, total, exact).
+    """
+    items = query.offset(skip).limit(limit).all()
+
+    known = _total_from_page(skip, len(items), limit)
+    if known is not None:
+        return items, known, True
+    if not items:
+        return items, skip, False
+
+    total, exact = count_total(db, query, exact_threshold)
+    # An estimate can undershoot what we can already see on this page
+    return items, max(total, skip + len(items)), exact
+
+
+def count_total(
+    db: Session,
+    query: Query,
+    exact_threshold: Optional[int] = None,
+    offset: Optional[int] = None,
+    page_rows: int = 0,
+    limit: int = 0
+) -> Tuple[int, bool]:
+    """
+    Size of the whole filtered set, for keyset-paginated lists where the
+    page query cannot carry a window count. Exact COUNT(*) unless, on
+    PostgreSQL, the planner expects more rows than the threshold.
+
+    Callers that fetched the page by offset pass it (offset, page_rows,
+    limit): a page shorter than `limit` gives the total without a query.
+    Returns (total, exact).
+    """
+    known = _total_from_page(offset, page_rows, limit)
+    if known is not None:
+        return known, True
+
+    threshold = settings.EXACT_TOTAL_THRESHOLD if exact_threshold is None else exact_threshold
+
+    estimate = estimate_row_count(db, query)
+    if estimate is not None and estimate > threshold:
+        return estimate, False
+    return query.order_by(None).count(), True
+
+
+def set_total_headers(response: Response, total: int, exact: bool):
+    """Expose list totals without changing list response bodies."""
+    response.headers["X-Total-Count"] = str(total)
+    response.headers["X-Total-Exact"] = "true" if exact else "false"
+
+
+def set_cursor_header(response: Response, next_cursor: Optional[Any]):
+    """Keyset pagination: the cursor for the next page, absent on the last page."""
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = str(next_cursor)
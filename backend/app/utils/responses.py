@@ -0,0 +1,41 @@
+"""
+JSON responses encoded with orjson.
+
+ORJSONResponse is the app's default response class (installed as a
+Default, so routes with a response_model keep FastAPI's Pydantic
+fast path). Routes returning dicts then get orjson instead of json.dumps,
+but FastAPI still runs jsonable_encoder over the dicts first, which
+costs far more than the encoding. List endpoints that build plain
+JSON-ready dicts return json_response(...) to skip it.
+"""
+from typing import Any, Optional
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from starlette.responses import Response
+
+
+def _default(obj: Any) -> Any:
+    # Types orjson does not encode natively (Decimal among them) are encoded
+    # as FastAPI would, so an integral Decimal stays an int
+    return jsonable_encoder(obj)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered by orjson (datetimes, UUIDs, enums natively)."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def json_response(content: Any, response: Optional[Response] = None) -> ORJSONResponse:
+    """
+    Encodes content directly, skipping jsonable_encoder. Headers set on the
+    route's injected `response` (X-Total-Count, ...) are carried over, since
+    FastAPI only merges them into responses it builds itself.
+    """
+    result = ORJSONResponse(content)
+    if response is not None:
+        result.headers.raw.extend(response.headers.raw)
+    return result
@@ -0,0 +1,9 @@
+import re
+import unicodedata
+
+
+def slugify(value: str) -> str:
+    """ASCII, lower-case, hyphen-separated slug for URLs."""
+    value = unicodedata.normalize('NFKD', str(value)).encode('ascii', 'ignore').decode('ascii')
+    value = re.sub(r'[^\w\s-]', '', value.lower())
+    return re.sub(r'[-\s]+', '-', value).strip('-')
@@ -0,0 +1,144 @@
+"""
+Per-endpoint benchmark for the public list APIs.
+
+    python bench_public_endpoints.py [--requests 50] [--limit 100]
+
+Builds a throwaway SQLite database with catalog-sized rows (long
+descriptions, specifications, gallery images), then calls each endpoint
+in-process and reports per request: CPU time, peak Python allocation
+(tracemalloc) and response size. The lifespan is not run, so the
+configured database is never touched.
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+# Add backend directory to path so we can import app modules
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.main import app
+from app.database.base import Base
+from app.database.connection import get_db
+from app.company.models.company_blog_posts_model import CompanyBlogPost
+from app.company.models.company_info_model import CompanyInfo
+from app.company.models.company_products_model import CompanyProduct
+from app.company.models.company_services_model import CompanyService
+from app.models.category_stats_model import CategoryStats
+from app.models.platform_stats_model import PlatformStats
+
+COMPANIES = 50
+ROWS_PER_COMPANY = 40
+LONG_TEXT = "Detailed description of materials, finish, tolerances and use. " * 40
+
+
+def build_database(path: str):
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    # Plus the counters that catalog writes maintain
+    models = (CompanyInfo, CompanyProduct, CompanyService, CompanyBlogPost, CategoryStats, PlatformStats)
+    Base.metadata.create_all(engine, tables=[model.__table__ for model in models])
+
+    Session = sessionmaker(bind=engine)
+    db = Session()
+    now = datetime.now(timezone.utc)
+    for tenant_id in range(1, COMPANIES + 1):
+        db.add(CompanyInfo(
+            tenant_id=tenant_id, company_name=f"Company {tenant_id}", city="Pune", state="MH",
+            industry="Manufacturing", tagline="Precision parts", about=LONG_TEXT,
+            mission=LONG_TEXT, vision=LONG_TEXT, values=LONG_TEXT, logo_url="https://cdn.example.com/logo.png"
+        ))
+        for n in range(ROWS_PER_COMPANY):
+            created = now - timedelta(minutes=tenant_id * ROWS_PER_COMPANY + n)
+            db.add(CompanyProduct(
+                tenant_id=tenant_id, name=f"Product {tenant_id}-{n}", slug=f"product-{tenant_id}-{n}",
+                price=1200.0 + n, category="Tools", short_description="Compact and durable.",
+                full_description=LONG_TEXT, main_image_url="https://cdn.example.com/p.png",
+                features=[f"Feature {i}" for i in range(20)],
+                specifications={f"spec_{i}": f"value {i}" for i in range(40)},
+                gallery_images=[f"https://cdn.example.com/g{i}.png" for i in range(12)],
+                created_at=created
+            ))
+            db.add(CompanyService(
+                tenant_id=tenant_id, title=f"Service {tenant_id}-{n}", slug=f"service-{tenant_id}-{n}",
+                short_description="On-site installation.", full_description=LONG_TEXT, category="Installation",
+                features=[f"Feature {i}" for i in range(20)], pricing="On request", status="active",
+                created_at=created
+            ))
+            db.add(CompanyBlogPost(
+                tenant_id=tenant_id, title=f"Post {tenant_id}-{n}", slug=f"post-{tenant_id}-{n}",
+                excerpt="What we learned.", content=LONG_TEXT, author="Editor", category="News",
+                meta_description="Post", tags="a,b", status="published", published_at=created,
+                created_at=created
+            ))
+        db.commit()
+    db.close()
+    return Session
+
+
+def measure(client: TestClient, url: str, requests: int):
+    for _ in range(3):
+        status = client.get(url).status_code
+        if status != 200:
+            return None, None, status
+
+    cpu, peaks = [], []
+    size = 0
+    tracemalloc.start()
+    for _ in range(requests):
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        start = time.process_time()
+        response = client.get(url)
+        cpu.append((time.process_time() - start) * 1000)
+        peaks.append((tracemalloc.get_traced_memory()[1] - before) / 1024)
+        size = len(response.content)
+    tracemalloc.stop()
+    return statistics.median(cpu), statistics.median(peaks), size
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark public list endpoints")
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--limit", type=int, default=100)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        Session = build_database(os.path.join(directory, "bench.db"))
+
+        def override_get_db():
+            db = Session()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        app.dependency_overrides[get_db] = override_get_db
+        client = TestClient(app, raise_server_exceptions=False)
+
+        endpoints = [
+            f"/public/products?limit={args.limit}",
+            f"/public/services?limit={args.limit}",
+            f"/public/businesses?limit={min(args.limit, COMPANIES)}",
+            f"/public/blogs?limit={args.limit}",
+            f"/public/search?type=all&limit={args.limit}",
+        ]
+        print(f"{'endpoint':<40} {'cpu ms':>8} {'peak KiB':>9} {'bytes':>8}   ({args.requests} requests, medians)")
+        for url in endpoints:
+            cpu, peak, size = measure(client, url, args.requests)
+            if cpu is None:
+                print(f"{url:<40} HTTP {size}")
+                continue
+            print(f"{url:<40} {cpu:8.2f} {peak:9.0f} {size:8d}")
+        app.dependency_overrides.clear()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Production launcher: gunicorn managing uvicorn workers.
+
+    gunicorn -c gunicorn.conf.py app.main:app
+
+- The master runs `python manage.py setup` (migrate + seed, under the
+  schema lock) once before forking, so workers never race on schema or
+  seed work; other containers starting at the same time wait on the lock.
+- preload_app imports the application once in the master; workers fork
+  with routes, models and mappers already built.
+- Each worker finishes warm-up in its startup event before /ready returns 200.
+
+Environment:
+    PORT                  listen port (8000)
+    WEB_CONCURRENCY       worker processes (CPU count)
+    GUNICORN_TIMEOUT      seconds a worker may stay silent before restart (60)
+    RUN_SETUP_ON_START    run migrate + seed before forking ("true")
+"""
+import os
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+workers = int(os.getenv("WEB_CONCURRENCY", str(os.cpu_count() or 1)))
+worker_class = "uvicorn_worker.UvicornWorker"
+preload_app = True
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "60"))
+graceful_timeout = 30
+keepalive = 5
+accesslog = "-"
+
+
+def on_starting(server):
+    # In a child process: the master keeps no DB connections or hashing
+    # pool from the seed to hand down to forked workers
+    if os.getenv("RUN_SETUP_ON_START", "true").lower() == "true":
+        server.log.info("Running schema migrations and seed")
+        subprocess.run([sys.executable, "manage.py", "setup"], cwd=BACKEND_DIR, check=True)
+
+    # The app is already preloaded; configure mappers once here so every
+    # worker inherits them instead of building its own
+    from sqlalchemy.orm import configure_mappers
+    from app.auth.user_queries import polymorphic_user
+    configure_mappers()
+    polymorphic_user()
+
+
+def post_fork(server, worker):
+    # Pooled connections must not be shared across processes; drop any the
+    # master opened while preloading without closing them under its feet
+    from app.database.connection import engine
+    engine.dispose(close=False)
@@ -0,0 +1,114 @@
+"""
+Database management commands.
+
+    python manage.py migrate [--target N]   apply pending schema migrations
+    python manage.py seed                   seed roles, permissions, admin user,
+                                            default customer type and plan (idempotent)
+    python manage.py backfill               build derived tables (dashboard rollups)
+                                            that have never been built
+    python manage.py setup                  migrate, seed, then backfill
+    python manage.py version                show the schema version and this build's head
+
+Run `migrate` (then `seed` on a new database) before starting the app; the
+app itself only checks the schema version at startup. Run `backfill` once
+after the migration that adds a derived table; until then its reads only
+reflect writes made since. migrate, seed, backfill and setup hold the
+schema lock, so any number of containers can run them at once: one does
+the work, the rest wait and find nothing to do.
+"""
+import argparse
+import logging
+import os
+import sys
+
+# Add backend directory to path so we can import app modules
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.database.connection import engine, SessionLocal
+from app.database.migrate import current_version, head_version, upgrade
+from app.database.schema_lock import schema_lock
+
+
+def _migrate(target=None):
+    applied = upgrade(engine, target)
+    if applied:
+        print(f"Applied migrations: {', '.join(f'{v:04d}' for v in applied)}")
+    print(f"Schema version: {current_version(engine)} (head {head_version()})")
+
+
+def _seed():
+    import app.database.models  # noqa: F401
+    from app.utils.seed_data import seed_data
+
+    db = SessionLocal()
+    try:
+        seed_data(db)
+    finally:
+        db.close()
+
+
+def _backfill():
+    import app.database.models  # noqa: F401
+    from app.admin.services.dashboard_rollup_service import ensure_dashboard_rollups
+
+    db = SessionLocal()
+    try:
+        if ensure_dashboard_rollups(db):
+            print("Built dashboard_rollups")
+    finally:
+        db.close()
+
+
+def migrate(target=None):
+    with schema_lock(engine):
+        _migrate(target)
+
+
+def seed():
+    with schema_lock(engine):
+        _seed()
+
+
+def backfill():
+    with schema_lock(engine):
+        _backfill()
+
+
+def setup():
+    with schema_lock(engine):
+        _migrate()
+        _seed()
+        _backfill()
+
+
+def version():
+    current = current_version(engine)
+    print(f"Schema version: {'none' if current is None else current} (head {head_version()})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Database management commands")
+    commands = parser.add_subparsers(dest="command", required=True)
+    migrate_parser = commands.add_parser("migrate", help="apply pending schema migrations")
+    migrate_parser.add_argument("--target", type=int, default=None, help="stop at this version")
+    commands.add_parser("seed", help="seed initial data (idempotent)")
+    commands.add_parser("backfill", help="build derived tables that were never built")
+    commands.add_parser("setup", help="migrate, seed, then backfill")
+    commands.add_parser("version", help="show schema version")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    if args.command == "migrate":
+        migrate(args.target)
+    elif args.command == "seed":
+        seed()
+    elif args.command == "backfill":
+        backfill()
+    elif args.command == "setup":
+        setup()
+    else:
+        version()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+Startup profiling and benchmark.
+
+    python profile_startup.py importtime [--top 25]
+        `python -X importtime -c "import app.main"` in a fresh process,
+        summarised: total, the heaviest imports of app.main, and the
+        modules with the most self time
+
+    python profile_startup.py bench [--runs 5] [--max-import-ms N] [--max-startup-ms N]
+        import and startup (lifespan, as a worker runs it) timed over
+        fresh processes; exits 1 if a median exceeds its limit or a
+        deferred module was imported at boot
+
+Startup needs a migrated database (python manage.py migrate); use
+--import-only to time the import alone.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Imported on first use, never at boot
+DEFERRED_MODULES = ("stripe", "razorpay")
+
+BENCH_CHILD = """
+import json, sys, time
+t0 = time.perf_counter()
+import app.main
+t1 = time.perf_counter()
+result = {"import_ms": (t1 - t0) * 1000, "deferred_loaded": [m for m in %(deferred)r if m in sys.modules]}
+if %(startup)r:
+    from fastapi.testclient import TestClient
+    t2 = time.perf_counter()
+    with TestClient(app.main.app):
+        result["startup_ms"] = (time.perf_counter() - t2) * 1000
+print(json.dumps(result))
+"""
+
+
+def _run(args: List[str]) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable] + args, cwd=BACKEND_DIR, capture_output=True, text=True, check=True)
+
+
+def import_profile() -> List[Dict]:
+    """Rows of `-X importtime` output: module, depth, self_us, cumulative_us."""
+    process = _run(["-X", "importtime", "-c", "import app.main"])
+    rows = []
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append({
+            "module": name.strip(),
+            "depth": (len(name) - len(name.lstrip()) - 1) // 2,
+            "self_us": int(self_us),
+            "cumulative_us": int(cumulative_us),
+        })
+    return rows
+
+
+def importtime_report(top: int):
+    rows = import_profile()
+    main = next(row for row in rows if row["module"] == "app.main")
+    total_us = sum(row["cumulative_us"] for row in rows if row["depth"] == 0)
+    print(f"Total import time: {total_us / 1000:.1f} ms (app.main: {main['cumulative_us'] / 1000:.1f} ms)\n")
+
+    # Direct imports of app.main: the output lists a module's imports before it
+    index = rows.index(main)
+    direct = []
+    for row in reversed(rows[:index]):
+        if row["depth"] == 0:
+            break
+        if row["depth"] == 1:
+            direct.append(row)
+    print(f"Heaviest imports of app.main (cumulative):")
+    for row in sorted(direct, key=lambda r: r["cumulative_us"], reverse=True)[:top]:
+        print(f"  {row['cumulative_us'] / 1000:8.1f} ms  {row['module']}")
+
+    print(f"\nMost self time:")
+    for row in sorted(rows, key=lambda r: r["self_us"], reverse=True)[:top]:
+        print(f"  {row['self_us'] / 1000:8.1f} ms  {row['module']}")
+
+    loaded = [m for m in DEFERRED_MODULES if any(row["module"] == m for row in rows)]
+    if loaded:
+        print(f"\nDeferred modules imported at boot: {', '.join(loaded)}")
+
+
+def bench(runs: int, startup: bool, max_import_ms: float, max_startup_ms: float) -> int:
+    child = BENCH_CHILD % {"deferred": DEFERRED_MODULES, "startup": startup}
+    results = []
+    for _ in range(runs):
+        process = _run(["-c", child])
+        results.append(json.loads(process.stdout.strip().splitlines()[-1]))
+
+    failures = []
+    for key, limit in (("import_ms", max_import_ms), ("startup_ms", max_startup_ms)):
+        values = [result[key] for result in results if key in result]
+        if not values:
+            continue
+        median = statistics.median(values)
+        print(f"{key[:-3]:>8}: median {median:7.1f} ms  min {min(values):7.1f}  max {max(values):7.1f}  ({runs} runs)")
+        if limit and median > limit:
+            failures.append(f"{key[:-3]} median {median:.1f} ms exceeds {limit:.0f} ms")
+
+    loaded = sorted({m for result in results for m in result["deferred_loaded"]})
+    if loaded:
+        failures.append(f"deferred modules imported at boot: {', '.join(loaded)}")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Startup profiling and benchmark")
+    commands = parser.add_subparsers(dest="command", required=True)
+    report_parser = commands.add_parser("importtime", help="import-time profile of app.main")
+    report_parser.add_argument("--top", type=int, default=25)
+    bench_parser = commands.add_parser("bench", help="time import and startup over fresh processes")
+    bench_parser.add_argument("--runs", type=int, default=5)
+    bench_parser.add_argument("--import-only", action="store_true", help="skip the startup (lifespan) timing")
+    bench_parser.add_argument("--max-import-ms", type=float, default=0, help="fail above this median (0: no limit)")
+    bench_parser.add_argument("--max-startup-ms", type=float, default=0, help="fail above this median (0: no limit)")
+    args = parser.parse_args()
+
+    if args.command == "importtime":
+        importtime_report(args.top)
+    else:
+        sys.exit(bench(args.runs, not args.import_only, args.max_import_ms, args.max_startup_ms))
+
+
+if __name__ == "__main__":
+    main()
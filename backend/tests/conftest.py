@@ -25,6 +25,9 @@ from app.main import app
 from app.database.base import Base
 from app.database.connection import get_db
 from app.core.security import get_password_hash
+from app.auth.login_throttle import login_throttle
+from app.payments import routes as payment_routes
+from app.tenants import middleware as tenant_middleware
 from app.models.user_model import User
 from app.models.role_model import Role
 from app.models.permission_model import Permission
@@ -84,9 +87,16 @@ def client(test_db: Session) -> TestClient:
             pass
     
     app.dependency_overrides[get_db] = override_get_db
+    # TenantMiddleware and webhook processing open their own sessions, outside dependency injection
+    session_local = tenant_middleware.SessionLocal
+    test_sessions = sessionmaker(autocommit=False, autoflush=False, bind=test_db.get_bind())
+    tenant_middleware.SessionLocal = payment_routes.SessionLocal = test_sessions
+    # Failed logins from earlier tests must not throttle this one
+    login_throttle.backend.clear()
     client = TestClient(app)
     yield client
     app.dependency_overrides.clear()
+    tenant_middleware.SessionLocal = payment_routes.SessionLocal = session_local
 
 
 # ============ Role and Permission Fixtures ============
@@ -219,6 +229,7 @@ def customer_user(
         hashed_password=get_password_hash("customer123"),
         user_type="customer",
         is_active=True,
+        is_approved=True,
         full_name="Test Customer 1",
         customer_type_id=default_customer_type.id
     )
@@ -265,6 +276,7 @@ def customer_user_2(
         hashed_password=get_password_hash("customer123"),
         user_type="customer",
         is_active=True,
+        is_approved=True,
         full_name="Test Customer 2",
         customer_type_id=default_customer_type.id
     )
@@ -311,6 +323,7 @@ def expired_customer_user(
         hashed_password=get_password_hash("customer123"),
         user_type="customer",
         is_active=True,
+        is_approved=True,
         full_name="Expired Customer",
         customer_type_id=default_customer_type.id
     )
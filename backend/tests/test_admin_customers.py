@@ -0,0 +1,95 @@
+"""
+Admin customer management tests for the FastAPI multi-tenant SaaS backend.
+
+Tests cover:
+- Keyset pagination, ordering and totals for the customer list
+- Search across email, name and phone
+- Company name and subscription status in list rows
+"""
+
+import pytest
+from sqlalchemy.orm import Session
+from app.admin.services.admin_customer_service import AdminCustomerService
+from app.core.security import get_password_hash
+from app.customer.models.customer_user_model import CustomerUser
+
+
+service = AdminCustomerService()
+
+
+def _add_customers(db: Session, count: int):
+    for i in range(count):
+        db.add(CustomerUser(
+            email=f"bulk{i}@test.com",
+            full_name=f"Bulk Customer {i}",
+            hashed_password=get_password_hash("password"),
+            user_type="customer",
+            is_active=True
+        ))
+    db.commit()
+
+
+@pytest.mark.admin
+class TestCustomerList:
+    """Test the admin customer list."""
+
+    def test_keyset_pages_cover_every_customer_once(self, test_db: Session, customer_user, customer_user_2):
+        """Following next_cursor walks all customers, newest first, without repeats."""
+        _add_customers(test_db, 7)
+
+        seen, cursor = [], None
+        while True:
+            rows, total, exact, cursor = service.get_customers(test_db, limit=3, cursor=cursor)
+            seen.extend(user.id for user, _, _ in rows)
+            if cursor is None:
+                break
+
+        assert total == 9 and exact
+        assert len(seen) == len(set(seen)) == 9
+        assert seen == sorted(seen, reverse=True)
+
+    def test_search_and_total(self, test_db: Session, customer_user):
+        """Search matches substrings and the total counts only matches."""
+        _add_customers(test_db, 5)
+
+        rows, total, exact, cursor = service.get_customers(test_db, limit=2, search="bulk customer")
+
+        assert total == 5
+        assert len(rows) == 2
+        assert cursor == rows[-1][0].id
+        assert all("Bulk" in user.full_name for user, _, _ in rows)
+
+    def test_rows_carry_company_and_subscription(self, test_db: Session, customer_user):
+        """Each row includes the company name and current subscription status."""
+        rows, _, _, _ = service.get_customers(test_db, search=customer_user.email)
+
+        user, company_name, subscription_status = rows[0]
+        assert user.id == customer_user.id
+        assert company_name == "Test Company 1"
+        assert subscription_status == "ACTIVE"
+
+
+@pytest.mark.admin
+class TestCustomerDetail:
+    """Test eager-loaded customer detail."""
+
+    def test_bulk_detail_loads_company_and_plan(
+        self,
+        test_db: Session,
+        customer_user,
+        customer_user_2,
+        default_subscription_plan
+    ):
+        """Details for several ids come back with company and active plan, in request order."""
+        customers = service.get_customer_details(test_db, [customer_user_2.id, 99999, customer_user.id])
+
+        assert [c.id for c in customers] == [customer_user_2.id, customer_user.id]
+        assert customers[1].company_info.company_name == "Test Company 1"
+        assert customers[1].active_subscription.plan.id == default_subscription_plan.id
+
+    def test_detail_ignores_inactive_subscriptions(self, test_db: Session, expired_customer_user):
+        """Only an ACTIVE subscription is reported as the customer's subscription."""
+        customer, company, subscription = service.get_customer_detail(test_db, expired_customer_user.id)
+
+        assert customer.id == expired_customer_user.id
+        assert subscription is None
@@ -0,0 +1,135 @@
+"""
+Admin dashboard tests for the FastAPI multi-tenant SaaS backend.
+
+Tests cover:
+- Rollups maintained from subscription and payment writes
+- One-time backfill from history, never on reads
+- Dashboard stats and time-series endpoints
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+from app.subscriptions.models import CustomerSubscription
+from app.payments.models import PaymentHistory
+from app.admin.services.dashboard_rollup_service import (
+    ensure_dashboard_rollups, get_dashboard_totals, rebuild_dashboard_rollups
+)
+
+
+def _add_payment(db: Session, customer_user, transaction_id: str, amount: float, status: str):
+    subscription = db.query(CustomerSubscription).filter(
+        CustomerSubscription.tenant_id == customer_user.id
+    ).first()
+    payment = PaymentHistory(
+        subscription_id=subscription.id,
+        amount=amount,
+        currency="INR",
+        payment_gateway="razorpay",
+        transaction_id=transaction_id,
+        payment_status=status
+    )
+    db.add(payment)
+    db.commit()
+    return payment
+
+
+@pytest.mark.admin
+class TestDashboardRollups:
+    """Test incremental rollup maintenance."""
+
+    def test_payment_success_updates_revenue(self, test_db: Session, customer_user):
+        """Revenue counts a payment once it succeeds, and drops it on refund."""
+        payment = _add_payment(test_db, customer_user, "txn_pending", 500.0, "PENDING")
+        assert get_dashboard_totals(test_db)["revenue"] == []
+
+        payment.payment_status = "SUCCESS"
+        test_db.commit()
+        revenue = get_dashboard_totals(test_db)["revenue"]
+        assert revenue == [{"gateway": "razorpay", "currency": "INR", "amount": 500.0, "count": 1}]
+
+        payment.payment_status = "REFUNDED"
+        test_db.commit()
+        assert get_dashboard_totals(test_db)["revenue"][0]["amount"] == 0
+
+    def test_subscription_status_moves_active_count(
+        self,
+        test_db: Session,
+        customer_user,
+        default_subscription_plan
+    ):
+        """Active subscriptions per plan follow status changes."""
+        plan_id = default_subscription_plan.id
+        assert get_dashboard_totals(test_db)["active_subscriptions_by_plan"][plan_id] == 1
+
+        subscription = test_db.query(CustomerSubscription).filter(
+            CustomerSubscription.tenant_id == customer_user.id
+        ).first()
+        subscription.status = "EXPIRED"
+        test_db.commit()
+
+        totals = get_dashboard_totals(test_db)
+        assert plan_id not in totals["active_subscriptions_by_plan"]
+        assert totals["subscriptions_by_plan"][plan_id] == 1
+
+    def test_rebuild_matches_incremental(self, test_db: Session, customer_user, customer_user_2):
+        """A backfill from history produces the same totals."""
+        _add_payment(test_db, customer_user, "txn_a", 100.0, "SUCCESS")
+        _add_payment(test_db, customer_user_2, "txn_b", 250.0, "SUCCESS")
+        incremental = get_dashboard_totals(test_db)
+
+        rebuild_dashboard_rollups(test_db)
+        assert get_dashboard_totals(test_db) == incremental
+
+    def test_backfill_counts_history_listeners_missed(self, test_db: Session, customer_user):
+        """Reads never rebuild; the one-time backfill counts payments the listeners never saw."""
+        subscription = test_db.query(CustomerSubscription).filter(
+            CustomerSubscription.tenant_id == customer_user.id
+        ).first()
+        # Written before the rollups existed
+        test_db.execute(PaymentHistory.__table__.insert().values(
+            subscription_id=subscription.id, amount=75.0, currency="INR", payment_gateway="razorpay",
+            transaction_id="txn_old", payment_status="SUCCESS"
+        ))
+        test_db.commit()
+        assert get_dashboard_totals(test_db)["revenue"] == []
+
+        assert ensure_dashboard_rollups(test_db) is True
+        assert get_dashboard_totals(test_db)["revenue"][0]["amount"] == 75.0
+        assert ensure_dashboard_rollups(test_db) is False
+
+
+@pytest.mark.admin
+class TestDashboardEndpoints:
+    """Test dashboard endpoints backed by rollups."""
+
+    def test_stats_reads_rollups(self, client: TestClient, test_db: Session, auth_headers, customer_user):
+        """Dashboard cards come from the rollup totals."""
+        _add_payment(test_db, customer_user, "txn_stats", 999.0, "SUCCESS")
+
+        response = client.get("/admin/dashboard/stats", headers=auth_headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_customers"] == 1
+        assert data["active_subscriptions"] == 1
+        assert data["total_revenue"] == 999.0
+
+    def test_timeseries_returns_buckets(self, client: TestClient, test_db: Session, auth_headers, customer_user):
+        """Revenue trend is served per day with gateway and currency."""
+        _add_payment(test_db, customer_user, "txn_series", 300.0, "SUCCESS")
+
+        response = client.get(
+            "/admin/dashboard/timeseries",
+            headers=auth_headers,
+            params={"metric": "revenue", "granularity": "day"}
+        )
+        assert response.status_code == 200
+        points = response.json()["points"]
+        assert len(points) == 1
+        assert points[0]["value"] == 300.0
+        assert points[0]["gateway"] == "razorpay"
+
+    def test_timeseries_rejects_unknown_metric(self, client: TestClient, auth_headers):
+        """Only revenue and signups have series."""
+        response = client.get("/admin/dashboard/timeseries", headers=auth_headers, params={"metric": "logins"})
+        assert response.status_code == 400
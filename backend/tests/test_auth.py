@@ -14,6 +14,7 @@ from sqlalchemy.orm import Session
 from app.models.user_model import User
 from app.subscriptions.models import CustomerSubscription
 from app.company.models.company_info_model import CompanyInfo
+from app.auth.jwt_handler import decode_access_token
 
 
 @pytest.mark.auth
@@ -388,3 +389,195 @@ class TestAuthenticationEdgeCases:
         headers = {"Authorization": "Bearer invalid.token.here"}
         response = client.get("/customer/company/info/", headers=headers)
         assert response.status_code == 401
+
+
+
+@pytest.mark.auth
+class TestTokenClaims:
+    """Test principal claims and token revocation."""
+    
+    def test_login_token_carries_principal(self, client: TestClient, customer_user):
+        """Access tokens embed uid, typ, tid and ver."""
+        response = client.post(
+            "/auth/login",
+            data={"username": customer_user.email, "password": "customer123"}
+        )
+        payload = decode_access_token(response.json()["access_token"])
+        
+        assert payload["sub"] == customer_user.email
+        assert payload["uid"] == customer_user.id
+        assert payload["typ"] == "customer"
+        assert payload["tid"] == customer_user.id
+        assert payload["ver"] == 0
+    
+    def test_password_change_revokes_old_tokens(
+        self, 
+        client: TestClient, 
+        customer_user,
+        customer_auth_headers
+    ):
+        """Tokens issued before a password change stop working."""
+        response = client.post(
+            "/customer/change-password",
+            headers=customer_auth_headers,
+            json={"current_password": "customer123", "new_password": "newpassword123"}
+        )
+        assert response.status_code == 200
+        
+        response = client.get("/customer/profile", headers=customer_auth_headers)
+        assert response.status_code == 401
+        
+        response = client.post(
+            "/auth/login",
+            data={"username": customer_user.email, "password": "newpassword123"}
+        )
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+        assert client.get("/customer/profile", headers=headers).status_code == 200
+
+    
+    def test_logout_revokes_only_current_token(self, client: TestClient, customer_user):
+        """Logout revokes the presented token; other sessions keep working."""
+        tokens = []
+        for _ in range(2):
+            response = client.post(
+                "/auth/login",
+                data={"username": customer_user.email, "password": "customer123"}
+            )
+            tokens.append(response.json()["access_token"])
+        first, second = ({"Authorization": f"Bearer {t}"} for t in tokens)
+        
+        response = client.post("/auth/logout", headers=first)
+        assert response.status_code == 200
+        
+        assert client.get("/customer/profile", headers=first).status_code == 401
+        assert client.get("/customer/profile", headers=second).status_code == 200
+
+class TestPasswordHashing:
+    """Test hash upgrades on login and hashing backpressure."""
+    
+    def test_login_upgrades_outdated_hash(
+        self, 
+        client: TestClient, 
+        test_db: Session, 
+        customer_user
+    ):
+        """A hash below the configured cost is replaced after a successful login."""
+        from passlib.hash import bcrypt
+        
+        customer_user.hashed_password = bcrypt.using(rounds=4).hash("customer123")
+        test_db.commit()
+        old_version = customer_user.token_version
+        
+        response = client.post(
+            "/auth/login",
+            data={"username": customer_user.email, "password": "customer123"}
+        )
+        assert response.status_code == 200
+        
+        test_db.expire_all()
+        user = test_db.query(User).filter(User.id == customer_user.id).first()
+        assert not user.hashed_password.startswith("$2b$04$")
+        # Rehashing is not a credential change; existing sessions stay valid
+        assert user.token_version == old_version
+    
+    def test_login_rejected_fast_when_hasher_saturated(
+        self, 
+        client: TestClient, 
+        customer_user,
+        monkeypatch
+    ):
+        """Logins beyond the in-flight cap get 429 instead of queueing."""
+        from app.core.security import password_pool
+        
+        monkeypatch.setattr(password_pool, "workers", 1)
+        monkeypatch.setattr(password_pool, "max_pending", 0)
+        
+        response = client.post(
+            "/auth/login",
+            data={"username": customer_user.email, "password": "customer123"}
+        )
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "1"
+
+
+class TestLoginThrottle:
+    """Test brute-force throttling of the login endpoint."""
+    
+    def test_repeated_failures_are_throttled(self, client: TestClient, customer_user, monkeypatch):
+        """After the per-account limit, attempts get 429 without checking the password."""
+        from app.auth import auth_routes
+        from app.core.config import settings
+        
+        for _ in range(settings.LOGIN_MAX_FAILURES_PER_USER_IP):
+            response = client.post(
+                "/auth/login",
+                data={"username": customer_user.email, "password": "wrongpassword"}
+            )
+            assert response.status_code == 401
+        
+        def fail_verify(*args):
+            raise AssertionError("bcrypt must not run for throttled attempts")
+        
+        monkeypatch.setattr(auth_routes, "verify_and_update_password", fail_verify)
+        response = client.post(
+            "/auth/login",
+            data={"username": customer_user.email, "password": "customer123"}
+        )
+        assert response.status_code == 429
+        assert int(response.headers["Retry-After"]) >= 1
+    
+    def test_other_accounts_unaffected(self, client: TestClient, customer_user, admin_user):
+        """Throttling one account does not block other logins."""
+        from app.core.config import settings
+        
+        for _ in range(settings.LOGIN_MAX_FAILURES_PER_USER_IP):
+            client.post(
+                "/auth/login",
+                data={"username": customer_user.email, "password": "wrongpassword"}
+            )
+        
+        response = client.post(
+            "/auth/login",
+            data={"username": admin_user.email, "password": "admin123"}
+        )
+        assert response.status_code == 200
+    
+    def test_backoff_grows_with_failures(self):
+        """Each failure past the limit doubles the wait."""
+        from app.auth.login_throttle import LoginThrottle, MemoryThrottleBackend
+        
+        throttle = LoginThrottle(
+            MemoryThrottleBackend(900),
+            limits={"user_ip": 2, "ip": 100, "user": 100},
+            backoff_base=10,
+            backoff_max=1000
+        )
+        throttle.record_failure("victim@test.com", "10.0.0.1")
+        assert throttle.retry_after("victim@test.com", "10.0.0.1") == 0
+        
+        throttle.record_failure("victim@test.com", "10.0.0.1")
+        first_wait = throttle.retry_after("victim@test.com", "10.0.0.1")
+        throttle.record_failure("victim@test.com", "10.0.0.1")
+        second_wait = throttle.retry_after("Victim@test.com", "10.0.0.1")
+        
+        assert 0 < first_wait <= 11
+        assert 11 < second_wait <= 21
+        # Same account from another address is not blocked by the per-client limit
+        assert throttle.retry_after("victim@test.com", "10.0.0.2") == 0
+        
+        throttle.record_success("victim@test.com", "10.0.0.1")
+        assert throttle.retry_after("victim@test.com", "10.0.0.1") == 0
+
+    def test_memory_backend_evicts_stalest_key(self):
+        """At maxkeys, a new key drops the key whose latest failure is oldest."""
+        from app.auth.login_throttle import MemoryThrottleBackend
+        
+        backend = MemoryThrottleBackend(900, maxkeys=2)
+        backend.add_failure("a")
+        backend.add_failure("b")
+        backend.add_failure("a")
+        backend.add_failure("c")
+        
+        assert backend.failures("a")[0] == 2
+        assert backend.failures("b")[0] == 0
+        assert backend.failures("c")[0] == 1
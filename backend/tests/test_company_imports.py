@@ -0,0 +1,157 @@
+"""
+Catalog import tests for the FastAPI multi-tenant SaaS backend.
+
+Tests cover:
+- CSV / JSONL uploads creating an import job
+- Per-row errors and tenant-unique slugs
+- Job visibility per tenant
+"""
+
+import json
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+from app.company.models.company_products_model import CompanyProduct
+from app.company.models.company_services_model import CompanyService
+
+
+@pytest.mark.company
+class TestCatalogImport:
+    """Test streaming product/service imports and their jobs."""
+
+    def test_csv_product_import_reports_row_errors(
+        self,
+        client: TestClient,
+        test_db: Session,
+        customer_auth_headers,
+        customer_user
+    ):
+        """Valid rows are imported, invalid ones are listed by row number."""
+        test_db.add(CompanyProduct(tenant_id=customer_user.id, name="Widget", slug="widget"))
+        test_db.commit()
+
+        csv_body = (
+            "name,price,features\n"
+            "Widget,10,\"[\"\"red\"\",\"\"blue\"\"]\"\n"
+            ",5,\n"
+            "Gadget,not-a-price,\n"
+            "Gizmo,,\n"
+        )
+        response = client.post(
+            "/customer/company/imports/products",
+            headers=customer_auth_headers,
+            files={"file": ("catalog.csv", csv_body, "text/csv")}
+        )
+        assert response.status_code == 202
+        job_id = response.json()["id"]
+
+        # The import runs after the response; TestClient completes it before returning
+        job = client.get(f"/customer/company/imports/{job_id}", headers=customer_auth_headers).json()
+        assert job["status"] == "COMPLETED"
+        assert job["processed_rows"] == 4
+        assert job["created_count"] == 2
+        assert [e["row"] for e in job["errors"]] == [2, 3]
+
+        products = test_db.query(CompanyProduct).filter(
+            CompanyProduct.tenant_id == customer_user.id
+        ).order_by(CompanyProduct.id).all()
+        assert [(p.name, p.slug) for p in products] == [("Widget", "widget"), ("Widget", "widget-2"), ("Gizmo", "gizmo")]
+        assert products[1].features == ["red", "blue"]
+
+    def test_csv_empty_cells_keep_schema_defaults(
+        self,
+        client: TestClient,
+        test_db: Session,
+        customer_auth_headers,
+        customer_user
+    ):
+        """An empty cell is a missing value, not an explicit null."""
+        csv_body = "name,stock_status,publish_to_portfolio\nBlank,,\nSet,out_of_stock,true\n"
+        response = client.post(
+            "/customer/company/imports/products",
+            headers=customer_auth_headers,
+            files={"file": ("catalog.csv", csv_body, "text/csv")}
+        )
+        assert response.status_code == 202
+
+        products = test_db.query(CompanyProduct).filter(
+            CompanyProduct.tenant_id == customer_user.id
+        ).order_by(CompanyProduct.id).all()
+        assert [(p.stock_status, p.publish_to_portfolio) for p in products] == [
+            ("in_stock", False), ("out_of_stock", True)
+        ]
+
+    def test_import_updates_counters(
+        self,
+        client: TestClient,
+        test_db: Session,
+        customer_auth_headers,
+        customer_user
+    ):
+        """Imported rows are added to the category and platform counters."""
+        from app.services.category_stats_service import get_category_counts
+        from app.services.platform_stats_service import _counts_cache, get_platform_counts, reconcile_platform_stats
+
+        reconcile_platform_stats(test_db)
+        before = get_platform_counts(test_db)["products"]
+        get_category_counts(test_db)
+
+        csv_body = "name,category\nDrill,Tools\nSaw,Tools\nCable,Electrical\n"
+        response = client.post(
+            "/customer/company/imports/products",
+            headers=customer_auth_headers,
+            files={"file": ("catalog.csv", csv_body, "text/csv")}
+        )
+        assert response.status_code == 202
+
+        counts = get_category_counts(test_db)
+        assert counts["Tools"]["product_count"] == 2
+        assert counts["Electrical"]["product_count"] == 1
+        _counts_cache.invalidate()
+        assert get_platform_counts(test_db)["products"] == before + 3
+
+    def test_jsonl_service_import(
+        self,
+        client: TestClient,
+        test_db: Session,
+        customer_auth_headers,
+        customer_user
+    ):
+        """JSONL lines are imported as services."""
+        lines = "\n".join(json.dumps({"title": f"Service {i}", "features": ["x"]}) for i in range(3))
+        response = client.post(
+            "/customer/company/imports/services",
+            headers=customer_auth_headers,
+            files={"file": ("services.jsonl", lines, "application/x-ndjson")}
+        )
+        assert response.status_code == 202
+        assert response.json()["status"] == "PENDING"
+
+        job = client.get(f"/customer/company/imports/{response.json()['id']}", headers=customer_auth_headers).json()
+        assert job["status"] == "COMPLETED"
+        assert job["created_count"] == 3
+        assert job["error_count"] == 0
+        assert test_db.query(CompanyService).filter(CompanyService.tenant_id == customer_user.id).count() == 3
+
+    def test_unknown_format_and_other_tenant_job(
+        self,
+        client: TestClient,
+        test_db: Session,
+        customer_auth_headers,
+        customer_user_2
+    ):
+        """Unsupported files are refused and other tenants' jobs are hidden."""
+        from app.models.import_job_model import ImportJob
+
+        response = client.post(
+            "/customer/company/imports/products",
+            headers=customer_auth_headers,
+            files={"file": ("catalog.xlsx", b"PK", "application/octet-stream")}
+        )
+        assert response.status_code == 400
+
+        job = ImportJob(tenant_id=customer_user_2.id, resource="products", file_format="csv", status="COMPLETED")
+        test_db.add(job)
+        test_db.commit()
+        response = client.get(f"/customer/company/imports/{job.id}", headers=customer_auth_headers)
+        assert response.status_code == 404
@@ -134,3 +134,253 @@ class TestCompanyProductsCRUD:
         tenant_ids = [p["tenant_id"] for p in products]
         assert customer_user.id in tenant_ids
         assert customer_user_2.id in tenant_ids
+
+
+@pytest.mark.company
+class TestCompanyProductsBulk:
+    """Test batch create/update/delete for company products."""
+
+    def test_bulk_create_reports_invalid_items(
+        self,
+        client: TestClient,
+        test_db: Session,
+        customer_auth_headers,
+        customer_user
+    ):
+        """Valid items are created in one batch; invalid ones are reported by index."""
+        from app.models.public_portfolio_model import PublicPortfolio
+
+        response = client.post(
+            "/customer/company/products/bulk",
+            headers=customer_auth_headers,
+            json={"items": [
+                {"name": "Bulk Widget", "price": 10, "publish_to_portfolio": True},
+                {"price": "not a number"},
+                {"name": "Bulk Gadget"}
+            ]}
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert [p["name"] for p in data["items"]] == ["Bulk Widget", "Bulk Gadget"]
+        assert data["items"][0]["slug"] == "bulk-widget"
+        assert all(p["tenant_id"] == customer_user.id for p in data["items"])
+        assert [e["index"] for e in data["errors"]] == [1]
+
+        portfolio = test_db.query(PublicPortfolio).filter(PublicPortfolio.tenant_id == customer_user.id).all()
+        assert [p.item_id for p in portfolio] == [data["items"][0]["id"]]
+
+    def test_bulk_create_atomic_rejects_whole_batch(
+        self,
+        client: TestClient,
+        test_db: Session,
+        customer_auth_headers,
+        customer_user
+    ):
+        """With atomic=true one invalid item means nothing is written."""
+        response = client.post(
+            "/customer/company/products/bulk?atomic=true",
+            headers=customer_auth_headers,
+            json={"items": [{"name": "Kept Back"}, {"price": 5}]}
+        )
+        assert response.status_code == 422
+        assert test_db.query(CompanyProduct).filter(CompanyProduct.tenant_id == customer_user.id).count() == 0
+
+    def test_bulk_update_and_delete_are_tenant_scoped(
+        self,
+        client: TestClient,
+        test_db: Session,
+        customer_auth_headers,
+        customer_user,
+        customer_user_2
+    ):
+        """Items of another tenant are reported as not found and left untouched."""
+        own = CompanyProduct(tenant_id=customer_user.id, name="Own", slug="own")
+        other = CompanyProduct(tenant_id=customer_user_2.id, name="Other", slug="other")
+        test_db.add_all([own, other])
+        test_db.commit()
+
+        response = client.patch(
+            "/customer/company/products/bulk",
+            headers=customer_auth_headers,
+            json={"items": [{"id": own.id, "price": 99}, {"id": other.id, "price": 1}]}
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert [(p["id"], p["price"]) for p in data["items"]] == [(own.id, 99)]
+        assert [(e["index"], e["id"]) for e in data["errors"]] == [(1, other.id)]
+
+        response = client.post(
+            "/customer/company/products/bulk/delete",
+            headers=customer_auth_headers,
+            json={"ids": [own.id, other.id]}
+        )
+        assert response.status_code == 200
+        assert response.json()["deleted_ids"] == [own.id]
+        test_db.expire_all()
+        assert test_db.get(CompanyProduct, other.id).price is None
+        assert test_db.get(CompanyProduct, own.id) is None
+
+    def test_bulk_create_and_delete_update_counters(
+        self,
+        client: TestClient,
+        test_db: Session,
+        customer_auth_headers,
+        customer_user
+    ):
+        """Bulk statements apply the category and platform counter deltas."""
+        from app.services.category_stats_service import get_category_counts
+        from app.services.platform_stats_service import _counts_cache, get_platform_counts, reconcile_platform_stats
+
+        reconcile_platform_stats(test_db)
+        before = get_platform_counts(test_db)["products"]
+        get_category_counts(test_db)
+
+        response = client.post(
+            "/customer/company/products/bulk",
+            headers=customer_auth_headers,
+            json={"items": [
+                {"name": "Bulk Drill", "category": "Tools"},
+                {"name": "Bulk Saw", "category": "Tools"},
+                {"name": "Bulk Cable", "category": "Electrical"}
+            ]}
+        )
+        assert response.status_code == 200
+        ids = [p["id"] for p in response.json()["items"]]
+        counts = get_category_counts(test_db)
+        assert counts["Tools"]["product_count"] == 2
+        assert counts["Electrical"]["product_count"] == 1
+        _counts_cache.invalidate()
+        assert get_platform_counts(test_db)["products"] == before + 3
+
+        response = client.post(
+            "/customer/company/products/bulk/delete",
+            headers=customer_auth_headers,
+            json={"ids": ids[:2]}
+        )
+        assert response.status_code == 200
+        assert get_category_counts(test_db)["Tools"]["product_count"] == 0
+        _counts_cache.invalidate()
+        assert get_platform_counts(test_db)["products"] == before + 1
+
+
+@pytest.mark.company
+class TestCompanyProductsExport:
+    """Test streaming product exports."""
+
+    def test_customer_export_is_tenant_scoped_ndjson(
+        self,
+        client: TestClient,
+        test_db: Session,
+        customer_auth_headers,
+        customer_user,
+        customer_user_2
+    ):
+        """NDJSON export contains only the caller's products, one per line."""
+        import json
+
+        test_db.add_all([
+            CompanyProduct(tenant_id=customer_user.id, name="Mine", slug="mine", features=["a"]),
+            CompanyProduct(tenant_id=customer_user_2.id, name="Theirs", slug="theirs")
+        ])
+        test_db.commit()
+
+        response = client.get("/customer/company/products/export", headers=customer_auth_headers)
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [(r["name"], r["features"]) for r in rows] == [("Mine", ["a"])]
+
+    def test_customer_export_csv_gzip(
+        self,
+        client: TestClient,
+        test_db: Session,
+        customer_auth_headers,
+        customer_user
+    ):
+        """CSV export can be downloaded gzipped, with a header row."""
+        import csv
+        import gzip
+        import io
+
+        test_db.add(CompanyProduct(tenant_id=customer_user.id, name="Mine", slug="mine", price=5.0))
+        test_db.commit()
+
+        response = client.get(
+            "/customer/company/products/export?format=csv&compress=gzip",
+            headers=customer_auth_headers
+        )
+        assert response.status_code == 200
+        assert 'filename="products.csv.gz"' in response.headers["content-disposition"]
+        rows = list(csv.DictReader(io.StringIO(gzip.decompress(response.content).decode())))
+        assert [(r["name"], r["price"]) for r in rows] == [("Mine", "5.0")]
+
+
+@pytest.mark.company
+class TestCompanyProductsListQuery:
+    """Test filtered, sorted, keyset-paginated product lists."""
+
+    def test_filter_sort_and_cursor_pages(
+        self,
+        client: TestClient,
+        test_db: Session,
+        customer_auth_headers,
+        customer_user
+    ):
+        """Pages follow X-Next-Cursor in sort order, within the filter."""
+        test_db.add_all([
+            CompanyProduct(tenant_id=customer_user.id, name=f"P{i}", slug=f"p{i}", price=float(i % 3),
+                           category="tools" if i % 2 else "toys")
+            for i in range(7)
+        ])
+        test_db.commit()
+
+        seen, cursor = [], None
+        while True:
+            params = {"category": "tools", "sort": "-price", "limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            response = client.get("/customer/company/products/", headers=customer_auth_headers, params=params)
+            assert response.status_code == 200
+            assert response.headers["X-Total-Count"] == "3"
+            seen += [(p["price"], p["name"]) for p in response.json()]
+            cursor = response.headers.get("X-Next-Cursor")
+            if not cursor:
+                break
+
+        # Ties on price are broken by id, in the same direction
+        assert seen == [(2.0, "P5"), (1.0, "P1"), (0.0, "P3")]
+
+    def test_search_and_admin_tenant_filter(
+        self,
+        client: TestClient,
+        test_db: Session,
+        auth_headers,
+        customer_user,
+        customer_user_2
+    ):
+        """Admins can scope a list to one tenant and search it."""
+        test_db.add_all([
+            CompanyProduct(tenant_id=customer_user.id, name="Blue Widget", slug="blue"),
+            CompanyProduct(tenant_id=customer_user.id, name="Red Gadget", slug="red"),
+            CompanyProduct(tenant_id=customer_user_2.id, name="Green Widget", slug="green")
+        ])
+        test_db.commit()
+
+        response = client.get(
+            "/admin/company/products/",
+            headers=auth_headers,
+            params={"tenant_id": customer_user.id, "search": "widget"}
+        )
+        assert response.status_code == 200
+        assert [p["name"] for p in response.json()] == ["Blue Widget"]
+
+    def test_rejects_unknown_sort_and_bad_cursor(
+        self,
+        client: TestClient,
+        customer_auth_headers
+    ):
+        """Sorting by a non-whitelisted field or a forged cursor is a 400."""
+        response = client.get("/customer/company/products/?sort=full_description", headers=customer_auth_headers)
+        assert response.status_code == 400
+        response = client.get("/customer/company/products/?sort=price&cursor=bm9wZQ", headers=customer_auth_headers)
+        assert response.status_code == 400
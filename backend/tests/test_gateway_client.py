@@ -0,0 +1,112 @@
+"""
+Payment gateway HTTP client tests for the FastAPI multi-tenant SaaS backend.
+
+Tests cover:
+- Keep-alive connection reuse
+- Read timeouts
+- Circuit breaker
+- PhonePe calls through the shared client
+"""
+
+import time
+import pytest
+from app.payments.gateway_client import CircuitBreaker, GatewayHTTPClient, GatewayUnavailableError
+from app.payments.phonepe_service import PhonePeService
+from tests.utils.mock_gateway import MockGatewayServer
+
+
+@pytest.fixture(scope="function")
+def gateway():
+    """Start a local mock gateway."""
+    with MockGatewayServer() as server:
+        yield server
+
+
+def _client(gateway: MockGatewayServer, **kwargs) -> GatewayHTTPClient:
+    options = dict(connect_timeout=1, read_timeout=1, max_retries=0, pool_size=2)
+    options.update(kwargs)
+    return GatewayHTTPClient("mock", gateway.url, **options)
+
+
+@pytest.mark.subscription
+class TestGatewayClient:
+    """Test pooling, timeouts and the circuit breaker."""
+
+    def test_requests_reuse_one_connection(self, gateway):
+        """Sequential calls ride a single keep-alive connection."""
+        client = _client(gateway)
+        for _ in range(3):
+            assert client.get("/pg/v1/status/M/T1").status_code == 200
+        assert gateway.connections == 1
+
+    def test_slow_gateway_times_out(self, gateway):
+        """A hung gateway releases the worker after the read timeout."""
+        gateway.delay = 1.0
+        client = _client(gateway, read_timeout=0.2)
+
+        started = time.monotonic()
+        with pytest.raises(GatewayUnavailableError):
+            client.get("/pg/v1/status/M/T1")
+        assert time.monotonic() - started < 0.9
+
+    def test_circuit_opens_after_failures(self, gateway):
+        """Once open, calls fail fast without reaching the gateway."""
+        gateway.fail_status = 500
+        client = _client(gateway, breaker=CircuitBreaker(failure_threshold=2, reset_timeout=60))
+
+        for _ in range(2):
+            with pytest.raises(GatewayUnavailableError):
+                client.post("/pg/v1/pay", json={})
+        seen = len(gateway.requests)
+
+        with pytest.raises(GatewayUnavailableError, match="circuit open"):
+            client.post("/pg/v1/pay", json={})
+        assert len(gateway.requests) == seen
+        assert client.breaker.state == "open"
+
+    def test_half_open_trial_closes_circuit(self, gateway):
+        """A successful trial call after the reset timeout closes the circuit."""
+        client = _client(gateway, breaker=CircuitBreaker(failure_threshold=1, reset_timeout=0))
+        client.breaker.record_failure()
+
+        assert client.get("/pg/v1/status/M/T1").status_code == 200
+        assert client.breaker.state == "closed"
+
+    def test_half_open_trial_released_on_other_errors(self, gateway):
+        """A trial ending in a non-transport error lets the next call try again."""
+        client = _client(gateway, breaker=CircuitBreaker(failure_threshold=1, reset_timeout=0))
+        client.breaker.record_failure()
+
+        def broken_call():
+            raise ValueError("bad response payload")
+
+        with pytest.raises(ValueError):
+            client.call(broken_call)
+        assert client.breaker.state == "half-open"
+        assert client.get("/pg/v1/status/M/T1").status_code == 200
+        assert client.breaker.state == "closed"
+
+
+@pytest.mark.subscription
+class TestPhonePeThroughClient:
+    """Test PhonePe calls against the mock gateway."""
+
+    def test_create_payment(self, gateway):
+        """Non-demo merchants call /pg/v1/pay through the pooled client."""
+        service = PhonePeService()
+        service.merchant_id = "MOCKMERCHANT"
+        service.http = _client(gateway)
+
+        payment = service.create_payment(amount=499.0, customer_id=7, plan_id=2)
+        assert payment["payment_url"] == "https://mock.pay/redirect"
+        assert payment["transaction_id"].startswith("TXN_7_2_")
+        assert gateway.requests == ["POST /pg/v1/pay"]
+
+    def test_verify_payment(self, gateway):
+        """Status checks go through the same pooled client."""
+        service = PhonePeService()
+        service.http = _client(gateway)
+
+        result = service.verify_payment("TXN_7_2_1")
+        assert result["code"] == "PAYMENT_SUCCESS"
+        assert gateway.requests == [f"GET /pg/v1/status/{service.merchant_id}/TXN_7_2_1"]
@@ -0,0 +1,124 @@
+"""
+Schema migration tests for the FastAPI multi-tenant SaaS backend.
+
+Tests cover:
+- Fresh database upgraded to head, matching the models
+- Re-running is a no-op
+- Adopting a database built before the runner
+- Startup schema version check
+- Schema lock between processes
+"""
+
+import fcntl
+import json
+
+import pytest
+from sqlalchemy import create_engine, inspect, text
+from app.database.migrate import (
+    SchemaOutOfDate, check_schema_version, current_version, head_version, upgrade
+)
+from app.database.schema_lock import schema_lock
+
+
+@pytest.fixture(scope="function")
+def engine(tmp_path):
+    """An empty on-disk SQLite database."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'schema.db'}")
+    yield engine
+    engine.dispose()
+
+
+class TestMigrations:
+    """Test the versioned migration runner."""
+
+    def test_fresh_database_reaches_head(self, engine):
+        """All migrations apply in order and the version is recorded once."""
+        applied = upgrade(engine)
+        assert applied == sorted(applied) and applied[-1] == head_version()
+        assert current_version(engine) == head_version()
+        assert "company_products" in inspect(engine).get_table_names()
+        assert upgrade(engine) == []
+
+    def test_head_matches_models(self, engine):
+        """Every table, column and index the models declare is created by a migration."""
+        from app.database.base import Base
+        import app.database.models  # noqa: F401
+
+        upgrade(engine)
+
+        inspector = inspect(engine)
+        for table in Base.metadata.sorted_tables:
+            columns = {c["name"] for c in inspector.get_columns(table.name)}
+            assert {c.name for c in table.columns} <= columns, table.name
+            indexes = {i["name"] for i in inspector.get_indexes(table.name)}
+            assert {i.name for i in table.indexes} <= indexes, table.name
+
+    def test_adopts_database_built_before_runner(self, engine):
+        """A table missing a later column gets it; existing rows are kept."""
+        with engine.begin() as connection:
+            connection.execute(text(
+                "CREATE TABLE company_products (id INTEGER PRIMARY KEY, tenant_id INTEGER NOT NULL, "
+                "name VARCHAR(255) NOT NULL, slug VARCHAR(255) NOT NULL)"
+            ))
+            connection.execute(text("INSERT INTO company_products (tenant_id, name, slug) VALUES (1, 'Kept', 'kept')"))
+
+        upgrade(engine)
+
+        columns = {c["name"] for c in inspect(engine).get_columns("company_products")}
+        assert {"stock_quantity", "publish_to_portfolio", "created_at"} <= columns
+        indexes = {i["name"] for i in inspect(engine).get_indexes("company_products")}
+        assert "ix_company_products_tenant_sort_created_at" in indexes
+        with engine.connect() as connection:
+            assert connection.execute(text("SELECT name FROM company_products")).scalar() == "Kept"
+
+    def test_adopted_columns_get_script_defaults(self, engine):
+        """Columns added to legacy rows are backfilled as the removed scripts did."""
+        with engine.begin() as connection:
+            connection.execute(text(
+                "CREATE TABLE company_products (id INTEGER PRIMARY KEY, tenant_id INTEGER NOT NULL, "
+                "name VARCHAR(255) NOT NULL, slug VARCHAR(255) NOT NULL)"
+            ))
+            connection.execute(text("INSERT INTO company_products (tenant_id, name, slug) VALUES (1, 'Kept', 'kept')"))
+            connection.execute(text("CREATE TABLE site_settings (id INTEGER PRIMARY KEY, site_name VARCHAR(255))"))
+            connection.execute(text("INSERT INTO site_settings (site_name) VALUES ('Legacy')"))
+
+        upgrade(engine)
+
+        with engine.connect() as connection:
+            assert connection.execute(text("SELECT publish_to_portfolio FROM company_products")).scalar() == 0
+            hero = connection.execute(text("SELECT hero_content FROM site_settings")).scalar()
+        assert json.loads(hero)["title_highlight"] == "Trusted Suppliers"
+
+    def test_build_markers_leave_platform_stats(self, engine):
+        """Markers stored as platform_stats rows move to derived_table_builds."""
+        upgrade(engine, target=4)
+        with engine.begin() as connection:
+            connection.execute(text(
+                "INSERT INTO platform_stats (name, value) VALUES ('built:category_stats', 1), ('products', 3)"
+            ))
+
+        upgrade(engine)
+
+        with engine.connect() as connection:
+            assert connection.execute(text("SELECT table_name FROM derived_table_builds")).scalars().all() == ["category_stats"]
+            assert connection.execute(text("SELECT name FROM platform_stats")).scalars().all() == ["products"]
+
+    def test_startup_check_requires_head(self, engine):
+        """Startup refuses an unmigrated or partly migrated database."""
+        with pytest.raises(SchemaOutOfDate):
+            check_schema_version(engine)
+        upgrade(engine, target=1)
+        with pytest.raises(SchemaOutOfDate):
+            check_schema_version(engine)
+        upgrade(engine)
+        assert check_schema_version(engine) == head_version()
+
+    def test_schema_lock_excludes_other_holders(self, engine):
+        """While one holder has the SQLite lockfile, another cannot take it."""
+        lock_path = engine.url.database + ".lock"
+        with schema_lock(engine):
+            with open(lock_path, "a+b") as other:
+                with pytest.raises(OSError):
+                    fcntl.flock(other.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        with open(lock_path, "a+b") as other:
+            fcntl.flock(other.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
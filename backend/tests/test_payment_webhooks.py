@@ -0,0 +1,144 @@
+"""
+Payment webhook tests for the FastAPI multi-tenant SaaS backend.
+
+Tests cover:
+- Webhooks stored and acknowledged
+- Unsigned or forged webhooks refused
+- Duplicate deliveries are no-ops
+- Subscriptions renewed once per payment
+- Failed events and retries
+"""
+
+import hashlib
+import hmac
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.subscriptions.models import CustomerSubscription
+from app.payments.models import PaymentHistory, WebhookEvent
+
+WEBHOOK_SECRET = "whsec_test"
+
+
+def _razorpay_payload(customer_user, plan, payment_id: str = "pay_test_1") -> dict:
+    return {
+        "event": "payment.captured",
+        "payload": {
+            "payment": {
+                "entity": {
+                    "id": payment_id,
+                    "order_id": "order_test_1",
+                    "amount": 99900,
+                    "currency": "INR",
+                    "status": "captured",
+                    "notes": {"customer_id": str(customer_user.id), "plan_id": str(plan.id)}
+                }
+            }
+        }
+    }
+
+
+def _post_razorpay(client: TestClient, payload: dict, headers: dict = None):
+    """Posts a webhook signed with the test secret, as Razorpay does."""
+    body = json.dumps(payload).encode()
+    signature = hmac.new(WEBHOOK_SECRET.encode(), body, hashlib.sha256).hexdigest()
+    return client.post(
+        "/payments/webhook/razorpay",
+        content=body,
+        headers={"Content-Type": "application/json", "X-Razorpay-Signature": signature, **(headers or {})}
+    )
+
+
+def _subscription(db: Session, customer_user) -> CustomerSubscription:
+    db.expire_all()
+    return db.query(CustomerSubscription).filter(
+        CustomerSubscription.tenant_id == customer_user.id
+    ).first()
+
+
+@pytest.mark.subscription
+class TestPaymentWebhooks:
+    """Test webhook intake and idempotent processing."""
+
+    @pytest.fixture(autouse=True)
+    def webhook_secret(self, monkeypatch):
+        monkeypatch.setattr(settings, "RAZORPAY_WEBHOOK_SECRET", WEBHOOK_SECRET)
+
+    def test_retried_event_renews_once(
+        self,
+        client: TestClient,
+        test_db: Session,
+        customer_user,
+        default_subscription_plan
+    ):
+        """A gateway retry of the same event is acknowledged without renewing again."""
+        end_date = _subscription(test_db, customer_user).end_date
+        payload = _razorpay_payload(customer_user, default_subscription_plan)
+
+        first = _post_razorpay(client, payload, {"X-Razorpay-Event-Id": "evt_test_1"})
+        # A replay with a made-up event id is still the same signed event
+        retry = _post_razorpay(client, payload, {"X-Razorpay-Event-Id": "evt_test_2"})
+
+        assert first.json()["status"] == "accepted"
+        assert retry.json()["status"] == "duplicate"
+        assert test_db.query(WebhookEvent).count() == 1
+        assert test_db.query(PaymentHistory).count() == 1
+
+        renewed = _subscription(test_db, customer_user)
+        assert (renewed.end_date - end_date).days == default_subscription_plan.duration_days
+
+    def test_new_event_for_known_payment_does_not_renew(
+        self,
+        client: TestClient,
+        test_db: Session,
+        customer_user,
+        default_subscription_plan
+    ):
+        """A second event for an already recorded payment leaves the subscription alone."""
+        payload = _razorpay_payload(customer_user, default_subscription_plan)
+        _post_razorpay(client, payload)
+        end_date = _subscription(test_db, customer_user).end_date
+
+        _post_razorpay(client, {**payload, "event": "payment.authorized"})
+
+        assert _subscription(test_db, customer_user).end_date == end_date
+        assert test_db.query(PaymentHistory).count() == 1
+
+    def test_invalid_metadata_marks_event_failed(self, client: TestClient, test_db: Session):
+        """Events that can never apply are acknowledged and marked FAILED."""
+        payload = {"event": "payment.captured", "payload": {"payment": {"entity": {"id": "pay_bad", "notes": {}}}}}
+
+        response = _post_razorpay(client, payload)
+        assert response.status_code == 200
+
+        test_db.expire_all()
+        event = test_db.query(WebhookEvent).one()
+        assert event.status == "FAILED"
+        assert event.last_error == "Invalid payment metadata"
+
+    def test_unhandled_event_is_ignored(self, client: TestClient, test_db: Session):
+        """Events the platform does not act on are stored as IGNORED."""
+        _post_razorpay(client, {"event": "refund.created", "payload": {}})
+
+        test_db.expire_all()
+        assert test_db.query(WebhookEvent).one().status == "IGNORED"
+
+    def test_forged_signature_is_rejected(
+        self,
+        client: TestClient,
+        test_db: Session,
+        customer_user,
+        default_subscription_plan
+    ):
+        """Unsigned or wrongly signed webhooks are refused before anything is stored."""
+        payload = _razorpay_payload(customer_user, default_subscription_plan)
+
+        unsigned = client.post("/payments/webhook/razorpay", json=payload)
+        forged = client.post("/payments/webhook/razorpay", json=payload, headers={"X-Razorpay-Signature": "0" * 64})
+
+        assert unsigned.status_code == 400
+        assert forged.status_code == 400
+        assert test_db.query(WebhookEvent).count() == 0
@@ -0,0 +1,393 @@
+"""
+Public catalog tests for the FastAPI multi-tenant SaaS backend.
+
+Tests cover:
+- Category counters maintained incrementally
+- Public category listing
+- Search facets, cached until catalog writes
+- Result totals
+- Aggregated home page
+- Platform counters
+- Column-projected list cards
+- orjson responses encoding like FastAPI
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+from app.admin.models.category_model import Category
+from app.company.models.company_blog_posts_model import CompanyBlogPost
+from app.company.models.company_products_model import CompanyProduct
+from app.company.models.company_services_model import CompanyService
+from app.services.category_stats_service import get_category_counts, rebuild_category_stats
+from app.services.platform_stats_service import _counts_cache, get_platform_counts, reconcile_platform_stats
+
+
+@pytest.fixture(scope="function")
+def categories(test_db: Session):
+    """Create two active categories."""
+    items = [
+        Category(name="Electronics", slug="electronics", display_order=1),
+        Category(name="Textiles", slug="textiles", display_order=2),
+    ]
+    test_db.add_all(items)
+    test_db.commit()
+    return items
+
+
+@pytest.mark.company
+class TestCategoryStats:
+    """Test precomputed category counters."""
+
+    def test_counts_follow_create_update_delete(
+        self,
+        client: TestClient,
+        test_db: Session,
+        customer_auth_headers,
+        categories
+    ):
+        """Counters move with product create, category change and delete."""
+        response = client.post(
+            "/customer/company/products/",
+            headers=customer_auth_headers,
+            json={"name": "Router", "category": "Electronics"}
+        )
+        product_id = response.json()["id"]
+        assert get_category_counts(test_db)["Electronics"]["product_count"] == 1
+
+        client.put(
+            f"/customer/company/products/{product_id}",
+            headers=customer_auth_headers,
+            json={"category": "Textiles"}
+        )
+        counts = get_category_counts(test_db)
+        assert counts["Electronics"]["product_count"] == 0
+        assert counts["Textiles"]["product_count"] == 1
+
+        client.delete(f"/customer/company/products/{product_id}", headers=customer_auth_headers)
+        assert get_category_counts(test_db)["Textiles"]["product_count"] == 0
+
+    def test_rebuild_matches_catalog(self, test_db: Session, customer_user, categories):
+        """A full rebuild produces the same numbers as a grouped count."""
+        test_db.add_all([
+            CompanyProduct(tenant_id=customer_user.id, name="A", slug="a", category="Electronics"),
+            CompanyProduct(tenant_id=customer_user.id, name="B", slug="b", category="Electronics"),
+            CompanyService(tenant_id=customer_user.id, title="C", slug="c", category="Electronics"),
+        ])
+        test_db.commit()
+
+        totals = rebuild_category_stats(test_db)
+        assert totals["Electronics"] == {"product_count": 2, "service_count": 1}
+
+    def test_first_read_backfills_after_listener_writes(
+        self,
+        test_db: Session,
+        customer_user,
+        categories,
+        monkeypatch
+    ):
+        """Rows the listeners never saw are counted even once the table has rows."""
+        from app.services import category_stats_service
+
+        # Written before the counters existed
+        test_db.execute(CompanyProduct.__table__.insert().values(
+            tenant_id=customer_user.id, name="Old", slug="old", category="Electronics"
+        ))
+        test_db.add(CompanyProduct(tenant_id=customer_user.id, name="New", slug="new", category="Electronics"))
+        test_db.commit()
+
+        monkeypatch.setattr(category_stats_service, "_stats_ready", False)
+        assert get_category_counts(test_db)["Electronics"]["product_count"] == 2
+
+    def test_public_categories_reads_counters(
+        self,
+        client: TestClient,
+        test_db: Session,
+        customer_user,
+        categories
+    ):
+        """Public category listing returns the stored counters."""
+        test_db.add(CompanyService(tenant_id=customer_user.id, title="Weaving", slug="weaving", category="Textiles"))
+        test_db.commit()
+
+        response = client.get("/public/categories")
+        assert response.status_code == 200
+        by_name = {c["name"]: c for c in response.json()}
+        assert by_name["Textiles"]["service_count"] == 1
+        assert by_name["Textiles"]["count"] == 1
+        assert by_name["Electronics"]["count"] == 0
+
+
+@pytest.mark.company
+class TestSearchFacets:
+    """Test facet aggregations on public search."""
+
+    def test_search_returns_facets_for_filtered_set(
+        self,
+        client: TestClient,
+        test_db: Session,
+        customer_user
+    ):
+        """Facet counts cover every match, not only the current page."""
+        test_db.add_all([
+            CompanyProduct(tenant_id=customer_user.id, name="Steel Pipe", slug="steel-pipe", category="Metals", price=500),
+            CompanyProduct(tenant_id=customer_user.id, name="Steel Rod", slug="steel-rod", category="Metals", price=25000),
+            CompanyProduct(tenant_id=customer_user.id, name="Cotton Roll", slug="cotton-roll", category="Textiles", price=800),
+        ])
+        test_db.commit()
+
+        response = client.get("/public/search", params={"q": "steel", "type": "products", "limit": 1, "facets": True})
+        assert response.status_code == 200
+        facets = response.json()["facets"]
+
+        assert facets["category"] == [{"value": "Metals", "count": 2}]
+        buckets = {b["value"]: b["count"] for b in facets["price"]}
+        assert buckets["0-1000"] == 1
+        assert buckets["10000-50000"] == 1
+
+    def test_cached_facets_follow_catalog_writes(
+        self,
+        client: TestClient,
+        customer_auth_headers
+    ):
+        """Facets of an empty search are cached until a product write commits."""
+        from app.services.search_facets_service import invalidate_facet_cache
+
+        invalidate_facet_cache()
+        params = {"type": "products", "facets": True}
+        before = client.get("/public/search", params=params).json()["facets"]["category"]
+        assert {"value": "Tools", "count": 1} not in before
+
+        client.post("/customer/company/products/", headers=customer_auth_headers, json={"name": "Drill", "category": "Tools"})
+        after = client.get("/public/search", params=params).json()["facets"]["category"]
+        assert {"value": "Tools", "count": 1} in after
+
+        client.post("/customer/company/products/bulk", headers=customer_auth_headers, json={"items": [{"name": "Saw", "category": "Tools"}]})
+        after = client.get("/public/search", params=params).json()["facets"]["category"]
+        assert {"value": "Tools", "count": 2} in after
+
+    def test_search_without_facets_flag_omits_facets(self, client: TestClient):
+        """Facets are opt-in."""
+        response = client.get("/public/search", params={"q": "anything"})
+        assert response.status_code == 200
+        assert "facets" not in response.json()
+
+
+@pytest.mark.company
+class TestResultTotals:
+    """Test result totals on search and listings."""
+
+    def test_search_total_counts_all_matches(
+        self,
+        client: TestClient,
+        test_db: Session,
+        customer_user
+    ):
+        """Search total covers the whole filtered set, not the page size."""
+        test_db.add_all([
+            CompanyProduct(tenant_id=customer_user.id, name=f"Valve {i}", slug=f"valve-{i}", price=100.0)
+            for i in range(5)
+        ])
+        test_db.commit()
+
+        response = client.get("/public/search", params={"q": "valve", "type": "products", "limit": 2})
+        data = response.json()
+        assert len(data["results"]) == 2
+        assert data["total"] == 5
+        assert data["total_exact"] is True
+        assert data["totals"] == {"products": 5}
+
+    def test_listing_reports_total_header(
+        self,
+        client: TestClient,
+        test_db: Session,
+        customer_user
+    ):
+        """List endpoints keep their body and expose the total in headers."""
+        test_db.add_all([
+            CompanyProduct(tenant_id=customer_user.id, name=f"Bolt {i}", slug=f"bolt-{i}")
+            for i in range(3)
+        ])
+        test_db.commit()
+
+        response = client.get("/public/products", params={"limit": 1})
+        assert len(response.json()) == 1
+        assert response.headers["X-Total-Count"] == "3"
+        assert response.headers["X-Total-Exact"] == "true"
+
+        # A short last page gives the total; a page past the end reports the offset as a bound
+        response = client.get("/public/products", params={"skip": 2, "limit": 5})
+        assert response.headers["X-Total-Count"] == "3"
+        assert response.headers["X-Total-Exact"] == "true"
+        response = client.get("/public/products", params={"skip": 10, "limit": 5})
+        assert response.json() == []
+        assert response.headers["X-Total-Count"] == "10"
+        assert response.headers["X-Total-Exact"] == "false"
+
+
+@pytest.mark.company
+class TestHomePage:
+    """Test the aggregated landing page endpoint."""
+
+    def test_home_returns_all_sections(
+        self,
+        client: TestClient,
+        test_db: Session,
+        customer_user,
+        monkeypatch
+    ):
+        """One request carries every landing page section."""
+        from sqlalchemy.orm import sessionmaker
+        from app.database import connection
+        from app.routes.public_routes import _home_cache
+        _home_cache.invalidate()
+        # Sections open their own sessions from the application's factory
+        monkeypatch.setattr(connection, "SessionLocal", sessionmaker(bind=test_db.get_bind()))
+
+        test_db.add(CompanyProduct(tenant_id=customer_user.id, name="Lathe", slug="lathe"))
+        test_db.commit()
+
+        response = client.get("/public/home")
+        assert response.status_code == 200
+        data = response.json()
+        assert set(data) == {"stats", "categories", "businesses", "products", "services", "site_settings"}
+        assert [p["name"] for p in data["products"]] == ["Lathe"]
+
+    def test_concurrent_misses_share_one_load(self):
+        """Callers arriving during a load await it instead of starting their own."""
+        import asyncio
+        from app.utils.cache import StaleWhileRevalidateCache
+
+        cache = StaleWhileRevalidateCache(ttl_seconds=30, stale_seconds=300)
+        calls = []
+
+        async def loader():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {"sections": len(calls)}
+
+        async def main():
+            return await asyncio.gather(*[cache.get_or_load("home", loader) for _ in range(5)])
+
+        assert asyncio.run(main()) == [{"sections": 1}] * 5
+        assert len(calls) == 1
+
+
+@pytest.mark.company
+class TestPlatformStats:
+    """Test stored platform counters."""
+
+    def test_counters_follow_create_and_delete(self, test_db: Session, customer_user):
+        """Inserts and deletes adjust the stored counters."""
+        reconcile_platform_stats(test_db)
+        before = get_platform_counts(test_db)["products"]
+
+        product = CompanyProduct(tenant_id=customer_user.id, name="Drill", slug="drill")
+        test_db.add(product)
+        test_db.commit()
+        _counts_cache.invalidate()
+        assert get_platform_counts(test_db)["products"] == before + 1
+
+        test_db.delete(product)
+        test_db.commit()
+        _counts_cache.invalidate()
+        assert get_platform_counts(test_db)["products"] == before
+
+    def test_reconcile_fixes_drift(self, test_db: Session, customer_user):
+        """Bulk deletes bypass the counters until the next reconcile."""
+        test_db.add(CompanyProduct(tenant_id=customer_user.id, name="Saw", slug="saw"))
+        test_db.commit()
+        test_db.query(CompanyProduct).delete()
+        test_db.commit()
+
+        assert reconcile_platform_stats(test_db)["products"] == 0
+        assert get_platform_counts(test_db)["products"] == 0
+
+
+@pytest.mark.company
+class TestPublicListCards:
+    """Test that public list endpoints load only their card columns."""
+
+    def test_product_cards_skip_detail_columns(
+        self,
+        client: TestClient,
+        test_db: Session,
+        customer_user
+    ):
+        """The list query never selects descriptions, specifications or galleries."""
+        from sqlalchemy import event
+
+        test_db.add(CompanyProduct(
+            tenant_id=customer_user.id, name="Pump", slug="pump", price=900.0,
+            short_description="Compact", full_description="Long " * 500,
+            specifications={"flow": "10 l/min"}, gallery_images=["a.png", "b.png"]
+        ))
+        test_db.commit()
+
+        statements = []
+        engine = test_db.get_bind()
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            response = client.get("/public/products")
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+
+        assert response.status_code == 200
+        card = response.json()[0]
+        assert card["name"] == "Pump" and card["description"] == "Compact" and card["price_raw"] == 900.0
+        product_selects = [s for s in statements if "FROM company_products" in s]
+        assert product_selects
+        for column in ("full_description", "specifications", "gallery_images"):
+            assert not any(column in s for s in product_selects)
+
+    def test_blog_cards_include_author(
+        self,
+        client: TestClient,
+        test_db: Session,
+        customer_user
+    ):
+        """Published posts list with their author and business."""
+        from datetime import datetime, timezone
+
+        test_db.add(CompanyBlogPost(
+            tenant_id=customer_user.id, title="Launch", slug="launch", content="Body",
+            author="Editor", status="published", published_at=datetime.now(timezone.utc)
+        ))
+        test_db.commit()
+
+        response = client.get("/public/blogs")
+        assert response.status_code == 200
+        assert response.json()[0]["author"] == "Editor"
+        assert response.headers["X-Total-Count"] == "1"
+
+
+class TestIndexCheck:
+    """Test the startup report of declared but missing indexes."""
+
+    def test_reports_dropped_index(self, test_db: Session):
+        """A fresh schema has every index; a dropped one is reported by name."""
+        from sqlalchemy import text
+        from app.database.index_check import missing_indexes
+
+        engine = test_db.get_bind()
+        assert missing_indexes(engine) == []
+
+        test_db.execute(text("DROP INDEX ix_company_services_active_created_at"))
+        test_db.commit()
+        assert missing_indexes(engine) == [("company_services", "ix_company_services_active_created_at")]
+
+
+class TestORJSONResponse:
+    """Test the default response class against FastAPI's encoding."""
+
+    def test_decimal_matches_jsonable_encoder(self):
+        """Integral Decimals stay ints, others become floats."""
+        import json
+        from decimal import Decimal
+        from fastapi.encoders import jsonable_encoder
+        from app.utils.responses import ORJSONResponse
+
+        content = {"whole": Decimal("100"), "fraction": Decimal("2.50")}
+        assert ORJSONResponse(content).body == b'{"whole":100,"fraction":2.5}'
+        assert json.loads(ORJSONResponse(content).body) == jsonable_encoder(content)
@@ -0,0 +1,25 @@
+"""
+Startup tests for the FastAPI multi-tenant SaaS backend.
+
+Tests cover:
+- Payment SDKs stay out of the import path
+"""
+
+import os
+import subprocess
+import sys
+
+from profile_startup import BACKEND_DIR, DEFERRED_MODULES
+
+
+class TestStartup:
+    """Test what booting the app loads."""
+
+    def test_payment_sdks_not_imported_at_boot(self, tmp_path):
+        """stripe and razorpay load on first payment use, not with app.main."""
+        env = dict(os.environ, DATABASE_URL=f"sqlite:///{tmp_path / 'boot.db'}")
+        process = subprocess.run(
+            [sys.executable, "-c", f"import sys, app.main; print([m for m in {DEFERRED_MODULES!r} if m in sys.modules])"],
+            cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True
+        )
+        assert process.stdout.strip().splitlines()[-1] == "[]"
@@ -214,6 +214,37 @@ class TestCustomerSubscriptions:
         assert customer_user.id in tenant_ids
         assert customer_user_2.id in tenant_ids
     
+    def test_admin_subscription_listing_filters_and_pages(
+        self, 
+        client: TestClient, 
+        auth_headers,
+        customer_user,
+        customer_user_2,
+        expired_customer_user
+    ):
+        """Listing filters by status server-side and pages by cursor."""
+        response = client.get(
+            "/admin/subscriptions/customers",
+            headers=auth_headers,
+            params={"status": "active", "limit": 1}
+        )
+        assert response.status_code == 200
+        assert response.headers["X-Total-Count"] == "2"
+        first_page = response.json()
+        assert len(first_page) == 1
+        assert first_page[0]["status"] == "ACTIVE"
+        assert first_page[0]["days_remaining"] > 0
+        assert first_page[0]["customer_email"] is not None
+        
+        response = client.get(
+            "/admin/subscriptions/customers",
+            headers=auth_headers,
+            params={"status": "active", "limit": 1, "cursor": response.headers["X-Next-Cursor"]}
+        )
+        second_page = response.json()
+        assert len(second_page) == 1
+        assert second_page[0]["id"] < first_page[0]["id"]
+    
     def test_admin_can_cancel_customer_subscription(
         self, 
         client: TestClient, 
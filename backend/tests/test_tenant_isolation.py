@@ -381,6 +381,60 @@ class TestTenantContextClearing:
         assert data3["tenant_id"] == customer_user.id
 
 
+def _context_probe() -> TestClient:
+    """A bare app behind TenantMiddleware that echoes the tenant context."""
+    from fastapi import FastAPI
+    from app.tenants.context import TenantContext
+    from app.tenants.middleware import TenantMiddleware
+
+    probe = FastAPI()
+    probe.add_middleware(TenantMiddleware)
+
+    @probe.get("/customer/probe")
+    def read_context():
+        return {"tenant_id": TenantContext.get_tenant_id(), "is_admin": TenantContext.is_admin()}
+
+    return TestClient(probe)
+
+
+@pytest.mark.tenant
+class TestTenantMiddleware:
+    """Test tenant context set from token claims."""
+
+    def test_customer_context_from_claims_without_query(
+        self,
+        test_db: Session,
+        customer_auth_headers,
+        customer_user,
+        monkeypatch
+    ):
+        """A customer token sets the tenant id; version and revocation checks hit memory only."""
+        from app.auth.token_revocation import rebuild_revocation_filter
+        from app.tenants import middleware
+
+        rebuild_revocation_filter(test_db)
+
+        def no_session():
+            raise AssertionError("TenantMiddleware queried the database")
+
+        # Login cached the token version, so the middleware needs no session
+        monkeypatch.setattr(middleware, "SessionLocal", no_session)
+        response = _context_probe().get("/customer/probe", headers=customer_auth_headers)
+        assert response.json() == {"tenant_id": customer_user.id, "is_admin": False}
+
+    def test_admin_context_from_claims(self, auth_headers):
+        """An admin token sets the admin flag instead of a tenant."""
+        response = _context_probe().get("/customer/probe", headers=auth_headers)
+        assert response.json() == {"tenant_id": None, "is_admin": True}
+
+    def test_logged_out_token_sets_no_context(self, client: TestClient, customer_auth_headers):
+        """A revoked token is rejected by the middleware as well."""
+        assert client.post("/auth/logout", headers=customer_auth_headers).status_code == 200
+
+        response = _context_probe().get("/customer/probe", headers=customer_auth_headers)
+        assert response.json() == {"tenant_id": None, "is_admin": False}
+
+
 @pytest.mark.tenant
 class TestTenantIsolationEdgeCases:
     """Test edge cases in tenant isolation."""
@@ -0,0 +1,89 @@
+"""
+Local mock payment gateway for tests.
+
+Runs a threaded HTTP server on 127.0.0.1 that answers PhonePe-style
+/pg/v1/pay and /pg/v1/status requests. Tests can add latency or force
+error responses, and inspect how many requests and TCP connections
+the server saw (to check keep-alive reuse).
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional
+
+
+class MockGatewayServer:
+    """Context manager: `with MockGatewayServer() as gateway: gateway.url`."""
+
+    def __init__(self):
+        self.delay = 0.0
+        self.fail_status: Optional[int] = None
+        self.requests: List[str] = []
+        self.connections = 0
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+
+    def _handler(self):
+        gateway = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive
+
+            def setup(self):
+                super().setup()
+                gateway.connections += 1
+
+            def log_message(self, format, *args):
+                pass
+
+            def _reply(self, status: int, body: dict):
+                data = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _handle(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                if length:
+                    self.rfile.read(length)
+                gateway.requests.append(f"{self.command} {self.path}")
+
+                if gateway.delay:
+                    time.sleep(gateway.delay)
+                if gateway.fail_status:
+                    self._reply(gateway.fail_status, {"success": False, "message": "mock failure"})
+                    return
+
+                if self.path.startswith("/pg/v1/pay"):
+                    self._reply(200, {
+                        "success": True,
+                        "code": "PAYMENT_INITIATED",
+                        "data": {"instrumentResponse": {"redirectInfo": {"url": "https://mock.pay/redirect"}}}
+                    })
+                elif self.path.startswith("/pg/v1/status"):
+                    self._reply(200, {"success": True, "code": "PAYMENT_SUCCESS", "data": {}})
+                else:
+                    self._reply(404, {"success": False, "message": "not found"})
+
+            do_GET = _handle
+            do_POST = _handle
+
+        return Handler
+
+    def __enter__(self) -> "MockGatewayServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()